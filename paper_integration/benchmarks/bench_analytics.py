@@ -0,0 +1,99 @@
+"""집계/시각화 보고서 벤치마크
+
+키워드가 지프 분포를 따르는 합성 논문 --papers개를 CSV와 기본 형식으로
+저장하고, 기존 방식(그래프마다 CSV 전체를 다시 읽고 Counter로 키워드
+집계)과 한 번의 벡터 연산 집계, 버전별 캐시 재사용, 병렬 그래프 생성
+시간을 비교합니다.
+
+    python benchmarks/bench_analytics.py --papers 200000
+"""
+import argparse
+import itertools
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from bench_dataset import make_papers  # noqa: E402
+from paper_analytics import load_analytics  # noqa: E402
+from papers_dataset import save_papers  # noqa: E402
+from visualize_papers import visualize_report  # noqa: E402
+
+def add_keywords(df, vocabulary=5000):
+    """논문마다 3~8개의 키워드 (빈도는 지프 분포)"""
+    rng = np.random.default_rng(7)
+    words = np.array([f'topic {i}' for i in range(vocabulary)])
+    ranks = np.minimum(rng.zipf(1.3, size=len(df) * 8), vocabulary) - 1
+    sizes = rng.integers(3, 9, len(df))
+    picks = iter(words[ranks])
+    df['keywords'] = pd.array(['; '.join(itertools.islice(picks, size)) for size in sizes], dtype='string')
+    return df
+
+def legacy_report(csv_path):
+    """기존 방식 재현: 그래프 6개마다 CSV를 읽고 집계 (키워드는 Counter)"""
+    results = []
+    for chart in ('year', 'year_source', 'source', 'venue', 'keyword', 'cooccurrence'):
+        df = pd.read_csv(csv_path)
+        if chart == 'year':
+            results.append(df['year'].value_counts().sort_index())
+        elif chart == 'year_source':
+            results.append(pd.crosstab(df['year'], df['source']))
+        elif chart == 'source':
+            results.append(df['source'].value_counts())
+        elif chart == 'venue':
+            results.append(df['publication'].value_counts())
+        else:
+            counts = Counter()
+            for keywords in df['keywords'].dropna():
+                terms = list(dict.fromkeys(k.strip().lower() for k in keywords.split(';') if k.strip()))
+                if chart == 'keyword':
+                    counts.update(terms)
+                else:
+                    counts.update(itertools.combinations(sorted(terms), 2))
+            results.append(counts)
+    return results
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=200000)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    # 한글 글꼴이 없는 환경의 글리프 경고는 무시
+    warnings.filterwarnings('ignore', message='Glyph')
+
+    papers = add_keywords(make_papers(args.papers))
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = save_papers(papers, os.path.join(tmp, 'csv'), 'csv')
+        output_dir = os.path.join(tmp, 'output')
+        save_papers(papers, output_dir)
+
+        legacy, (*_, pairs) = timed(lambda: legacy_report(csv_path))
+        computed, analytics = timed(lambda: load_analytics(output_dir))
+        cached, _ = timed(lambda: load_analytics(output_dir))
+        rendered, paths = timed(lambda: visualize_report(output_dir, args.workers))
+
+    (first, second), count = pairs.most_common(1)[0]
+    print(f"논문 {args.papers}개, 키워드 {len(analytics.keyword_counts)}개, "
+          f"동시 출현 쌍 {analytics.cooccurrence.nnz // 2}개, CPU {os.cpu_count()}개")
+    print(f"기존 (그래프마다 CSV 읽기 + Counter 집계): {legacy:.2f}s")
+    print(f"한 번에 집계: {computed:.2f}s ({legacy / computed:.1f}x), 캐시 재사용: {cached * 1000:.1f}ms")
+    print(f"보고서 전체 (캐시된 집계 + 그래프 {len(paths)}개 병렬 생성): {rendered:.2f}s")
+    print(f"최다 동시 출현 쌍 일치: "
+          f"{analytics.cooccurrence.top_pairs(1)[0] == (*sorted((first, second)), count)}")
+
+if __name__ == "__main__":
+    main()
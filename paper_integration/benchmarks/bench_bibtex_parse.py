@@ -0,0 +1,136 @@
+"""BibTeX 변환 벤치마크
+
+합성 .bib 파일을 만들어 기존 정규식 방식과 스트리밍 토크나이저의
+처리 시간을 비교하고, 두 방식의 레코드가 같은지 확인합니다.
+
+    python benchmarks/bench_bibtex_parse.py --entries 50000
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import convert_bib_to_csv  # noqa: E402
+from convert_bib_to_csv import clean_bibtex_value, process_bibtex_file  # noqa: E402
+
+def legacy_extract_field_value(content, field_name):
+    """기존 필드 추출 함수 (비교용)"""
+    pattern = rf'{field_name}\s*=\s*(?:{{((?:[^{{}}]|{{[^{{}}]*}})*?)}}|"([^"]*)"|((?:[^,}}]|}}(?!,))*)),?'
+    match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    if match:
+        value = next(v for v in match.groups() if v is not None)
+        return clean_bibtex_value(value)
+    return None
+
+def legacy_process_bibtex_file(file_path):
+    """기존 BibTeX 처리 함수 (비교용)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    content = re.sub(r'%.*$', '', content, flags=re.MULTILINE)
+
+    records = []
+    entries = re.split(r'@(\w+)\s*{', content)[1:]
+
+    for i in range(0, len(entries), 2):
+        if i + 1 >= len(entries):
+            break
+
+        record_type = entries[i].lower()
+        entry_content = entries[i + 1]
+        cite_key = entry_content.split(',', 1)[0].strip()
+        record = {'type': record_type, 'cite_key': cite_key}
+
+        important_fields = ['title', 'author', 'year', 'booktitle', 'journal',
+                            'publisher', 'address', 'pages', 'doi', 'url',
+                            'abstract', 'keywords', 'document_type']
+
+        for field in important_fields:
+            value = legacy_extract_field_value(entry_content, field)
+            if value:
+                record[field] = value
+
+        if 'type' in record:
+            record['document_type'] = record['type']
+            del record['type']
+
+        other_fields = re.findall(r'(\w+)\s*=\s*({[^}]*}|"[^"]*"|[^,}]+),?', entry_content)
+        for key, value in other_fields:
+            key = key.strip().lower()
+            if key not in important_fields and key not in record:
+                value = clean_bibtex_value(value)
+                if value:
+                    record[key] = value
+
+        records.append(record)
+
+    return records
+
+def write_synthetic_bib(path, entries):
+    """ACM 내보내기 형식을 흉내 낸 합성 BibTeX 파일 생성"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('% synthetic ACM export\n\n')
+        for i in range(entries):
+            f.write(
+                f"@inproceedings{{10.1145/{i}.{i * 7},\n"
+                f"author = {{M\\\"{{u}}ller, Hans and Garc\\'{{i}}a, Ana and Author {i}}},\n"
+                f"title = {{Scalable {{Cloud}} Systems Part {i}: A Study}},\n"
+                f"year = {{{2000 + i % 25}}},\n"
+                f"isbn = {{978-1-4503-{i:04d}-1}},\n"
+                f"publisher = {{Association for Computing Machinery}},\n"
+                f"address = {{New York, NY, USA}},\n"
+                f"url = {{https://doi.org/10.1145/{i}.{i * 7}}},\n"
+                f"doi = {{10.1145/{i}.{i * 7}}},\n"
+                f"abstract = {{We study scalable systems. " + "This sentence pads the abstract. " * 20 + "},\n"
+                f"booktitle = {{Proceedings of the {i % 40}th Conference}},\n"
+                f"pages = {{{i % 90}--{i % 90 + 12}}},\n"
+                f"numpages = {{12}},\n"
+                f"keywords = {{cloud, scalability, caf\\'{{e}}}},\n"
+                f"location = {{Seoul, Korea}},\n"
+                f"series = {{CONF '{i % 25:02d}}}\n"
+                f"}}\n\n"
+            )
+
+def time_both(path):
+    """기존 방식과 스트리밍 방식의 (시간, 레코드)를 측정"""
+    start = time.perf_counter()
+    legacy = legacy_process_bibtex_file(path)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed = process_bibtex_file(path)
+    stream_time = time.perf_counter() - start
+    return legacy_time, stream_time, legacy == streamed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic.bib')
+        write_synthetic_bib(path, args.entries)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"엔트리 수: {args.entries}, 파일 크기: {size_mb:.1f} MB")
+
+        legacy_time, stream_time, same = time_both(path)
+        print(f"[전체 변환] 기존: {legacy_time:.2f}s, "
+              f"스트리밍: {stream_time:.2f}s ({legacy_time / stream_time:.1f}x), 레코드 일치: {same}")
+
+        # 값 정제를 제외한 토크나이징 비용만 비교
+        global clean_bibtex_value
+        original_clean = clean_bibtex_value
+        clean_bibtex_value = convert_bib_to_csv.clean_bibtex_value = lambda value: value
+        try:
+            legacy_time, stream_time, _ = time_both(path)
+        finally:
+            clean_bibtex_value = convert_bib_to_csv.clean_bibtex_value = original_clean
+        print(f"[토크나이징만] 기존: {legacy_time:.2f}s, "
+              f"스트리밍: {stream_time:.2f}s ({legacy_time / stream_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""데이터셋 저장 형식 벤치마크
+
+통합 데이터셋과 같은 컬럼의 합성 논문 --rows개를 csv, parquet,
+feather로 저장하고, 기존 방식(최신 CSV 전체 읽기)과 컬럼 투영
+읽기(visualize_papers: year, 다운로더: title/year/source/doi/url)의
+시간을 비교합니다.
+
+    python benchmarks/bench_dataset.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from integrate_papers import apply_types  # noqa: E402
+from papers_dataset import DOWNLOAD_COLUMNS, read_papers, save_papers  # noqa: E402
+
+def make_papers(rows):
+    """초록/키워드 같은 큰 텍스트 컬럼을 포함한 합성 통합 데이터셋"""
+    rng = np.random.default_rng(42)
+    index = np.arange(rows).astype(str)
+    df = pd.DataFrame({
+        'author': 'Kim, J. and Lee, S. and Author ' + pd.Series(index),
+        'title': 'Paper number ' + pd.Series(index) + ' on scalable systems',
+        'year': rng.integers(1990, 2025, rows).astype(str),
+        'abstract': 'This paper studies scalable systems in depth. ' * 25,
+        'doi': '10.1000/bench.' + pd.Series(index),
+        'keywords': 'cloud; scalability; distributed systems',
+        'publication': 'Journal ' + pd.Series((np.arange(rows) % 300).astype(str)),
+        'publisher': 'Elsevier',
+        'url': 'https://example.org/paper/' + pd.Series(index),
+        'source': np.where(np.arange(rows) % 2, 'scopus', 'ieee'),
+    })
+    return apply_types(df)
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500000)
+    args = parser.parse_args()
+
+    papers = make_papers(args.rows)
+    print(f"논문 {args.rows}개")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in ('csv', 'parquet', 'feather'):
+            output_dir = os.path.join(tmp, fmt)
+            write_time, path = timed(lambda: save_papers(papers, output_dir, fmt))
+            size = os.path.getsize(path) / 1024 / 1024
+            full, _ = timed(lambda: read_papers(output_dir))
+            year, _ = timed(lambda: read_papers(output_dir, columns=['year']))
+            download, _ = timed(lambda: read_papers(output_dir, columns=DOWNLOAD_COLUMNS))
+            print(f"{fmt:8s} 쓰기 {write_time:5.2f}s, {size:6.1f}MB | 전체 읽기 {full:5.2f}s | "
+                  f"year만 {year:5.2f}s | 다운로더 컬럼 {download:5.2f}s")
+
+if __name__ == "__main__":
+    main()
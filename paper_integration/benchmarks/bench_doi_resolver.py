@@ -0,0 +1,92 @@
+"""DOI 해석기 벤치마크
+
+로컬 가짜 doi.org(리다이렉트 서버)와 출판사 서버를 띄우고
+순차/동시 해석 시간과 캐시 재사용 시간을 측정합니다. 출판사 서버는
+고정 규칙이 없는 호스트라 첫 논문에서 PDF URL 규칙을 배웁니다.
+
+    python benchmarks/bench_doi_resolver.py --dois 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from doi_resolver import DOIResolver  # noqa: E402
+
+LATENCY = 0.02
+publisher_port = None
+
+class DOIHandler(BaseHTTPRequestHandler):
+    """/10.9999/N -> 출판사 랜딩 페이지로 리다이렉트"""
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        paper_id = self.path.rsplit('/', 1)[1]
+        self.send_response(302)
+        self.send_header('Location', f'http://127.0.0.1:{publisher_port}/article/view/{paper_id}')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+class PublisherHandler(BaseHTTPRequestHandler):
+    """citation_pdf_url 메타 태그가 있는 랜딩 페이지"""
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        paper_id = self.path.rsplit('/', 1)[1]
+        body = (f'<html><head><meta name="citation_pdf_url" '
+                f'content="/article/download/{paper_id}.pdf"></head></html>').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server(handler):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_port
+
+def timed_resolve(cache_path, dois, base_url, max_workers):
+    resolver = DOIResolver(cache_path, base_url=base_url, max_workers=max_workers)
+    start = time.perf_counter()
+    results = resolver.resolve_many(dois)
+    elapsed = time.perf_counter() - start
+    resolver.close()
+    return elapsed, results
+
+def main():
+    global publisher_port
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dois', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    publisher_port = start_server(PublisherHandler)
+    base_url = f'http://127.0.0.1:{start_server(DOIHandler)}/'
+    dois = [f'10.9999/{i}' for i in range(args.dois)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential, _ = timed_resolve(os.path.join(tmp, 'seq.sqlite'), dois, base_url, 1)
+        cache_path = os.path.join(tmp, 'cache.sqlite')
+        concurrent, results = timed_resolve(cache_path, dois, base_url, args.workers)
+        cached, _ = timed_resolve(cache_path, dois, base_url, args.workers)
+
+    expected = f'http://127.0.0.1:{publisher_port}/article/download/{args.dois - 1}.pdf'
+    print(f"DOI {args.dois}개")
+    print(f"순차 해석: {sequential:.2f}s")
+    print(f"동시 해석 (workers={args.workers}): {concurrent:.2f}s ({sequential / concurrent:.1f}x)")
+    print(f"캐시 재사용: {cached * 1000:.1f}ms")
+    print(f"PDF URL 확인: {results[dois[-1]][1] == expected}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""동시 다운로드 벤치마크
+
+로컬 HTTP 서버 여러 개(포트마다 다른 호스트로 취급)를 띄우고
+max_workers=1(순차)과 동시 다운로드 모드의 처리 시간을 비교합니다.
+서버별 요청 간격도 측정해 호스트별 속도 제한이 지켜지는지 확인합니다.
+
+    python benchmarks/bench_download.py --hosts 8 --papers 80
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paper_downloader import PaperDownloader  # noqa: E402
+
+PDF_BODY = b'%PDF-1.4\n' + b'0' * 200_000 + b'\n%%EOF\n'
+LATENCY = 0.05
+
+request_times = defaultdict(list)
+
+class PDFHandler(BaseHTTPRequestHandler):
+    """모든 경로에 같은 PDF를 느리게 돌려주는 테스트 서버"""
+
+    def do_GET(self):
+        request_times[self.server.server_port].append(time.monotonic())
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(PDF_BODY)))
+        self.end_headers()
+        self.wfile.write(PDF_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+class LegacyDownloader(PaperDownloader):
+    """기존 동작 재현: 논문마다 순차 다운로드 후 delay초 대기"""
+
+    def _download_job(self, job):
+        result = super()._download_job(job)
+        time.sleep(self.config['delay'])
+        return result
+
+def start_servers(count):
+    """로컬 HTTP 서버 count개를 띄우고 포트 목록 반환"""
+    ports = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PDFHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ports.append(server.server_port)
+    return ports
+
+def run(workdir, ports, papers, max_workers, delay, downloader_class=PaperDownloader):
+    """papers개 논문을 max_workers로 다운로드하는 데 걸린 시간"""
+    os.makedirs(os.path.join(workdir, 'output'), exist_ok=True)
+    config = {
+        'source_dir': 'source', 'output_dir': 'output',
+        'download_dir': f'downloads_{downloader_class.__name__}_{max_workers}',
+        'timeout': 10, 'retry_count': 1, 'delay': delay,
+        'max_workers': max_workers, 'host_burst': 1,
+        'manifest_path': os.path.join(workdir, f'manifest_{downloader_class.__name__}_{max_workers}.sqlite'),
+    }
+    with open(os.path.join(workdir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+    papers_df = pd.DataFrame({
+        'title': [f'Paper {i}' for i in range(papers)],
+        'year': [2024] * papers,
+        'doi': [None] * papers,
+        'url': [f'http://127.0.0.1:{ports[i % len(ports)]}/paper{i}.pdf' for i in range(papers)],
+    })
+    papers_file = os.path.join(workdir, 'output', 'papers.csv')
+    papers_df.to_csv(papers_file, index=False)
+
+    request_times.clear()
+    downloader = downloader_class(os.path.join(workdir, 'config.json'))
+    start = time.perf_counter()
+    downloader.download_papers(papers_file)
+    return time.perf_counter() - start
+
+def min_gap(times):
+    """같은 호스트에 대한 요청 사이 최소 간격"""
+    times = sorted(times)
+    return min((b - a for a, b in zip(times, times[1:])), default=float('inf'))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=8)
+    parser.add_argument('--papers', type=int, default=80)
+    parser.add_argument('--delay', type=float, default=0.2)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    ports = start_servers(args.hosts)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        legacy = run(tmp, ports, args.papers, 1, args.delay, LegacyDownloader)
+        sequential = run(tmp, ports, args.papers, 1, args.delay)
+        concurrent = run(tmp, ports, args.papers, args.workers, args.delay)
+        gaps = [min_gap(times) for times in request_times.values()]
+        # 같은 설정으로 다시 실행하면 매니페스트만 보고 모두 건너뜀
+        rerun = run(tmp, ports, args.papers, args.workers, args.delay)
+        os.chdir('/')
+
+    print(f"호스트 {args.hosts}개, 논문 {args.papers}개, 호스트별 간격 {args.delay}s")
+    print(f"기존 (논문마다 대기): {legacy:.2f}s")
+    print(f"순차 (max_workers=1): {sequential:.2f}s ({legacy / sequential:.1f}x)")
+    print(f"동시 (max_workers={args.workers}): {concurrent:.2f}s ({legacy / concurrent:.1f}x)")
+    print(f"호스트별 최소 요청 간격: {min(gaps):.3f}s")
+    print(f"재실행 (매니페스트로 건너뜀): {rerun:.2f}s, 요청 {sum(map(len, request_times.values()))}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""공저/인용 그래프 벤치마크
+
+저자 수가 지프 분포를 따르는 합성 논문 --papers개로 공저 그래프를,
+논문마다 앞선 논문 몇 개를 DOI로 인용하는 참고문헌으로 인용 그래프를
+만들고 차수, 연결 요소, PageRank 시간과 메모리를 측정합니다. 기존에
+흔히 쓰는 방식(저자 이름 문자열 키의 dict 인접 리스트 + 순수 파이썬
+BFS/PageRank)은 --legacy-papers개로 비교합니다.
+
+    python benchmarks/bench_graph.py --papers 300000 --legacy-papers 50000
+"""
+import argparse
+import itertools
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paper_graph import citation_graph, coauthor_graph, split_authors  # noqa: E402
+
+def make_papers(papers, authors=None, seed=3):
+    """저자 문자열(BibTeX ' and '와 Scopus ';' 형식 혼합)과 참고문헌이 있는 논문
+
+    참고문헌은 논문마다 5개이고, 그중 세 번째는 DOI 없이 제목으로만 적습니다.
+    """
+    rng = np.random.default_rng(seed)
+    authors = authors or papers // 3
+    names = np.array([f'Author{i}, {chr(65 + i % 26)}.' for i in range(authors)])
+    picks = iter(names[np.minimum(rng.zipf(1.2, size=papers * 8), authors) - 1])
+    sizes = rng.integers(2, 9, papers)
+    author_strings = [(' and ' if i % 2 else '; ').join(itertools.islice(picks, size))
+                      for i, size in enumerate(sizes)]
+
+    cited = rng.integers(0, np.maximum(np.arange(papers), 1)[:, None], (papers, 5))
+    references = ['; '.join(f'Ref {j}, Synthetic paper {j} on graphs, Journal' if k == 2 else
+                            f'Ref {j}, Journal, doi:10.1000/p{j}' for k, j in enumerate(row))
+                  for row in cited]
+    return pd.DataFrame({
+        'title': [f'Synthetic paper {i} on graphs' for i in range(papers)],
+        'author': author_strings,
+        'doi': [f'10.1000/p{i}' for i in range(papers)],
+        'references': references,
+    })
+
+def expected_citations(papers):
+    """make_papers의 참고문헌으로 만들어야 할 (인용하는 논문, 인용된 논문) 쌍 수 (자기 인용 제외)"""
+    pairs = {(i, int(ref.split(',')[0][4:])) for i, refs in enumerate(papers['references'])
+             for ref in refs.split('; ')}
+    return sum(i != j for i, j in pairs)
+
+def legacy_analysis(authors):
+    """dict-of-str 인접 리스트 + 파이썬 BFS 연결 요소 + 파이썬 PageRank"""
+    graph = defaultdict(lambda: defaultdict(int))
+    for value in authors:
+        names = [name.strip() for part in value.split(' and ') for name in part.split(';') if name.strip()]
+        for a, b in itertools.combinations(dict.fromkeys(names), 2):
+            graph[a][b] += 1
+            graph[b][a] += 1
+    degree = {node: len(neighbors) for node, neighbors in graph.items()}
+
+    component, count = {}, 0
+    for start in graph:
+        if start in component:
+            continue
+        component[start] = count
+        queue = deque([start])
+        while queue:
+            for neighbor in graph[queue.popleft()]:
+                if neighbor not in component:
+                    component[neighbor] = count
+                    queue.append(neighbor)
+        count += 1
+
+    rank = {node: 1 / len(graph) for node in graph}
+    strength = {node: sum(neighbors.values()) for node, neighbors in graph.items()}
+    for _ in range(30):
+        new_rank = {node: 0.15 / len(graph) for node in graph}
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                new_rank[neighbor] += 0.85 * rank[node] * weight / strength[node]
+        rank = new_rank
+    return degree, count, rank
+
+def csr_analysis(authors):
+    graph = coauthor_graph(authors)
+    return graph, graph.degree(), graph.components(), graph.pagerank(max_iter=30, tol=0)
+
+def measure(func, *args, memory=False):
+    """(시간, 최대 메모리 MB, 결과) (memory면 tracemalloc으로 한 번 더 실행)"""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if memory:
+        tracemalloc.start()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=300000)
+    parser.add_argument('--legacy-papers', type=int, default=50000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    small = make_papers(args.legacy_papers)
+    legacy_time, legacy_peak, (_, legacy_components, _) = measure(legacy_analysis, small['author'], memory=True)
+    small_time, small_peak, (small_graph, _, components, _) = measure(csr_analysis, small['author'], memory=True)
+    print(f"[공저, 논문 {args.legacy_papers}개] 저자 {small_graph.n_nodes}명, 관계 {small_graph.n_edges}개")
+    print(f"기존 (dict + 파이썬 BFS/PageRank): {legacy_time:.2f}s / 최대 {legacy_peak:.0f}MB, "
+          f"연결 요소 {legacy_components}개")
+    print(f"CSR: {small_time:.2f}s / 최대 {small_peak:.0f}MB ({legacy_time / small_time:.1f}x), "
+          f"연결 요소 {components.max() + 1}개")
+
+    papers = make_papers(args.papers)
+    split_time, _, (_, codes, names) = measure(split_authors, papers['author'])
+    total, peak, (graph, degree, components, pagerank) = measure(csr_analysis, papers['author'], memory=True)
+    print(f"\n[공저, 논문 {args.papers}개] 저자 {graph.n_nodes}명, 관계 {graph.n_edges}개, "
+          f"CSR {graph.nbytes / 1024 / 1024:.0f}MB")
+    print(f"저자 분리/정규화 {split_time:.2f}s, 전체 (그래프 + 차수 + 연결 요소 + PageRank) "
+          f"{total:.2f}s / 최대 {peak:.0f}MB, 최대 차수 {degree.max()}, 연결 요소 {components.max() + 1}개")
+
+    start = time.perf_counter()
+    citations = citation_graph(papers)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    cited = citations.in_degree()
+    citations.pagerank()
+    analysed = time.perf_counter() - start
+    print(f"\n[인용, 논문 {args.papers}개] 인용 {citations.n_edges}개 (예상 {expected_citations(papers)}개, "
+          f"DOI 없는 참고문헌 포함), CSR {citations.nbytes / 1024 / 1024:.0f}MB")
+    print(f"참고문헌 연결 {built:.2f}s, 피인용 수 + PageRank {analysed:.2f}s, 최다 피인용 {cited.max()}회")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""통합 엔진 벤치마크
+
+합성 Scopus/IEEE CSV와 BibTeX 파일로 대규모 내보내기를 만들어
+integrate_papers의 처리 시간과 최대 메모리를 측정합니다. 이어서
+원본이 그대로일 때와 --added행짜리 내보내기 하나를 추가했을 때의
+증분 통합 시간을 측정합니다.
+
+    python benchmarks/bench_integrate.py --rows 200000
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from integrate_papers import integrate_papers  # noqa: E402
+from papers_dataset import read_dataset  # noqa: E402
+
+def write_synthetic_sources(source_dir, rows):
+    """Scopus/IEEE 형식의 합성 CSV와 작은 BibTeX 파일 생성"""
+    half = rows // 2
+    scopus = pd.DataFrame({
+        'Authors': [f'Kim, J.; Lee, S.; Author {i}' for i in range(half)],
+        'Title': [f'Scopus paper number {i} on cloud systems' for i in range(half)],
+        'Year': [str(2000 + i % 25) for i in range(half)],
+        'Source title': [f'Journal {i % 300}' for i in range(half)],
+        'DOI': [f'10.1016/j.jss.{i}' for i in range(half)],
+        'Link': [f'https://www.scopus.com/record/{i}' for i in range(half)],
+        'Abstract': ['Abstract text. ' * 30] * half,
+        'Author Keywords': ['cloud; scalability'] * half,
+        'Publisher': ['Elsevier'] * half,
+        'Document Type': ['Article'] * half,
+        'Cited by': [str(i % 50) for i in range(half)],
+    })
+    scopus.to_csv(os.path.join(source_dir, 'scopus_export.csv'), index=False, encoding='utf-8-sig')
+
+    ieee = pd.DataFrame({
+        'Document Title': [f'IEEE paper number {i}' for i in range(rows - half)],
+        'Authors': [f'Park, H.; Author {i}' for i in range(rows - half)],
+        'Publication Year': [str(2000 + i % 25) for i in range(rows - half)],
+        'Publication Title': ['IEEE Access'] * (rows - half),
+        'DOI': [f'10.1109/ACCESS.{i}' for i in range(rows - half)],
+        'Abstract': ['IEEE abstract text. ' * 30] * (rows - half),
+        'IEEE Terms': ['Cloud computing;Servers'] * (rows - half),
+        'Start Page': ['1'] * (rows - half),
+    })
+    ieee.to_csv(os.path.join(source_dir, 'export2024.csv'), index=False)
+
+    with open(os.path.join(source_dir, 'acm.bib'), 'w', encoding='utf-8') as f:
+        for i in range(1000):
+            f.write(f"@article{{key{i},\ntitle = {{ACM paper {i}}},\nyear = {{2020}},\n"
+                    f"doi = {{10.1145/{i}}},\njournal = {{CACM}}\n}}\n\n")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--added', type=int, default=2000)
+    args = parser.parse_args()
+
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+    with open(os.path.join(config_dir, 'config.json'), encoding='utf-8') as f:
+        import json
+        config = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config['source_dir'] = os.path.join(tmp, 'source')
+        config['output_dir'] = os.path.join(tmp, 'output')
+        config['chunk_size'] = 50000
+        os.makedirs(config['source_dir'])
+        write_synthetic_sources(config['source_dir'], args.rows)
+
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        output_file = integrate_papers(config)
+        elapsed = time.perf_counter() - start
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        rows = len(read_dataset(output_file, columns=['title']))
+
+        start = time.perf_counter()
+        integrate_papers(config)
+        unchanged = time.perf_counter() - start
+
+        added = pd.DataFrame({
+            'Title': [f'New Scopus paper {i}' for i in range(args.added)],
+            'Year': ['2025'] * args.added,
+            'DOI': [f'10.1016/new.{i}' for i in range(args.added)],
+        })
+        added.to_csv(os.path.join(config['source_dir'], 'scopus_new.csv'), index=False)
+        start = time.perf_counter()
+        added_file = integrate_papers(config)
+        incremental = time.perf_counter() - start
+        added_rows = len(read_dataset(added_file, columns=['title']))
+
+    print(f"통합 레코드 수: {rows}")
+    print(f"처리 시간: {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)")
+    print(f"최대 RSS: {peak / 1024:.0f} MB (통합 전 {before / 1024:.0f} MB)")
+    print(f"증분 - 바뀐 원본 없음: {unchanged:.2f}s")
+    print(f"증분 - {args.added}행 내보내기 추가: {incremental:.2f}s ({added_rows}개 레코드)")
+
+if __name__ == "__main__":
+    main()
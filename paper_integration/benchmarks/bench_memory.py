@@ -0,0 +1,157 @@
+"""레코드 메모리 벤치마크
+
+합성 레코드 --records개로 두 가지 메모리 사용량을 비교합니다.
+(1) BibTeX 변환: 레코드 딕셔너리 목록 + DataFrame과 RecordColumns(필드별
+열, 정수 연도, category)의 비교. (2) 이름 변경용 논문 정보: 제목 -> 정보
+딕셔너리와 PapersInfo(행 번호, 문자열 배열, 해시 역색인)의 비교.
+측정마다 새 프로세스(fork)에서 자료를 만들고, 만든 뒤 남은 RSS 증가량과
+최대 RSS 증가량을 잽니다 (Linux).
+
+    python benchmarks/bench_memory.py --records 1000000
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from dedup_papers import normalize_doi  # noqa: E402
+from paper_columns import paper_filename, text  # noqa: E402
+from paper_records import RecordColumns  # noqa: E402
+from rename_papers import papers_info_from_dataframe  # noqa: E402
+
+PUBLISHERS = ('Association for Computing Machinery', 'IEEE', 'Springer', 'Elsevier')
+DOCUMENT_TYPES = ('inproceedings', 'article', 'misc')
+SOURCES = ('acm', 'ieee', 'scopus', 'wos', 'bib')
+
+def current_rss():
+    """현재 RSS (바이트)"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+def peak_rss():
+    """최대 RSS (바이트)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def make_records(records, abstract_chars):
+    """parse_bibtex_entry처럼 레코드마다 필드가 다른 딕셔너리 생성
+
+    파서는 엔트리 타입과 연도를 레코드마다 새 문자열로 만들고, 출판사는
+    값 캐시에서 같은 객체를 돌려주므로 같은 방식으로 만듭니다.
+    """
+    abstract = 'x' * abstract_chars
+    for i in range(records):
+        record = {
+            'cite_key': f'key{i}',
+            'title': f'Paper {i}: a study of compact record models',
+            'author': f'Author{i % 50000} A. and Author{i % 70001} B.',
+            'year': str(2000 + i % 25),
+            'booktitle' if i % 3 else 'journal': f'Proceedings of Conference {i % 500}',
+            'publisher': PUBLISHERS[i % len(PUBLISHERS)],
+            'pages': f'{i % 100}--{i % 100 + 10}',
+            'doi': f'10.1145/{i}',
+            'abstract': f'{abstract}{i}',
+            'keywords': f'memory; records; topic {i % 1000}',
+        }
+        if i % 5 == 0:
+            record['numpages'] = str(i % 20)
+        record['document_type'] = ''.join(DOCUMENT_TYPES[i % len(DOCUMENT_TYPES)])
+        yield record
+
+def make_papers(records):
+    """통합 데이터셋에서 읽은 것 같은 논문 DataFrame (title, year, source, doi)"""
+    return pd.DataFrame({
+        'title': pd.array([f'Paper {i}: a study of compact record models' for i in range(records)],
+                          dtype='string'),
+        'year': pd.array(2000 + np.arange(records) % 25, dtype='Int64'),
+        'source': pd.array(np.array(SOURCES, dtype=object)[np.arange(records) % len(SOURCES)],
+                           dtype='string'),
+        'doi': pd.array([f'10.1145/{i}' if i % 3 else None for i in range(records)], dtype='string'),
+    })
+
+def legacy_converter(args):
+    """기존 convert_bib_to_csv: 레코드 딕셔너리 목록 -> DataFrame"""
+    records = list(make_records(args.records, args.abstract_chars))
+    collected = current_rss()
+    df = pd.DataFrame(records)
+    return collected, df, records
+
+def compact_converter(args):
+    """RecordColumns: 필드별 열 -> DataFrame (정수 연도, category)"""
+    records = RecordColumns().extend(make_records(args.records, args.abstract_chars))
+    collected = current_rss()
+    df = records.to_frame()
+    return collected, df, records
+
+def legacy_papers_info(df):
+    """기존 rename_papers.PapersInfo: 제목 -> 정보 딕셔너리 + 파일명/DOI -> 제목"""
+    dois = normalize_doi(df['doi']).fillna('')
+    filenames = paper_filename(df)
+    years = text(df, 'year', 'nan')
+    papers_info, by_filename, by_doi = {}, {}, {}
+    for title, year, source, doi, filename in zip(df['title'], years, df['source'], dois, filenames):
+        papers_info[title] = {'year': year, 'source': source, 'doi': doi, 'filename': filename}
+        by_filename[filename] = title
+        if doi:
+            by_doi[doi] = title
+    return papers_info, by_filename, by_doi
+
+CASES = {
+    'converter_legacy': ('BibTeX 변환: 딕셔너리 목록 + DataFrame', legacy_converter),
+    'converter_compact': ('BibTeX 변환: RecordColumns', compact_converter),
+    'papers_info_legacy': ('논문 정보: 제목 -> 딕셔너리', legacy_papers_info),
+    'papers_info_compact': ('논문 정보: PapersInfo', papers_info_from_dataframe),
+}
+
+def run_case(name, args, results):
+    """자식 프로세스: 자료를 만들고 (모은 뒤, 만든 뒤, 최대) RSS 증가량과 시간 보고"""
+    _, function = CASES[name]
+    df = make_papers(args.records) if name.startswith('papers_info') else None
+    base = current_rss()
+    start = time.perf_counter()
+    if df is None:
+        collected, built, _ = function(args)
+    else:
+        built = function(df)
+        collected = None
+    elapsed = time.perf_counter() - start
+    results.put((name, None if collected is None else collected - base,
+                 current_rss() - base, peak_rss() - base, elapsed))
+
+def measure(name, args):
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    process = context.Process(target=run_case, args=(name, args, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1000000)
+    parser.add_argument('--abstract-chars', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"레코드 {args.records}개 (초록 {args.abstract_chars}자)\n")
+    print(f"{'':34s} {'모은 뒤':>9s} {'만든 뒤':>9s} {'최대':>9s} {'시간':>7s}")
+    retained = {}
+    for name, (label, _) in CASES.items():
+        _, collected, built, peak, elapsed = measure(name, args)
+        retained[name] = built
+        collected = '-' if collected is None else f'{collected / 1e6:.0f}MB'
+        print(f"{label:34s} {collected:>9s} {built / 1e6:7.0f}MB {peak / 1e6:7.0f}MB {elapsed:6.1f}s")
+
+    print()
+    for kind, label in (('converter', 'BibTeX 변환'), ('papers_info', '논문 정보')):
+        legacy, compact = retained[f'{kind}_legacy'], retained[f'{kind}_compact']
+        print(f"{label}: {legacy / 1e6:.0f}MB -> {compact / 1e6:.0f}MB ({legacy / max(compact, 1):.1f}배 감소)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""papers_urls 가져오기/조회 벤치마크
+
+합성 통합 데이터셋 --rows개로 기존 방식(import할 때마다 최신 데이터셋을
+읽어 사전 생성)과 지연 생성 + 경로/수정 시각 캐시 방식의 import 시간,
+첫 조회, 반복 조회, 제목/DOI 일괄 조회 시간을 비교합니다.
+
+    python benchmarks/bench_papers_urls.py --rows 200000
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from bench_dataset import make_papers  # noqa: E402
+from papers_dataset import save_papers  # noqa: E402
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    papers = make_papers(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        save_papers(papers, 'output')
+
+        import papers_urls
+        # 기존 동작: 사용하는 도구마다 import 시점에 사전을 새로 만듦
+        legacy, _ = timed(lambda: [papers_urls._build_url_map('output', papers_urls.latest_dataset('output'))
+                                   for _ in range(args.repeat)])
+        imported, _ = timed(lambda: importlib.reload(papers_urls))
+        first, _ = timed(papers_urls.get_papers_urls)
+        repeated, _ = timed(lambda: [papers_urls.get_papers_urls() for _ in range(args.repeat)])
+        titles = papers['title'].sample(n=min(10000, len(papers)), random_state=0)
+        dois = papers['doi'].sample(n=min(10000, len(papers)), random_state=0).str.upper()
+        by_title, title_urls = timed(lambda: papers_urls.lookup_urls(titles=titles))
+        by_doi, doi_urls = timed(lambda: papers_urls.lookup_urls(dois=dois))
+        os.chdir('/')
+
+    print(f"논문 {args.rows}개, 반복 {args.repeat}번")
+    print(f"기존 (import마다 생성): {legacy:.2f}s")
+    print(f"import: {imported * 1000:.1f}ms, 첫 조회: {first:.2f}s, "
+          f"이후 {args.repeat}번: {repeated * 1000:.1f}ms")
+    print(f"일괄 조회 {len(titles)}건: 제목 {by_title * 1000:.1f}ms ({sum(map(bool, title_urls))}건 찾음), "
+          f"DOI {by_doi * 1000:.1f}ms ({sum(map(bool, doi_urls))}건 찾음)")
+
+if __name__ == "__main__":
+    main()
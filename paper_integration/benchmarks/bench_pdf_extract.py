@@ -0,0 +1,98 @@
+"""첫 페이지 제목 추출 벤치마크
+
+일반 논문, 수백 쪽짜리 학위논문, 큰 이미지가 들어간 파일, 잘리거나
+PDF가 아닌 파일을 섞어 기존 방식(파일 전체를 읽고 페이지 트리를 모두
+펼친 뒤 첫 페이지 추출)과 메모리 맵 + 첫 페이지만 파싱하는 방식의
+처리 시간과 최대 메모리(tracemalloc)를 비교합니다.
+
+    python benchmarks/bench_pdf_extract.py --normal 50 --large 10 --corrupt 10
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from PyPDF2 import PdfReader
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import rename_papers  # noqa: E402
+from bench_rename import make_pdf  # noqa: E402
+
+def legacy_extract(pdf_path):
+    """기존 동작 재현: PdfReader(경로) + len(reader.pages) + 첫 페이지 텍스트"""
+    try:
+        reader = PdfReader(pdf_path)
+        if len(reader.pages) > 0:
+            return reader.pages[0].extract_text().split('\n')[0]
+        return ""
+    except Exception:
+        return ""
+
+def make_corpus(directory, normal, large, corrupt):
+    """종류별 PDF를 만들고 (종류, 경로) 목록 반환"""
+    files = []
+    for i in range(normal):
+        path = os.path.join(directory, f'normal{i}.pdf')
+        make_pdf(path, f'Normal Paper Title {i}', pages=12)
+        files.append(('normal', path))
+    for i in range(large):
+        path = os.path.join(directory, f'thesis{i}.pdf')
+        make_pdf(path, f'Thesis Title {i}', pages=300)
+        files.append(('large', path))
+        path = os.path.join(directory, f'scan{i}.pdf')
+        make_pdf(path, f'Scanned Paper Title {i}', pages=20, padding=50 * 1024 * 1024)
+        files.append(('large', path))
+    with open(files[0][1], 'rb') as f:
+        sample = f.read()
+    for i in range(corrupt):
+        broken = [sample[:len(sample) // 2],                       # 다운로드 중 잘린 파일
+                  b'<html><body>Access denied</body></html>' * 50,  # 오류 페이지
+                  b'',                                              # 빈 파일
+                  sample.replace(b'xref', b'xxxx')]                 # 깨진 xref
+        path = os.path.join(directory, f'corrupt{i}.pdf')
+        with open(path, 'wb') as f:
+            f.write(broken[i % len(broken)])
+        files.append(('corrupt', path))
+    return files
+
+def measure(extract, files):
+    """종류별 (총 시간, 최대 메모리) 측정"""
+    results = {}
+    for kind, path in files:
+        tracemalloc.start()
+        start = time.perf_counter()
+        extract(path)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        total, worst = results.get(kind, (0.0, 0))
+        results[kind] = (total + elapsed, max(worst, peak))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--normal', type=int, default=50)
+    parser.add_argument('--large', type=int, default=10)
+    parser.add_argument('--corrupt', type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_corpus(tmp, args.normal, args.large, args.corrupt)
+        legacy = measure(legacy_extract, files)
+        lazy = measure(rename_papers.extract_pdf_info, files)
+        failed = sum(1 for _, path in files if rename_papers.extract_pdf_info(path).get('error'))
+
+    print(f"파일 {len(files)}개 (실패로 기록: {failed}개)")
+    for kind in legacy:
+        (old_time, old_peak), (new_time, new_peak) = legacy[kind], lazy[kind]
+        print(f"{kind:8s} 기존 {old_time:6.2f}s / 최대 {old_peak / 1024 / 1024:6.1f}MB  "
+              f"->  첫 페이지만 {new_time:6.2f}s / 최대 {new_peak / 1024 / 1024:6.1f}MB "
+              f"({old_time / max(new_time, 1e-9):.1f}x)")
+
+if __name__ == "__main__":
+    main()
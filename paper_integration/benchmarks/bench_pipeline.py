@@ -0,0 +1,159 @@
+"""파이프라인 벤치마크
+
+로컬 HTTP 서버가 논문마다 다른 PDF를 느리게 돌려주는 환경에서,
+기존처럼 단계별 스크립트를 차례로 실행(통합 -> 다운로드 -> 이름 변경
+-> 보고서, 단계마다 최신 데이터셋을 다시 읽음)한 시간과 단계를 겹쳐
+실행하는 파이프라인의 시간을 비교합니다. 중간에 멈춘 뒤 이어서
+실행하는 경우도 확인합니다.
+
+    python benchmarks/bench_pipeline.py --papers 80 --latency 0.2
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from bench_dedup import WORDS  # noqa: E402
+from bench_rename import make_pdf  # noqa: E402
+from integrate_papers import integrate_papers, load_config  # noqa: E402
+from paper_downloader import PaperDownloader  # noqa: E402
+from paper_pipeline import Pipeline  # noqa: E402
+from paper_search import update_index  # noqa: E402
+from papers_dataset import latest_dataset  # noqa: E402
+from rename_papers import rename_pdf_files  # noqa: E402
+from visualize_papers import visualize_report  # noqa: E402
+
+PDFS = {}
+
+class PDFHandler(BaseHTTPRequestHandler):
+    """/paper<번호>.pdf 요청에 그 논문의 PDF를 latency초 뒤에 돌려주는 서버"""
+    latency = 0.2
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = PDFS.get(os.path.basename(self.path))
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def prepare(workdir, papers, ports, workers):
+    """원본 Scopus CSV, 설정 파일, 논문별 PDF 준비"""
+    os.makedirs(os.path.join(workdir, 'source'))
+    # 중복 제거에 묶이지 않도록 논문마다 다른 제목
+    rng = random.Random(0)
+    titles = [' '.join(rng.choice(WORDS) for _ in range(8)).title() + f' {i}' for i in range(papers)]
+    pd.DataFrame({
+        'Title': titles,
+        'Year': [2015 + i % 10 for i in range(papers)],
+        'Authors': [f'Kim J.; Author{i % 7} A.' for i in range(papers)],
+        'Source title': [f'Journal {i % 5}' for i in range(papers)],
+        'Author Keywords': ['streaming; pipelines; back-pressure'] * papers,
+        'Link': [f'http://127.0.0.1:{ports[i % len(ports)]}/paper{i}.pdf' for i in range(papers)],
+    }).to_csv(os.path.join(workdir, 'source', 'scopus_bench.csv'), index=False)
+
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'config.json'),
+              encoding='utf-8') as f:
+        config = json.load(f)
+    config.update({'delay': 0, 'max_workers': workers, 'retry_count': 1, 'resolve_dois': False})
+    with open(os.path.join(workdir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+    for i, title in enumerate(titles):
+        path = os.path.join(workdir, 'pdf.tmp')
+        make_pdf(path, title, pages=3)
+        with open(path, 'rb') as f:
+            PDFS[f'paper{i}.pdf'] = f.read()
+        os.remove(path)
+
+def run_scripts():
+    """기존 방식: 단계별 스크립트를 차례로 실행"""
+    timings = {}
+    start = time.perf_counter()
+    integrate_papers(load_config())
+    timings['integrate'] = time.perf_counter() - start
+    PaperDownloader().download_papers(latest_dataset('output'))
+    timings['download'] = time.perf_counter() - start - sum(timings.values())
+    rename_pdf_files('downloads')
+    timings['rename'] = time.perf_counter() - start - sum(timings.values())
+    visualize_report('output')
+    timings['report'] = time.perf_counter() - start - sum(timings.values())
+    update_index('output', 'downloads')
+    timings['index'] = time.perf_counter() - start - sum(timings.values())
+    return time.perf_counter() - start, timings
+
+def run_pipeline(**kwargs):
+    start = time.perf_counter()
+    timings = Pipeline().run(**kwargs)
+    return time.perf_counter() - start, {stage: end - begin for stage, (begin, end) in timings.items()}
+
+def renamed_count():
+    """제목-연도-출처 형식으로 이름이 바뀐 PDF 수"""
+    return sum(name.endswith('-scopus.pdf') for name in os.listdir('downloads'))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=80)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--hosts', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    # 한글 글꼴이 없는 환경의 Glyph 경고 (그래프 작업 프로세스에도 전달)
+    warnings.filterwarnings('ignore', message='Glyph')
+    os.environ['PYTHONWARNINGS'] = 'ignore::UserWarning'
+
+    PDFHandler.latency = args.latency
+    ports = []
+    for _ in range(args.hosts):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PDFHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ports.append(server.server_port)
+
+    results = {}
+    # download: 식별 단계 없이 통합/다운로드만 (받은 PDF가 큐 크기보다 많아도 끝나야 함)
+    for mode in ('scripts', 'pipeline', 'download'):
+        with tempfile.TemporaryDirectory() as tmp:
+            prepare(tmp, args.papers, ports, args.workers)
+            os.chdir(tmp)
+            if mode == 'scripts':
+                results[mode] = run_scripts()
+            elif mode == 'pipeline':
+                results[mode] = run_pipeline()
+            else:
+                results[mode] = run_pipeline(stages=('integrate', 'download'))
+            results[mode] += (renamed_count(),)
+
+            # 이어서 실행: 완료 기록과 매니페스트/추출 캐시로 남은 일이 없음
+            if mode == 'pipeline':
+                results['resume'] = run_pipeline() + (renamed_count(),)
+            os.chdir('/')
+
+    print(f"논문 {args.papers}개, 호스트 {args.hosts}개 (응답 지연 {args.latency}s), "
+          f"다운로드 작업자 {args.workers}개, CPU {os.cpu_count()}개")
+    for mode, (total, timings, renamed) in results.items():
+        stages = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        print(f"{mode:8s} 전체 {total:6.2f}s (단계 합계 {sum(timings.values()):.2f}s: {stages}), "
+              f"이름 변경된 PDF {renamed}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""PDF 제목 추출 벤치마크
+
+간단한 텍스트 PDF를 만들어 기존 방식(스레드 풀에서 파일마다 추출),
+프로세스 풀 추출, 추출 캐시를 사용한 재실행 시간을 비교합니다.
+
+    python benchmarks/bench_rename.py --pdfs 400
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from PyPDF2 import PdfReader
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import rename_papers  # noqa: E402
+
+BODY_LINES = 60
+
+def make_pdf(path, title, lines=BODY_LINES, pages=1, info_title=None, padding=0):
+    """제목 한 줄과 본문 lines줄이 있는 pages쪽짜리 PDF 작성
+
+    info_title을 주면 문서 정보(/Info)에 /Title을 넣고, padding을 주면
+    그 크기의 이미지 같은 스트림 객체를 덧붙입니다.
+    """
+    def content(page):
+        text = [f'BT /F1 18 Tf 72 760 Td ({title}) Tj ET'] if page == 0 else []
+        for i in range(lines):
+            text.append(f'BT /F1 9 Tf 72 {730 - i * 11} Td '
+                        f'(Body line {i} of page {page} with some words to extract) Tj ET')
+        stream = '\n'.join(text).encode('latin-1')
+        return b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream'
+
+    # 1: 카탈로그, 2: 페이지 트리, 3: 글꼴, 4부터 (페이지, 내용) 쌍
+    kids = ' '.join(f'{4 + 2 * page} 0 R' for page in range(pages)).encode()
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [' + kids + b'] /Count %d >>' % pages,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for page in range(pages):
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (5 + 2 * page))
+        objects.append(content(page))
+    if padding:
+        objects.append(b'<< /Length %d >>\nstream\n' % padding + os.urandom(padding) + b'\nendstream')
+    trailer_extra = b''
+    if info_title is not None:
+        objects.append(b'<< /Title (' + info_title.encode('latin-1') + b') >>')
+        trailer_extra = b' /Info %d 0 R' % len(objects)
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R%s >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, trailer_extra, xref)
+    with open(path, 'wb') as f:
+        f.write(out)
+
+def legacy_extract_title(pdf_path):
+    """기존 extract_title_from_pdf 그대로: 파일 전체를 PdfReader로 읽고 첫 페이지 줄 중 제목 후보 선택"""
+    try:
+        reader = PdfReader(pdf_path)
+        if len(reader.pages) > 0:
+            text = reader.pages[0].extract_text()
+            lines = text.split('\n')
+            candidates = []
+            for line in lines:
+                line = line.strip()
+                if not line or all(c in '_-=*' for c in line):
+                    continue
+                if 'doi.org' in line.lower() or 'http' in line.lower():
+                    continue
+                if re.match(r'^\d+$', line) or re.match(r'^\d{4}$', line):
+                    continue
+                if not candidates or not lines[lines.index(line)-1].strip() or all(c in '_-=*' for c in lines[lines.index(line)-1]):
+                    candidates.append(line)
+            if candidates:
+                return max(candidates, key=len)
+            return ""
+        return ""
+    except Exception:
+        return ""
+
+def legacy_extract(pdf_paths):
+    """기존 동작 재현: 스레드 풀에서 파일마다 제목 추출 (GIL에 묶임)"""
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(legacy_extract_title, pdf_paths))
+
+def timed_rename(use_processes):
+    start = time.perf_counter()
+    rename_papers.rename_pdf_files('downloads', use_processes=use_processes)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pdfs', type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.makedirs('downloads')
+        os.makedirs('output')
+        for i in range(args.pdfs):
+            make_pdf(os.path.join('downloads', f'paper{i}.pdf'), f'Benchmark Paper Number {i} On Extraction')
+        # 어떤 제목과도 맞지 않는 논문 목록: 파일 이름이 바뀌지 않아 재실행 시 캐시를 사용
+        pd.DataFrame({'title': ['Unrelated'], 'year': [2024], 'source': ['bench']}).to_csv(
+            os.path.join('output', 'papers_bench.csv'), index=False)
+
+        pdf_paths = [os.path.join('downloads', f) for f in sorted(os.listdir('downloads'))]
+        start = time.perf_counter()
+        titles = legacy_extract(pdf_paths)
+        legacy = time.perf_counter() - start
+
+        pooled = timed_rename(use_processes=True)
+        cached = timed_rename(use_processes=True)
+        os.chdir('/')
+
+    print(f"PDF {args.pdfs}개, CPU {os.cpu_count()}개, 추출 성공 {sum(map(bool, titles))}개")
+    print(f"기존 (스레드 풀): {legacy:.2f}s")
+    print(f"프로세스 풀: {pooled:.2f}s ({legacy / pooled:.1f}x)")
+    print(f"재실행 (추출 캐시): {cached:.2f}s ({legacy / cached:.1f}x)")
+
+if __name__ == "__main__":
+    main()
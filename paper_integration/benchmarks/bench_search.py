@@ -0,0 +1,131 @@
+"""검색 색인 벤치마크
+
+단어 빈도가 Zipf 분포를 따르는 합성 논문(제목, 초록, 키워드, 저자,
+학회)으로 SearchIndex를 만들고, 전체 색인 시간, 일부 레코드가 바뀌거나
+추가됐을 때의 증분 갱신 시간, 흔한/드문 검색어와 필터를 쓴 질의의
+지연 시간(p50/p95)을 잽니다. 비교용으로 초록을 문자열 검색(grep)하는
+시간도 잽니다.
+
+    python benchmarks/bench_search.py --papers 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paper_search import SearchIndex  # noqa: E402
+
+SYLLABLES = ('ka', 'lo', 'mi', 'ne', 'ru', 'ta', 'vi', 'so', 'pe', 'du', 'gra', 'phi', 'net', 'ser', 'cu')
+SOURCES = ('acm', 'ieee', 'scopus', 'wos', 'bib')
+
+def make_vocabulary(size, seed=0):
+    """음절을 이어 만든 서로 다른 단어 size개 (앞쪽일수록 자주 나옴)"""
+    rng = np.random.default_rng(seed)
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES, rng.integers(2, 5))))
+    return np.array(sorted(words, key=lambda word: (len(word), word)), dtype=object)
+
+def make_papers(papers, vocabulary, abstract_words, seed=0):
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, len(vocabulary) + 1)
+    weights /= weights.sum()
+
+    def sentences(words):
+        codes = rng.choice(len(vocabulary), size=(papers, words), p=weights)
+        return [' '.join(row) for row in vocabulary[codes]]
+
+    authors = np.array([f'Author{i} {chr(65 + i % 26)}.' for i in range(papers // 4 + 1)], dtype=object)
+    venues = np.array([f'Proceedings of Conference {i}' for i in range(500)], dtype=object)
+    return pd.DataFrame({
+        'title': sentences(10),
+        'author': ['; '.join(row) for row in authors[rng.integers(0, len(authors), size=(papers, 3))]],
+        'abstract': sentences(abstract_words),
+        'keywords': ['; '.join(row) for row in vocabulary[rng.integers(0, 2000, size=(papers, 4))]],
+        'publication': venues[rng.integers(0, len(venues), papers)],
+        'year': rng.integers(2000, 2025, papers),
+        'source': np.array(SOURCES, dtype=object)[rng.integers(0, len(SOURCES), papers)],
+        'doi': [f'10.1000/{i}' if i % 2 else None for i in range(papers)],
+    })
+
+def timed(function, repeat):
+    """(결과, 실행 시간 목록 ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, times
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--papers', type=int, default=500000)
+    parser.add_argument('--vocabulary', type=int, default=50000)
+    parser.add_argument('--abstract-words', type=int, default=80)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    vocabulary = make_vocabulary(args.vocabulary)
+    start = time.perf_counter()
+    df = make_papers(args.papers, vocabulary, args.abstract_words)
+    print(f"합성 논문 {len(df)}개 생성: {time.perf_counter() - start:.1f}s "
+          f"(초록 {args.abstract_words}단어, 어휘 {len(vocabulary)}개)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'search_index')
+        index = SearchIndex(path)
+        start = time.perf_counter()
+        index.update(df)
+        build = time.perf_counter() - start
+        stats = index.stats()
+        print(f"전체 색인: {build:.1f}s ({len(df) / build:.0f}개/s), 조각 {stats['segments']}개, "
+              f"색인 항목 {stats['postings']}개, 디스크 {directory_size(path) / 1e6:.0f}MB")
+
+        # 1% 변경 + 1000개 추가
+        changed = df.sample(frac=0.01, random_state=1).index
+        df.loc[changed, 'abstract'] = df.loc[changed, 'abstract'] + ' revised'
+        added = make_papers(1000, vocabulary, args.abstract_words, seed=1)
+        added['doi'] = [f'10.2000/{i}' for i in range(len(added))]
+        df = pd.concat([df, added], ignore_index=True)
+        start = time.perf_counter()
+        counts = index.update(df)
+        print(f"증분 갱신: {time.perf_counter() - start:.1f}s (추가 {counts['added']}개, "
+              f"변경 {counts['updated']}개)")
+        _, unchanged = timed(lambda: index.update(df), 1)
+        print(f"바뀐 것이 없을 때 갱신 확인: {unchanged[0] / 1000:.1f}s")
+
+        _, opened = timed(lambda: SearchIndex(path).close(), 1)
+        print(f"색인 열기 (문서 배열 읽기): {opened[0]:.0f}ms")
+
+        common, mid, rare = vocabulary[3], vocabulary[300], vocabulary[30000 % len(vocabulary)]
+        queries = [
+            (f'흔한 단어 ({common})', common, {}),
+            (f'중간 단어 ({mid})', mid, {}),
+            (f'드문 단어 ({rare})', rare, {}),
+            ('두 단어 AND', f'{common} {mid}', {}),
+            ('세 단어 OR', f'{common} {mid} {rare}', {'match_all': False}),
+            ('흔한 단어 + 연도/출처 필터', common, {'year_from': 2015, 'year_to': 2020, 'source': 'acm'}),
+            ('중간 단어 + 학회 필터', mid, {'venue': 'conference 12'}),
+        ]
+        print(f"\n질의 지연 시간 ({args.repeat}회, 상위 10개)")
+        for label, query, filters in queries:
+            results, times = timed(lambda: index.search(query, **filters), args.repeat)
+            print(f"{label:32s} p50 {np.percentile(times, 50):7.2f}ms  p95 {np.percentile(times, 95):7.2f}ms  "
+                  f"결과 {len(results)}개")
+
+        abstracts = df['abstract'].astype('string')
+        _, grep = timed(lambda: abstracts.str.contains(mid, regex=False).sum(), 3)
+        print(f"{'비교: 초록 문자열 검색 (grep)':32s} p50 {np.percentile(grep, 50):7.2f}ms")
+        index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""CLI 시작 시간 벤치마크
+
+명령마다 새 인터프리터에서 `python -X importtime`으로 paper_cli와 그 명령의
+모듈을 import하는 시간을 재고, 무거운 의존성(pandas, matplotlib 등) 중
+무엇을 읽는지 보여줍니다. 명령별 예산(BUDGET_MS)을 넘으면 종료 코드 1로
+끝나므로 시작 시간이 나빠지는 변경을 잡을 수 있습니다. 비교용으로 모든
+모듈과 의존성을 한 번에 import하는 시간(지연 import 없이)도 잽니다.
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from paper_cli import COMMANDS  # noqa: E402
+
+# 명령별 import 시간 예산 (ms, 새 인터프리터 기준, 측정값 + 약 20%)
+# 지연 import는 명령 모듈 단위입니다. 데이터셋을 다루는 명령의 모듈은
+# pandas/numpy/pyarrow를 모듈 수준에서 import하므로 (직접, 또는 dedup_papers,
+# paper_columns, paper_records를 통해) 그 비용이 예산에 들어갑니다.
+# 측정 (1 CPU, 5번 중 최솟값을 3회): status 7~10ms, dataset 13~19ms,
+# verify-store 17~23ms, 데이터 명령 410~570ms
+LIGHT_BUDGET_MS = 30
+DATA_BUDGET_MS = 680
+BUDGET_MS = {
+    'status': LIGHT_BUDGET_MS,
+    'integrate': DATA_BUDGET_MS,
+    'dataset': LIGHT_BUDGET_MS,
+    'dedup': DATA_BUDGET_MS,
+    'url-list': DATA_BUDGET_MS,
+    'download': DATA_BUDGET_MS,
+    'verify-store': LIGHT_BUDGET_MS,
+    'rename': DATA_BUDGET_MS,
+    'analytics': DATA_BUDGET_MS,
+    'graph': DATA_BUDGET_MS,
+    'report': DATA_BUDGET_MS,
+    'index': DATA_BUDGET_MS,
+    'search': DATA_BUDGET_MS,
+    'pipeline': DATA_BUDGET_MS,
+}
+
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'requests', 'PyPDF2', 'tqdm', 'matplotlib', 'seaborn')
+
+# 지연 import 이전처럼 모든 것을 한 번에 읽는 경우
+EAGER_IMPORTS = ('integrate_papers, dedup_papers, paper_downloader, rename_papers, paper_analytics, '
+                 'paper_graph, visualize_papers, paper_pipeline, pyarrow.parquet, requests, PyPDF2, '
+                 'tqdm, matplotlib.pyplot, seaborn')
+
+def import_time(code):
+    """새 인터프리터에서 code를 실행하고 (paper_cli 이후 import 시간 ms, 표준 출력)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, cwd=SRC_DIR, check=True)
+    total, started = 0, False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # 들여쓰기가 없는 줄이 최상위 import (하위 import는 cumulative에 포함)
+        if name.startswith(' ') and not name.startswith('  '):
+            started = started or name.strip() in ('paper_cli', 'integrate_papers')
+            if started:
+                total += int(cumulative)
+    return total / 1000, result.stdout.strip()
+
+def measure_command(name, repeat):
+    code = (f"import sys, paper_cli; paper_cli.load_command({name!r}); "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    runs = [import_time(code) for _ in range(repeat)]
+    return min(ms for ms, _ in runs), runs[0][1]
+
+def wall_time(args, repeat):
+    """python src/paper_cli.py args 전체 실행 시간 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(SRC_DIR, 'paper_cli.py'), *args],
+                       capture_output=True, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = min(import_time(f"import {EAGER_IMPORTS}")[0] for _ in range(args.repeat))
+    print(f"모든 모듈을 한 번에 import (지연 import 없이): {baseline:.0f}ms")
+    print(f"전체 실행 --help {wall_time(['--help'], args.repeat):.0f}ms, "
+          f"status {wall_time(['status'], args.repeat):.0f}ms (인터프리터 시작 포함)")
+
+    over = []
+    for name in COMMANDS:
+        ms, loaded = measure_command(name, args.repeat)
+        budget = BUDGET_MS.get(name)
+        mark = '초과' if budget is not None and ms > budget else 'ok'
+        if mark == '초과':
+            over.append(name)
+        print(f"{name:13s} {ms:7.1f}ms (예산 {budget}ms, {mark})  읽는 의존성: {loaded or '-'}")
+
+    if over:
+        print(f"예산 초과: {', '.join(over)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""제목 매칭 벤치마크
+
+합성 논문 제목 --titles개에 대해, PDF에서 추출한 것처럼 대소문자,
+구두점, 단어 누락, 오타를 섞은 질의 --queries개를 TitleIndex로 찾습니다.
+기존 difflib.get_close_matches는 너무 느려 --sample개 질의만 실행하고
+같은 질의의 결과와 정답 일치율을 비교합니다.
+
+    python benchmarks/bench_title_match.py --titles 100000 --queries 10000
+"""
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from title_index import TitleIndex  # noqa: E402
+
+COMMON_WORDS = ('learning deep neural network graph model efficient scalable analysis '
+                'distributed system data privacy secure robust adaptive optimization '
+                'language vision transformer survey benchmark framework approach towards '
+                'for of the and with on in a using via').split()
+SYLLABLES = 'ka ro mi tes ven lor qua zin pho gra cel dyn opt mat sei tru bal nex'.split()
+
+def make_vocabulary(rng, size=5000):
+    """흔한 단어와 음절을 조합한 전문 용어로 이루어진 어휘"""
+    terms = {''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(size)}
+    return COMMON_WORDS, sorted(terms)
+
+def make_titles(count, rng):
+    common, terms = make_vocabulary(rng)
+    titles = set()
+    while len(titles) < count:
+        words = [rng.choice(terms) if rng.random() < 0.4 else rng.choice(common)
+                 for _ in range(rng.randint(5, 12))]
+        words[0] = words[0].capitalize()
+        titles.add(' '.join(words))
+    return sorted(titles)
+
+def perturb(title, rng):
+    """PDF 추출 결과처럼 제목을 흐트러뜨림"""
+    words = title.split()
+    if len(words) > 4 and rng.random() < 0.5:
+        del words[rng.randrange(len(words))]
+    text = ' '.join(words)
+    if rng.random() < 0.5:
+        text = text.upper()
+    if rng.random() < 0.5:
+        i = rng.randrange(len(text))
+        text = text[:i] + rng.choice('abcdefgh-:') + text[i + 1:]
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--titles', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=10000)
+    parser.add_argument('--sample', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    titles = make_titles(args.titles, rng)
+    truth = rng.sample(titles, args.queries)
+    queries = [perturb(t, rng) for t in truth]
+
+    start = time.perf_counter()
+    index = TitleIndex(titles)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = [index.best_match(q) for q in queries]
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = []
+    for q in queries[:args.sample]:
+        found = difflib.get_close_matches(q, titles, n=1, cutoff=0.5)
+        legacy.append(found[0] if found else None)
+    legacy_time = (time.perf_counter() - start) / args.sample * args.queries
+
+    sample = range(args.sample)
+    print(f"제목 {args.titles}개, 질의 {args.queries}개")
+    print(f"색인 생성: {build:.2f}s, 질의: {indexed:.2f}s ({indexed / args.queries * 1000:.2f}ms/건)")
+    print(f"기존 difflib (질의 {args.sample}개로 추정): {legacy_time:.0f}s ({legacy_time / indexed:.0f}x)")
+    print(f"정답률 - 색인: {sum(m == t for m, t in zip(matches, truth)) / args.queries:.1%}, "
+          f"표본에서 색인 {sum(matches[i] == truth[i] for i in sample)}/{args.sample}, "
+          f"difflib {sum(legacy[i] == truth[i] for i in sample)}/{args.sample}")
+    print(f"표본에서 difflib와 같은 결과: {sum(matches[i] == legacy[i] for i in sample)}/{args.sample}")
+
+if __name__ == "__main__":
+    main()
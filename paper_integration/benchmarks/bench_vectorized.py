@@ -0,0 +1,140 @@
+"""파생 컬럼 계산 벤치마크
+
+합성 논문 --rows개에 대해 기존 iterrows 반복(papers_urls의 URL 사전,
+다운로더의 파일명/URL, URL 목록 마크다운, rename_papers의 파일명)과
+paper_columns의 컬럼 단위 계산 시간을 비교하고 결과가 같은지 확인합니다.
+
+    python benchmarks/bench_vectorized.py --rows 200000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import paper_columns  # noqa: E402
+from integrate_papers import apply_types  # noqa: E402
+from rename_papers import sanitize_filename  # noqa: E402
+
+def make_papers(rows):
+    """DOI만, URL만, 둘 다, 둘 다 없는 논문이 섞인 합성 데이터셋"""
+    rng = np.random.default_rng(42)
+    index = pd.Series(np.arange(rows).astype(str))
+    kind = np.arange(rows) % 4
+    df = pd.DataFrame({
+        'title': 'Paper: number ' + index + ' on <scalable> systems?',
+        'year': rng.integers(1990, 2025, rows).astype(str),
+        'source': np.where(kind % 2, 'scopus', 'ieee'),
+        'doi': ('10.1000/bench.' + index).where(kind < 2),
+        'url': ('https://example.org/paper/' + index).where(kind % 2 == 0),
+    })
+    df.loc[df.index % 50 == 0, 'doi'] = '10.5555/acm.' + index
+    return apply_types(df)
+
+def blank(df):
+    return df.astype(object).where(df.notna(), '')
+
+def legacy_urls(df, resolved):
+    """기존 get_papers_urls 반복"""
+    papers_urls = {}
+    for _, row in blank(df).iterrows():
+        url, doi = row['url'], row['doi']
+        if url:
+            papers_urls[row['title']] = url
+        elif doi:
+            papers_urls[row['title']] = resolved.get(doi, (None, None))[1] or f"https://doi.org/{doi}"
+        else:
+            papers_urls[row['title']] = None
+    return papers_urls
+
+def legacy_downloads(df, resolved):
+    """기존 download_papers의 파일명/URL 계산"""
+    result = []
+    for _, paper in df.iterrows():
+        clean_title = re.sub(r'[^\w\s-]', '', paper['title'])
+        clean_title = re.sub(r'\s+', '_', clean_title)[:100]
+        filename = f"{paper['year']}_{clean_title}.pdf"
+        if pd.notna(paper['doi']):
+            landing_url, pdf_url = resolved.get(paper['doi'], (None, None))
+            url = pdf_url or landing_url or f"https://doi.org/{paper['doi']}"
+        elif pd.notna(paper['url']):
+            url = paper['url']
+        else:
+            url = None
+        result.append((filename, url))
+    return result
+
+def legacy_url_list(df, resolved):
+    """기존 generate_url_list 마크다운 작성"""
+    lines = []
+    for _, row in blank(df).iterrows():
+        doi, url = row['doi'], row['url']
+        if url or doi:
+            lines.append(f"## {row['title']} ({row['year']})\n- 출처: {row['source']}\n")
+            if doi:
+                if doi.startswith('10.5555'):
+                    lines.append(f'- DOI: {doi}\n')
+                else:
+                    lines.append(f'- URL: https://doi.org/{doi}\n')
+                pdf_url = resolved.get(doi, (None, None))[1]
+                if pdf_url:
+                    lines.append(f'- PDF: {pdf_url}\n')
+            elif url:
+                lines.append(f'- URL: {url}\n')
+            lines.append('\n')
+    return ''.join(lines)
+
+def legacy_filenames(df):
+    """기존 get_papers_info 파일명"""
+    return [sanitize_filename(f"{row['title']}-{row['year']}-{row['source']}")
+            for _, row in df.iterrows()]
+
+def vectorized_urls(df, resolved):
+    urls = paper_columns.link_url(df, resolved)
+    return dict(zip(df['title'], urls.astype(object).where(urls.notna(), None)))
+
+def vectorized_downloads(df, resolved):
+    urls = paper_columns.download_url(df, resolved)
+    return list(zip(paper_columns.download_filename(df),
+                    urls.astype(object).where(urls.notna(), None)))
+
+def vectorized_url_list(df, resolved):
+    return ''.join(paper_columns.url_list_entries(df, resolved))
+
+def vectorized_filenames(df):
+    return list(paper_columns.paper_filename(df))
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    df = make_papers(args.rows)
+    # DOI 10개 중 하나는 해석된 직접 PDF URL이 있는 것으로
+    resolved = {doi: (f'https://publisher.example/{doi}', f'https://publisher.example/{doi}.pdf')
+                for doi in df['doi'].dropna()[::10]}
+
+    print(f"논문 {args.rows}개")
+    for name, legacy, vectorized, extra in [
+        ('URL 사전', legacy_urls, vectorized_urls, (resolved,)),
+        ('다운로드 파일명/URL', legacy_downloads, vectorized_downloads, (resolved,)),
+        ('URL 목록 마크다운', legacy_url_list, vectorized_url_list, (resolved,)),
+        ('이름 변경 파일명', legacy_filenames, vectorized_filenames, ()),
+    ]:
+        old_time, old = timed(legacy, df, *extra)
+        new_time, new = timed(vectorized, df, *extra)
+        print(f"{name:16s} iterrows {old_time:6.2f}s  ->  컬럼 연산 {new_time:6.2f}s "
+              f"({old_time / max(new_time, 1e-9):.1f}x), 결과 일치: {old == new}")
+
+if __name__ == "__main__":
+    main()
@@ -2,112 +2,248 @@ import pandas as pd
 from datetime import datetime
 import re
 import os
+import unicodedata
+from functools import lru_cache
+
+from paper_records import RecordColumns
+
+# LaTeX 악센트 명령어 -> 결합 문자 (NFC 정규화로 한 글자로 합침)
+LATEX_ACCENTS = {
+    '"': '\u0308', "'": '\u0301', '`': '\u0300', '^': '\u0302',
+    '~': '\u0303', '=': '\u0304', '.': '\u0307', 'u': '\u0306',
+    'v': '\u030c', 'H': '\u030b', 'c': '\u0327', 'k': '\u0328',
+    'r': '\u030a', 'd': '\u0323', 'b': '\u0331'
+}
+
+# 인자 없는 LaTeX 기호 명령어
+LATEX_SYMBOLS = {
+    'ss': 'ß', 'SS': 'SS', 'ae': 'æ', 'AE': 'Æ', 'oe': 'œ', 'OE': 'Œ',
+    'o': 'ø', 'O': 'Ø', 'aa': 'å', 'AA': 'Å', 'l': 'ł', 'L': 'Ł',
+    'i': 'ı', 'j': 'ȷ', 'dh': 'ð', 'DH': 'Ð', 'th': 'þ', 'TH': 'Þ',
+    'textendash': '–', 'textemdash': '—', 'textquoteleft': '‘',
+    'textquoteright': '’', 'textquotedblleft': '“', 'textquotedblright': '”',
+    'ldots': '…', 'dots': '…', 'textregistered': '®', 'texttrademark': '™',
+    'copyright': '©', 'textdegree': '°', 'euro': '€', 'pounds': '£',
+    'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ', 'epsilon': 'ε',
+    'zeta': 'ζ', 'eta': 'η', 'theta': 'θ', 'kappa': 'κ', 'lambda': 'λ',
+    'mu': 'μ', 'nu': 'ν', 'xi': 'ξ', 'pi': 'π', 'rho': 'ρ', 'sigma': 'σ',
+    'tau': 'τ', 'phi': 'φ', 'chi': 'χ', 'psi': 'ψ', 'omega': 'ω',
+    'Gamma': 'Γ', 'Delta': 'Δ', 'Theta': 'Θ', 'Lambda': 'Λ', 'Pi': 'Π',
+    'Sigma': 'Σ', 'Phi': 'Φ', 'Psi': 'Ψ', 'Omega': 'Ω',
+    'times': '×', 'pm': '±', 'leq': '≤', 'geq': '≥', 'neq': '≠',
+    'approx': '≈', 'infty': '∞', 'rightarrow': '→', 'leftarrow': '←',
+    'cdot': '·'
+}
+
+# 악센트, 이스케이프 문자, 명령어, 수식, 중괄호를 하나의 정규식으로 처리
+_LATEX_TOKEN = re.compile(r"""
+    \\(?:(?P<sym_accent>["'`^~=.])\s*|(?P<let_accent>[uvHckrdb])(?=[\s{])\s*)
+        (?:\{\s*(?P<braced_base>\\?[A-Za-z])\s*\}|(?P<base>\\?[A-Za-z]))
+  | \\(?P<escaped>[&%$\#_{}\\\ ])
+  | \\(?P<command>[A-Za-z]+)(?:\{(?P<arg>[^{}]*)\})?
+  | \$(?P<math>[^$]*)\$
+  | [{}]
+""", re.VERBOSE)
+
+# 이 길이 이하의 값만 캐시 (출판사, 학회명, 키워드처럼 반복되는 값)
+_CACHEABLE_LENGTH = 256
+
+def _replace_latex_token(match):
+    """_LATEX_TOKEN 매치 하나를 유니코드 문자열로 바꾸는 함수"""
+    accent = match.group('sym_accent') or match.group('let_accent')
+    if accent:
+        # \'{\i} 처럼 점 없는 i/j를 받침으로 쓰는 경우도 처리
+        base = (match.group('braced_base') or match.group('base')).lstrip('\\')
+        return unicodedata.normalize('NFC', base + LATEX_ACCENTS[accent])
+
+    escaped = match.group('escaped')
+    if escaped is not None:
+        return escaped
+
+    command = match.group('command')
+    if command is not None:
+        arg = match.group('arg')
+        arg = _LATEX_TOKEN.sub(_replace_latex_token, arg) if arg else ''
+        return LATEX_SYMBOLS.get(command, '') + arg
+
+    math = match.group('math')
+    if math is not None:
+        return _LATEX_TOKEN.sub(_replace_latex_token, math)
+
+    # 남은 중괄호 제거
+    return ''
+
+def _decode_latex(value):
+    """LaTeX가 포함된 문자열을 한 번의 치환으로 유니코드로 바꾸는 함수"""
+    value = value.strip()
+
+    # 바깥 중괄호/따옴표 쌍 제거
+    if len(value) >= 2 and value[0] + value[-1] in ('{}', '""'):
+        value = value[1:-1]
+    value = value.strip(',')
+
+    value = _LATEX_TOKEN.sub(_replace_latex_token, value).strip()
+    return value if value else None
+
+_decode_latex_cached = lru_cache(maxsize=16384)(_decode_latex)
 
 def clean_bibtex_value(value):
     """BibTeX 값을 정제하는 함수"""
     if not value:
         return None
-        
-    # 중괄호와 따옴표 제거
-    value = re.sub(r'^[{"]|[}"]$', '', str(value).strip())
-    value = value.strip(',')
-    
-    # LaTeX 특수 문자 처리
-    latex_chars = {
-        r'\"a': 'ä', r'\"o': 'ö', r'\"u': 'ü',
-        r"\'a": 'á', r"\'e": 'é', r"\'i": 'í',
-        r"\'o": 'ó', r"\'u": 'ú', r'\ss': 'ß',
-        r'\ae': 'æ', r'\o': 'ø', r'\aa': 'å',
-        r'\"{o}': 'ö', r'\"{u}': 'ü', r'\"{a}': 'ä',
-        r"\'{e}": 'é', r"\'{i}": 'í', r"\'{o}": 'ó',
-        r"\'{u}": 'ú', r"\'{a}": 'á',
-        r'\"o': 'ö', r'\"u': 'ü', r'\"a': 'ä',
-        r'\"O': 'Ö', r'\"U': 'Ü', r'\"A': 'Ä'
-    }
-    
-    # LaTeX 특수 문자를 정규표현식 패턴으로 변환
-    for latex, char in latex_chars.items():
-        pattern = re.escape(latex)
-        value = re.sub(pattern, char, value)
-    
-    # 중괄호로 감싸진 LaTeX 명령어 처리
-    value = re.sub(r'\\[a-zA-Z]+{([^}]*)}', r'\1', value)
-    value = re.sub(r'\\[a-zA-Z]+', '', value)
-    
-    # 남은 중괄호 제거
-    value = re.sub(r'{|}', '', value)
-    
-    return value.strip() if value.strip() else None
-
-def extract_field_value(content, field_name):
-    """BibTeX 필드 값을 추출하는 함수"""
-    pattern = rf'{field_name}\s*=\s*(?:{{((?:[^{{}}]|{{[^{{}}]*}})*?)}}|"([^"]*)"|((?:[^,}}]|}}(?!,))*)),?'
-    match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-    if match:
-        value = next(v for v in match.groups() if v is not None)
-        return clean_bibtex_value(value)
-    return None
+
+    value = str(value)
+    if len(value) <= _CACHEABLE_LENGTH:
+        return _decode_latex_cached(value)
+    return _decode_latex(value)
+
+# 엔트리 시작(@type{), 중괄호, 필드 이름 패턴은 import 시 한 번만 컴파일
+_ENTRY_START = re.compile(r'@(\w+)\s*{')
+_BRACE = re.compile(r'[{}]')
+_BRACE_OR_QUOTE = re.compile(r'[{}"]')
+_FIELD_NAME = re.compile(r'\s*([\w-]+)\s*=\s*')
+
+IMPORTANT_FIELDS = ['title', 'author', 'year', 'booktitle', 'journal',
+                    'publisher', 'address', 'pages', 'doi', 'url',
+                    'abstract', 'keywords', 'document_type']
+
+def iter_bibtex_entries(lines):
+    """줄 단위 입력에서 (엔트리 타입, 본문) 쌍을 하나씩 생성하는 함수
+
+    중괄호 깊이를 추적하므로 엔트리 전체를 한 번만 읽으며,
+    파일 전체를 메모리에 올리지 않습니다.
+    """
+    entry_type = None
+    depth = 0
+    buf = []
+
+    for line in lines:
+        pos = 0
+        while pos <= len(line):
+            if entry_type is None:
+                # 엔트리 바깥의 % 주석 제거
+                comment = line.find('%', pos)
+                search_end = comment if comment != -1 else len(line)
+                match = _ENTRY_START.search(line, pos, search_end)
+                if not match:
+                    break
+                entry_type = match.group(1).lower()
+                depth = 1
+                buf = []
+                pos = match.end()
+
+            for brace in _BRACE.finditer(line, pos):
+                depth += 1 if brace.group() == '{' else -1
+                if depth == 0:
+                    buf.append(line[pos:brace.start()])
+                    yield entry_type, ''.join(buf)
+                    entry_type = None
+                    pos = brace.end()
+                    break
+            else:
+                buf.append(line[pos:])
+                break
+
+    # 닫히지 않은 마지막 엔트리도 기존과 같이 레코드로 처리
+    if entry_type is not None:
+        yield entry_type, ''.join(buf)
+
+def _scan_value(body, pos):
+    """pos 위치의 필드 값을 읽어 (원시 값, 다음 위치)를 반환하는 함수"""
+    if pos >= len(body):
+        return '', pos
+
+    opener = body[pos]
+    if opener in '{"':
+        depth = 0
+        pattern = _BRACE if opener == '{' else _BRACE_OR_QUOTE
+        for token in pattern.finditer(body, pos + 1 if opener == '"' else pos):
+            char = token.group()
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0 and opener == '{':
+                    return body[pos + 1:token.start()], token.end()
+            elif depth == 0:
+                return body[pos + 1:token.start()], token.end()
+        return body[pos + 1:], len(body)
+
+    # 중괄호나 따옴표 없는 값 (숫자, 매크로 등)
+    end = body.find(',', pos)
+    if end == -1:
+        end = len(body)
+    return body[pos:end].strip(), end
+
+def parse_bibtex_entry(record_type, body):
+    """엔트리 본문을 한 번 훑어 레코드 딕셔너리로 변환하는 함수"""
+    # cite_key 추출
+    cite_key, _, rest = body.partition(',')
+
+    # 모든 필드를 한 번에 수집 (같은 필드는 처음 값 사용)
+    fields = {}
+    pos = 0
+    while pos < len(rest):
+        match = _FIELD_NAME.match(rest, pos)
+        if not match:
+            next_comma = rest.find(',', pos)
+            if next_comma == -1:
+                break
+            pos = next_comma + 1
+            continue
+
+        key = match.group(1).lower()
+        raw, pos = _scan_value(rest, match.end())
+        if key not in fields:
+            fields[key] = raw
+
+        next_comma = rest.find(',', pos)
+        if next_comma == -1:
+            break
+        pos = next_comma + 1
+
+    record = {'cite_key': cite_key.strip()}
+
+    # 중요 필드 먼저 추가
+    for field in IMPORTANT_FIELDS:
+        if field in fields:
+            value = clean_bibtex_value(fields[field])
+            if value:
+                record[field] = value
+
+    # 엔트리 타입을 document_type으로 매핑
+    record['document_type'] = record_type
+
+    # 나머지 필드 추가
+    for key, raw in fields.items():
+        if key not in IMPORTANT_FIELDS and key not in record:
+            value = clean_bibtex_value(raw)
+            if value:
+                record[key] = value
+
+    return record
+
+def iter_bibtex_records(file_path):
+    """BibTeX 파일을 스트리밍으로 읽어 레코드를 하나씩 생성하는 함수"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        for record_type, body in iter_bibtex_entries(f):
+            yield parse_bibtex_entry(record_type, body)
+
+def read_bibtex_records(file_path):
+    """BibTeX 파일을 필드별 열(RecordColumns)로 읽는 함수
+
+    레코드 딕셔너리를 목록에 쌓지 않으므로 레코드가 많아도 메모리를 적게 씁니다.
+    """
+    return RecordColumns().extend(iter_bibtex_records(file_path))
 
 def process_bibtex_file(file_path):
     """BibTeX 파일을 처리하는 함수"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        return list(iter_bibtex_records(file_path))
     except Exception as e:
         print(f"파일 읽기 오류: {e}")
         return []
 
-    # 주석 제거
-    content = re.sub(r'%.*$', '', content, flags=re.MULTILINE)
-    
-    # 레코드 분리
-    records = []
-    entries = re.split(r'@(\w+)\s*{', content)[1:]  # 첫 번째 빈 문자열 제외
-    
-    for i in range(0, len(entries), 2):
-        if i + 1 >= len(entries):
-            break
-            
-        record_type = entries[i].lower()
-        entry_content = entries[i + 1]
-        
-        # cite_key 추출
-        cite_key = entry_content.split(',', 1)[0].strip()
-        
-        # 필드 파싱
-        record = {
-            'type': record_type,
-            'cite_key': cite_key
-        }
-        
-        # 중요 필드 먼저 추출
-        important_fields = ['title', 'author', 'year', 'booktitle', 'journal', 
-                          'publisher', 'address', 'pages', 'doi', 'url', 
-                          'abstract', 'keywords', 'document_type']
-        
-        for field in important_fields:
-            value = extract_field_value(entry_content, field)
-            if value:
-                record[field] = value
-        
-        # type 필드를 document_type으로 매핑
-        if 'type' in record:
-            record['document_type'] = record['type']
-            del record['type']
-        
-        # 나머지 필드 추출
-        other_fields = re.findall(r'(\w+)\s*=\s*({[^}]*}|"[^"]*"|[^,}]+),?', entry_content)
-        for key, value in other_fields:
-            key = key.strip().lower()
-            if key not in important_fields and key not in record:
-                value = clean_bibtex_value(value)
-                if value:
-                    record[key] = value
-        
-        records.append(record)
-    
-    return records
-
 def main():
     try:
         # 현재 디렉토리에서 BibTeX 파일 찾기
@@ -120,12 +256,12 @@ def main():
             
         print(f"BibTeX 파일 처리 중: {bib_file}")
         
-        # BibTeX 파일 처리
-        records = process_bibtex_file(bib_file)
+        # BibTeX 파일 처리 (레코드 목록 대신 필드별 열로 모음)
+        records = read_bibtex_records(bib_file)
         
         if records:
-            # DataFrame으로 변환
-            df = pd.DataFrame(records)
+            # DataFrame으로 변환 (연도는 정수, 문서 유형/출판사/학회명은 category)
+            df = records.to_frame()
             
             # 중요 컬럼 순서 지정
             important_columns = ['type', 'cite_key', 'title', 'author', 'year', 
@@ -149,7 +285,7 @@ def main():
             # CSV 저장
             df.to_csv(output_csv, index=False, encoding="utf-8-sig")
             print(f"\nBibTeX 파일이 CSV로 변환되었습니다: {output_csv}")
-            print(f"처리된 레코드 수: {len(records)}")
+            print(f"처리된 레코드 수: {len(df)}")
             print("\n컬럼 목록:")
             print(df.columns.tolist())
             print("\n중요 필드 통계:")
@@ -0,0 +1,318 @@
+import pandas as pd
+import numpy as np
+import os
+import re
+import logging
+import argparse
+
+from papers_dataset import format_of, latest_dataset, read_dataset, save_papers
+
+# MinHash/LSH 설정: 32개 해시를 4개씩 8개 밴드로 나눔
+# (Jaccard 0.8인 제목 쌍이 후보가 될 확률 약 98%)
+NUM_PERM = 32
+BANDS = 8
+SHINGLE_SIZE = 4
+SIGNATURE_BATCH = 20000
+
+# 서명 일치율이 threshold ± ESTIMATE_MARGIN 밖이면 정확한 Jaccard 계산 생략
+ESTIMATE_MARGIN = 0.15
+
+# DOI 없이 제목으로 합칠 때 허용하는 연도 차이 (출판 전 공개본과 출판본 등)
+MAX_YEAR_GAP = 1
+
+# 이 단어 수보다 짧거나 흔한 제목(사설, 서문 등)은 같은 해일 때만 제목으로 합침
+MIN_TITLE_WORDS = 3
+GENERIC_TITLES = frozenset({
+    'editorial', 'guest editorial', 'preface', 'foreword', 'introduction', 'conclusion',
+    'erratum', 'corrigendum', 'retraction', 'index', 'author index', 'front matter',
+    'back matter', 'table of contents', 'contents', 'book review', 'book reviews',
+    'keynote', 'keynote address', 'letter to the editor', 'editor s note', 'in memoriam',
+})
+
+# 번호 토큰: 숫자와 로마 숫자(xxxix까지). 이 토큰이 다르면 (Part I/II,
+# ... in 2019/2021) 제목이 비슷해도 다른 논문
+_NUMBER_TOKEN = re.compile(r'\b(?:\d+|x{0,3}(?:ix|iv|v?i{1,3}|v)|x{1,3})\b')
+
+# 해시 함수 계수 상한 (곱셈은 uint64 범위에서 자연스럽게 순환)
+_HASH_BOUND = np.uint64((1 << 61) - 1)
+
+def normalize_doi(doi):
+    """DOI 시리즈 정규화 (소문자, doi.org 접두어 제거)"""
+    doi = doi.astype('string').str.strip().str.lower()
+    doi = doi.str.replace(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', '', regex=True)
+    return doi.replace('', pd.NA)
+
+def normalize_title(title):
+    """제목 시리즈 정규화 (소문자, 영숫자 외 문자 제거, 공백 정리)"""
+    title = title.astype('string').str.lower()
+    title = title.str.replace(r'[^\w\s]', ' ', regex=True)
+    title = title.str.replace(r'\s+', ' ', regex=True).str.strip()
+    return title.replace('', pd.NA)
+
+def _number_tokens(title):
+    """정규화한 제목의 번호 토큰 (순서대로)"""
+    return tuple(_NUMBER_TOKEN.findall(title))
+
+def _is_generic(title):
+    """짧거나 흔한 제목인지 (정규화한 제목 기준)"""
+    return title in GENERIC_TITLES or len(title.split()) < MIN_TITLE_WORDS
+
+def _shingles(title):
+    """제목의 바이트 n-gram 집합 (MinHash와 같은 단위)"""
+    data = title.encode('utf-8').ljust(SHINGLE_SIZE)
+    return {data[i:i + SHINGLE_SIZE] for i in range(len(data) - SHINGLE_SIZE + 1)}
+
+def _jaccard(a, b):
+    """두 제목의 n-gram Jaccard 유사도"""
+    a, b = _shingles(a), _shingles(b)
+    return len(a & b) / len(a | b)
+
+def _gram_hashes(titles):
+    """제목 목록의 바이트 n-gram 해시를 (평탄화 배열, 제목별 시작 위치)로 반환"""
+    encoded = [t.encode('utf-8').ljust(SHINGLE_SIZE) for t in titles]
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint64)
+
+    # 위치 p에서 시작하는 n-gram을 하나의 정수로 묶음
+    grams = np.zeros(len(data) - SHINGLE_SIZE + 1, dtype=np.uint64)
+    for k in range(SHINGLE_SIZE):
+        grams = (grams << np.uint64(8)) | data[k:len(data) - SHINGLE_SIZE + 1 + k]
+
+    # 제목 경계를 넘는 n-gram 제외
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(titles)), lengths)[:len(grams)]
+    grams = grams[np.arange(len(grams)) + SHINGLE_SIZE <= ends[owner]]
+
+    # splitmix64 방식으로 비트를 섞음
+    grams = (grams ^ (grams >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    grams = (grams ^ (grams >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    grams ^= grams >> np.uint64(31)
+
+    counts = lengths - SHINGLE_SIZE + 1
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return grams, offsets
+
+def minhash_signatures(titles, num_perm=NUM_PERM, seed=42):
+    """제목 목록의 MinHash 서명 행렬 (len(titles) x num_perm)"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _HASH_BOUND, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, _HASH_BOUND, size=num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(titles), num_perm), dtype=np.uint64)
+    for start in range(0, len(titles), SIGNATURE_BATCH):
+        batch = titles[start:start + SIGNATURE_BATCH]
+        grams, offsets = _gram_hashes(batch)
+        # 해시 함수마다 모든 n-gram에 한 번에 적용한 뒤 제목별 최솟값
+        for k in range(num_perm):
+            signatures[start:start + len(batch), k] = np.minimum.reduceat(grams * a[k] + b[k], offsets)
+    return signatures
+
+def lsh_candidate_pairs(signatures, bands=BANDS):
+    """같은 LSH 버킷에 들어간 후보 쌍을 (left, right) 배열로 반환 (left < right)"""
+    rows = signatures.shape[1] // bands
+    lefts, rights = [], []
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, bucket = np.unique(keys, return_inverse=True)
+        order = np.argsort(bucket, kind='stable')
+        same = bucket[order[1:]] == bucket[order[:-1]]
+        # 버킷 안에서 이웃한 항목끼리만 연결 (union-find로 전이됨)
+        lefts.append(order[:-1][same])
+        rights.append(order[1:][same])
+
+    left = np.concatenate(lefts)
+    right = np.concatenate(rights)
+    pairs = np.unique(np.minimum(left, right) * len(signatures) + np.maximum(left, right))
+    return pairs // len(signatures), pairs % len(signatures)
+
+class _UnionFind:
+    """정수 인덱스용 union-find (작은 인덱스가 대표)
+
+    labels(정수 코드, 없으면 -1)를 주면 대표마다 묶음 안의 라벨을 기록하고,
+    서로 다른 라벨을 가진 두 묶음은 합치지 않습니다. 그래서 DOI가 없는
+    레코드를 사이에 두고도 DOI가 다른 논문이 전이적으로 합쳐지지 않습니다.
+    years(정수 연도, 없으면 -1)를 주면 묶음마다 연도 범위를 기록해
+    union의 max_gap 검사에 씁니다.
+    """
+
+    def __init__(self, size, labels=None, years=None):
+        self.parent = list(range(size))
+        self.labels = list(labels) if labels is not None else [-1] * size
+        years = years if years is not None else [-1] * size
+        self.years = [(year, year) if year >= 0 else None for year in years]
+
+    def find(self, x):
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, x, y, max_gap=None):
+        """두 묶음을 합치고 합쳤는지 반환
+
+        라벨이 충돌하거나, max_gap을 줬을 때 합친 연도 범위가 max_gap과
+        두 묶음의 원래 범위보다 넓어지면 합치지 않고 False를 반환합니다.
+        (2019, 2020, 2021이 차례로 이어지는 식의 전이적 병합 방지)
+        """
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return True
+        label_x, label_y = self.labels[x], self.labels[y]
+        if label_x >= 0 and label_y >= 0 and label_x != label_y:
+            return False
+        years_x, years_y = self.years[x], self.years[y]
+        years = years_x or years_y
+        if years_x and years_y:
+            years = (min(years_x[0], years_y[0]), max(years_x[1], years_y[1]))
+            if max_gap is not None and years[1] - years[0] > max(
+                    max_gap, years_x[1] - years_x[0], years_y[1] - years_y[0]):
+                return False
+        if y < x:
+            x, y = y, x
+        self.parent[y] = x
+        self.labels[x] = max(label_x, label_y)
+        self.years[x] = years
+        return True
+
+def deduplicate_papers(df, threshold=0.8):
+    """중복 논문을 합쳐 (대표 레코드 DataFrame, 병합 맵)을 반환
+
+    1. 정규화한 DOI가 같으면 같은 논문
+    2. 정규화한 제목이 같거나, MinHash/LSH로 찾은 후보 중 n-gram Jaccard
+       유사도가 threshold 이상이면 같은 논문. 단, DOI가 서로 다르거나,
+       연도가 MAX_YEAR_GAP보다 차이 나거나, 번호 토큰(Part I/II, 연도
+       등)이 다르면 제외하고, 짧거나 흔한 제목은 연도가 같을 때만 합침
+
+    병합 맵은 canonical_index, source_index, source, reason 컬럼을 가지며
+    중복으로 합쳐진 원본 행마다 한 줄씩 기록됩니다.
+    """
+    df = df.reset_index(drop=True)
+    n = len(df)
+    index = pd.Series(np.arange(n))
+    doi = normalize_doi(df['doi']) if 'doi' in df.columns else pd.Series(pd.NA, index=index.index, dtype='string')
+    title = normalize_title(df['title']) if 'title' in df.columns else pd.Series(pd.NA, index=index.index, dtype='string')
+    # 묶음마다 DOI를 기록해 DOI가 다른 논문끼리는 (전이적으로도) 합치지 않음
+    doi_codes = pd.factorize(doi)[0]
+    years = pd.to_numeric(df['year'], errors='coerce') if 'year' in df.columns else pd.Series(np.nan, index=index.index)
+    years = years.where(years.notna() & (years % 1 == 0), -1).astype('int64').to_numpy()
+    uf = _UnionFind(n, doi_codes.tolist(), years.tolist())
+
+    # 1. DOI 기준 병합
+    has_doi = doi.notna()
+    first_by_doi = index[has_doi].groupby(doi[has_doi]).transform('min')
+    for i, first in zip(first_by_doi.index.tolist(), first_by_doi.tolist()):
+        if i != first:
+            uf.union(first, i)
+
+    # 2. 정규화한 제목 단위로 묶은 뒤 대표 제목끼리 LSH 비교
+    has_title = title.notna()
+    title_codes, unique_titles = pd.factorize(title[has_title])
+    title_rows = index[has_title].to_numpy()
+
+    # 같은 제목을 가진 행끼리 병합 (DOI가 둘 다 있고 서로 다르거나 연도가 멀면 union이 거부)
+    # 흔한 제목은 같은 해인 행끼리만 합치므로 묶음 첫 행 대신 같은 해의 첫 행에 연결
+    unique_titles = list(unique_titles)
+    generic = np.array([_is_generic(t) for t in unique_titles], dtype=bool)
+    row_generic = generic[title_codes]
+    first_by_title = index[has_title].groupby(title_codes).transform('min').to_numpy()
+    title_years = years[title_rows]
+    first_by_title_year = index[has_title].groupby([title_codes, title_years]).transform('min').to_numpy()
+    for i, first, first_same_year, is_generic, year in zip(
+            title_rows.tolist(), first_by_title.tolist(), first_by_title_year.tolist(),
+            row_generic.tolist(), title_years.tolist()):
+        if is_generic:
+            if year >= 0 and i != first_same_year:
+                uf.union(first_same_year, i, max_gap=0)
+        elif i != first:
+            uf.union(first, i, max_gap=MAX_YEAR_GAP)
+
+    representative = pd.Series(title_rows).groupby(title_codes).min().to_numpy()
+    if len(unique_titles) > 1:
+        signatures = minhash_signatures(unique_titles)
+        left, right = lsh_candidate_pairs(signatures)
+
+        # 서명 일치율(추정 Jaccard)로 후보를 먼저 거르고 대표의 DOI가 다른 쌍 제외
+        estimate = (signatures[left] == signatures[right]).mean(axis=1)
+        representative_dois = doi_codes[representative]
+        conflict = (representative_dois[left] >= 0) & (representative_dois[right] >= 0) & \
+            (representative_dois[left] != representative_dois[right])
+        keep = (estimate >= threshold - ESTIMATE_MARGIN) & ~conflict
+        left, right, estimate = left[keep], right[keep], estimate[keep]
+
+        # 추정치가 확실히 높은 쌍만 바로 병합하고 나머지는 정확한 Jaccard로 확인
+        # (번호 토큰이 다르면 제외, 흔한 제목이 끼면 같은 해일 때만)
+        numbers = {}
+        for a, b, est in zip(left.tolist(), right.tolist(), estimate.tolist()):
+            for t in (a, b):
+                if t not in numbers:
+                    numbers[t] = _number_tokens(unique_titles[t])
+            if numbers[a] != numbers[b]:
+                continue
+            if est >= threshold + ESTIMATE_MARGIN or \
+                    _jaccard(unique_titles[a], unique_titles[b]) >= threshold:
+                if generic[a] or generic[b]:
+                    if years[representative[a]] >= 0 and years[representative[b]] >= 0:
+                        uf.union(representative[a], representative[b], max_gap=0)
+                else:
+                    uf.union(representative[a], representative[b], max_gap=MAX_YEAR_GAP)
+
+    canonical = pd.Series([uf.find(i) for i in range(n)])
+
+    # 병합 맵 기록
+    merged = canonical != index
+    merge_map = pd.DataFrame({
+        'canonical_index': canonical[merged].to_numpy(),
+        'source_index': index[merged].to_numpy(),
+    })
+    if 'source' in df.columns:
+        merge_map['source'] = df['source'][merged].to_numpy()
+    source_rows = merge_map['source_index'].to_numpy()
+    canonical_rows = merge_map['canonical_index'].to_numpy()
+    doi_array = doi.fillna('').to_numpy(dtype=object)
+    title_array = title.fillna('').to_numpy(dtype=object)
+    same_doi = (doi_array[source_rows] == doi_array[canonical_rows]) & (doi_array[source_rows] != '')
+    same_title = title_array[source_rows] == title_array[canonical_rows]
+    merge_map['reason'] = np.select([same_doi, same_title], ['doi', 'title'], default='fuzzy_title')
+
+    # 대표 레코드의 빈 값은 중복 레코드의 값으로 채움
+    deduped = df.groupby(canonical.to_numpy(), sort=True).first()
+    deduped.index.name = None
+    return deduped, merge_map
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='여러 데이터베이스에서 들어온 중복 논문 병합')
+    parser.add_argument('--output-dir', default='output')
+    args = parser.parse_args()
+
+    # 최신 papers 데이터셋 찾기
+    output_dir = args.output_dir
+    try:
+        input_file = latest_dataset(output_dir)
+    except FileNotFoundError as e:
+        logging.error(str(e))
+        return
+    papers_df = read_dataset(input_file)
+
+    deduped, merge_map = deduplicate_papers(papers_df)
+
+    # 입력과 같은 형식으로 저장하고 최신 데이터셋으로 지정
+    output_file = save_papers(deduped, output_dir, format_of(input_file))
+    name = os.path.splitext(os.path.basename(output_file))[0].replace('papers_', 'merge_map_', 1)
+    merge_map_file = os.path.join(output_dir, f"{name}.csv")
+    merge_map.to_csv(merge_map_file, index=False, encoding='utf-8')
+
+    logging.info(f"중복 제거 완료: {len(papers_df)} -> {len(deduped)}개 레코드")
+    logging.info(f"- 결과 파일: {output_file}")
+    logging.info(f"- 병합 맵: {merge_map_file}")
+
+if __name__ == "__main__":
+    main()
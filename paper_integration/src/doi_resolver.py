@@ -0,0 +1,259 @@
+import re
+import sqlite3
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urljoin, urlparse
+
+from paper_metrics import metrics
+from rate_limiter import HostRateLimiter
+
+DOI_BASE_URL = 'https://doi.org/'
+
+# 캐시 기본값: 30일, 최대 20만 개
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 200000
+
+# 해석에 실패한 DOI를 다시 묻지 않는 기간 (1일)
+DEFAULT_NEGATIVE_TTL = 24 * 3600
+
+# 직접 따라가는 리다이렉트 최대 횟수 (requests 기본값과 같음)
+MAX_REDIRECTS = 30
+
+# 랜딩 페이지에서 읽을 최대 크기 (citation_pdf_url 메타 태그 탐색용)
+LANDING_PAGE_LIMIT = 256 * 1024
+
+# 학습 규칙에서 논문 식별자로 인정할 최소 길이 (우연한 일치 방지)
+MIN_IDENTIFIER_LENGTH = 4
+
+# 잘 알려진 출판사의 랜딩 URL -> PDF URL 규칙 (호스트, 정규식, 치환 문자열)
+PUBLISHER_RULES = [
+    ('dl.acm.org', re.compile(r'^https?://dl\.acm\.org/doi/(?:abs/|full/)?(10\..+)$'),
+     r'https://dl.acm.org/doi/pdf/\1'),
+    ('ieeexplore.ieee.org', re.compile(r'^https?://ieeexplore\.ieee\.org/(?:abstract/)?document/(\d+)/?$'),
+     r'https://ieeexplore.ieee.org/stampPDF/getPDF.jsp?tp=&arnumber=\1'),
+    ('link.springer.com', re.compile(r'^https?://link\.springer\.com/(?:article|chapter)/(10\..+)$'),
+     r'https://link.springer.com/content/pdf/\1.pdf'),
+    ('arxiv.org', re.compile(r'^https?://arxiv\.org/abs/(.+)$'),
+     r'https://arxiv.org/pdf/\1'),
+    ('onlinelibrary.wiley.com', re.compile(r'^https?://onlinelibrary\.wiley\.com/doi/(?:abs/|full/)?(10\..+)$'),
+     r'https://onlinelibrary.wiley.com/doi/pdf/\1'),
+    ('www.tandfonline.com', re.compile(r'^https?://www\.tandfonline\.com/doi/(?:abs/|full/)?(10\..+)$'),
+     r'https://www.tandfonline.com/doi/pdf/\1'),
+    ('www.mdpi.com', re.compile(r'^(https?://www\.mdpi\.com/[\d-]+/\d+/\d+/\d+)/?$'),
+     r'\1/pdf'),
+]
+
+_CITATION_PDF_URL = re.compile(
+    rb'<meta[^>]+name=["\']citation_pdf_url["\'][^>]+content=["\']([^"\']+)["\']'
+    rb'|<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']citation_pdf_url["\']',
+    re.IGNORECASE)
+
+def learn_rule(landing_url, pdf_url):
+    """랜딩 URL과 PDF URL 한 쌍에서 (랜딩 접두어, PDF 템플릿) 규칙 추출
+
+    랜딩 URL 경로의 뒷부분 중 PDF URL에도 들어 있는 가장 긴 부분을
+    논문 식별자로 보고, 나머지를 같은 호스트의 다른 논문에도 적용합니다.
+    접두어에는 경로가 한 단계 이상 있어야 합니다 ('https://host/'만으로는
+    호스트의 모든 페이지에 맞으므로 규칙으로 쓰지 않음).
+    """
+    parts = landing_url.rstrip('/').split('/')
+    # parts[:3]은 'https:', '', 호스트
+    for start in range(4, len(parts)):
+        identifier = '/'.join(parts[start:])
+        if len(identifier) >= MIN_IDENTIFIER_LENGTH and identifier in pdf_url:
+            prefix = '/'.join(parts[:start]) + '/'
+            return prefix, pdf_url.replace(identifier, '{id}', 1)
+    return None
+
+class DOIResolver:
+    """DOI -> 랜딩 URL -> 직접 PDF URL 변환기 (SQLite 캐시 포함)
+
+    결과는 TTL과 최대 항목 수가 있는 캐시에 저장되어 다운로더,
+    URL 목록 생성기, papers_urls가 함께 사용합니다. 해석에 실패한 DOI도
+    (URL 없이) 더 짧은 negative_ttl 동안 저장해 매번 다시 묻지 않습니다.
+    규칙이 없는 출판사는 랜딩 페이지의 citation_pdf_url로 규칙을 배워
+    저장합니다. 리다이렉트는 직접 따라가며 요청마다 rate_limiter로 그
+    호스트의 속도 제한을 지키므로, 다운로더의 제한기를 넘겨 함께 씁니다.
+    """
+
+    def __init__(self, cache_path, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES,
+                 session=None, rate_limiter=None, max_workers=8, timeout=30,
+                 base_url=DOI_BASE_URL, negative_ttl=DEFAULT_NEGATIVE_TTL):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.session = session
+        self.rate_limiter = rate_limiter or HostRateLimiter(0)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.base_url = base_url
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS resolutions (
+                doi TEXT PRIMARY KEY,
+                landing_url TEXT,
+                pdf_url TEXT,
+                resolved_at REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS rules (
+                host TEXT NOT NULL,
+                landing_prefix TEXT NOT NULL,
+                pdf_template TEXT NOT NULL,
+                PRIMARY KEY (host, landing_prefix)
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS resolutions_age ON resolutions (resolved_at)')
+        self.conn.commit()
+        self.learned_rules = {}
+        for host, prefix, template in self.conn.execute('SELECT host, landing_prefix, pdf_template FROM rules'):
+            self.learned_rules.setdefault(host, []).append((prefix, template))
+
+    def cached(self, dois):
+        """캐시에 있는 (만료되지 않은) 결과만 {doi: (landing_url, pdf_url)}로 반환"""
+        return self._cached(dois)[0]
+
+    def _cached(self, dois):
+        """캐시 조회 -> ({doi: (landing_url, pdf_url)}, 실패로 기록된 DOI 집합)"""
+        dois = list(dict.fromkeys(dois))
+        found, failed = {}, set()
+        now = time.time()
+        with self.lock:
+            # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+            for start in range(0, len(dois), 500):
+                batch = dois[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT doi, landing_url, pdf_url FROM resolutions "
+                    f"WHERE resolved_at >= CASE WHEN landing_url IS NULL THEN ? ELSE ? END "
+                    f"AND doi IN ({', '.join('?' * len(batch))})",
+                    [now - self.negative_ttl, now - self.ttl, *batch]).fetchall()
+                for doi, landing, pdf in rows:
+                    if landing is None:
+                        failed.add(doi)
+                    else:
+                        found[doi] = (landing, pdf)
+        return found, failed
+
+    def resolve_many(self, dois):
+        """여러 DOI를 캐시 확인 후 나머지만 동시에 해석 -> {doi: (landing_url, pdf_url)}
+
+        해석하지 못한 DOI는 결과에 없습니다 (negative_ttl 동안은 다시 묻지 않음).
+        """
+        dois = list(dict.fromkeys(doi for doi in dois if doi))
+        results, failed = self._cached(dois)
+        missing = [doi for doi in dois if doi not in results and doi not in failed]
+        metrics.inc('doi_cache_total', len(results) + len(failed), result='hit')
+        metrics.inc('doi_cache_total', len(missing), result='miss')
+        if missing:
+            if self.session is None:
+                # 캐시만 조회할 때는 requests를 import하지 않도록 실제로 해석할 때 세션 생성
+                import requests
+                self.session = requests.Session()
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for doi, resolved in zip(missing, executor.map(self._resolve, missing)):
+                    if resolved is not None:
+                        results[doi] = resolved
+            # 실패는 (None, None)으로 저장
+            self._store({doi: results.get(doi, (None, None)) for doi in missing})
+        return results
+
+    def resolve(self, doi):
+        """DOI 하나 해석 -> (landing_url, pdf_url) 또는 None"""
+        return self.resolve_many([doi]).get(doi)
+
+    def pdf_url_for(self, landing_url):
+        """랜딩 URL에 출판사 규칙(고정 또는 학습)을 적용한 PDF URL"""
+        host = urlparse(landing_url).netloc.lower()
+        for rule_host, pattern, replacement in PUBLISHER_RULES:
+            if host == rule_host:
+                match = pattern.match(landing_url)
+                if match:
+                    return match.expand(replacement)
+        for prefix, template in self.learned_rules.get(host, ()):
+            if landing_url.startswith(prefix):
+                return template.replace('{id}', landing_url[len(prefix):].rstrip('/'))
+        return None
+
+    def _follow(self, url):
+        """리다이렉트를 직접 따라가 마지막 응답 반환 (요청마다 그 호스트의 속도 제한)"""
+        for _ in range(MAX_REDIRECTS + 1):
+            self.rate_limiter.acquire(url)
+            response = self.session.get(url, allow_redirects=False, stream=True, timeout=self.timeout)
+            if not response.is_redirect:
+                return response
+            url = urljoin(url, response.headers['Location'])
+            response.close()
+        raise RuntimeError(f"리다이렉트가 {MAX_REDIRECTS}번을 넘음")
+
+    def _resolve(self, doi):
+        """doi.org 리다이렉트를 따라가 랜딩/PDF URL을 찾기"""
+        # DOI에는 #, ?, ; 등이 들어갈 수 있으므로 경로로 인코딩
+        url = urljoin(self.base_url, quote(doi, safe='/'))
+        try:
+            with metrics.timer('doi_resolve_seconds'), self._follow(url) as response:
+                response.raise_for_status()
+                landing_url = response.url
+                if 'pdf' in response.headers.get('Content-Type', '').lower():
+                    metrics.inc('doi_resolve_total', result='pdf')
+                    return landing_url, landing_url
+
+                pdf_url = self.pdf_url_for(landing_url)
+                if pdf_url is None:
+                    pdf_url = self._learn_from_landing_page(landing_url, response)
+                metrics.inc('doi_resolve_total', result='pdf' if pdf_url else 'landing')
+                return landing_url, pdf_url
+        except Exception as e:
+            metrics.inc('doi_resolve_total', result='failed')
+            logging.warning(f"DOI 해석 실패: {doi} - {str(e)}")
+            return None
+
+    def _learn_from_landing_page(self, landing_url, response):
+        """랜딩 페이지의 citation_pdf_url 메타 태그로 PDF URL을 찾고 규칙 학습"""
+        head = b''
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            head += chunk
+            match = _CITATION_PDF_URL.search(head)
+            if match or len(head) >= LANDING_PAGE_LIMIT:
+                break
+        else:
+            match = _CITATION_PDF_URL.search(head)
+        if not match:
+            return None
+
+        pdf_url = urljoin(landing_url, (match.group(1) or match.group(2)).decode('utf-8', 'replace'))
+        rule = learn_rule(landing_url, pdf_url)
+        if rule is not None:
+            host = urlparse(landing_url).netloc.lower()
+            with self.lock:
+                if rule not in self.learned_rules.get(host, []):
+                    self.learned_rules.setdefault(host, []).append(rule)
+                    self.conn.execute('INSERT OR REPLACE INTO rules VALUES (?, ?, ?)', (host, *rule))
+                    self.conn.commit()
+        return pdf_url
+
+    def _store(self, resolved):
+        """해석 결과를 캐시에 저장하고 만료/초과 항목 정리"""
+        now = time.time()
+        with self.lock:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?)',
+                [(doi, landing, pdf, now) for doi, (landing, pdf) in resolved.items()])
+            self.conn.execute('DELETE FROM resolutions WHERE resolved_at < ?', (now - self.ttl,))
+            self.conn.execute('DELETE FROM resolutions WHERE landing_url IS NULL AND resolved_at < ?',
+                              (now - self.negative_ttl,))
+            # 최대 항목 수를 넘으면 오래된 것부터 제거
+            self.conn.execute('''
+                DELETE FROM resolutions WHERE doi IN (
+                    SELECT doi FROM resolutions ORDER BY resolved_at DESC LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
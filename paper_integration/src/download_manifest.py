@@ -0,0 +1,113 @@
+import sqlite3
+import threading
+import time
+
+from dedup_papers import normalize_doi, normalize_title
+
+# 다시 시도해도 소용없는 HTTP 상태 (죽은 링크)
+PERMANENT_HTTP_STATUS = {400, 401, 404, 410, 451}
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_DEAD = 'dead'
+
+_COLUMNS = ('key', 'status', 'url', 'final_url', 'http_status', 'size',
+            'sha256', 'attempts', 'last_tried', 'path', 'error')
+
+def manifest_keys(papers_df):
+    """논문별 매니페스트 키 시리즈 ('doi:...' 또는 'title:...')"""
+    doi = normalize_doi(papers_df['doi']) if 'doi' in papers_df.columns else None
+    title = normalize_title(papers_df['title'])
+    keys = 'title:' + title
+    if doi is not None:
+        keys = ('doi:' + doi).fillna(keys)
+    return keys
+
+class DownloadManifest:
+    """논문별 다운로드 상태를 저장하는 SQLite 매니페스트
+
+    키(DOI 또는 정규화한 제목)마다 상태, 최종 URL, HTTP 코드, 크기,
+    SHA-256, 시도 횟수, 마지막 시도 시각을 기록합니다. 여러 다운로드
+    스레드가 같은 인스턴스를 공유할 수 있습니다.
+    """
+
+    def __init__(self, path, max_attempts=5, retry_cooldown=3600):
+        self.path = str(path)
+        self.max_attempts = max_attempts
+        self.retry_cooldown = retry_cooldown
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS downloads (
+                key TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                url TEXT,
+                final_url TEXT,
+                http_status INTEGER,
+                size INTEGER,
+                sha256 TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_tried REAL,
+                path TEXT,
+                error TEXT
+            )
+        ''')
+        self.conn.commit()
+
+    def load(self):
+        """모든 항목을 {키: 항목 딕셔너리}로 한 번에 읽기"""
+        with self.lock:
+            rows = self.conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM downloads").fetchall()
+        return {row[0]: dict(zip(_COLUMNS, row)) for row in rows}
+
+    def decide(self, entry, now=None):
+        """항목 상태로 다음 행동 결정: 'attempt', 'done', 'cooldown', 'dead'"""
+        if entry is None:
+            return 'attempt'
+        if entry['status'] in (STATUS_DONE, STATUS_DEAD):
+            return entry['status']
+        if entry['attempts'] >= self.max_attempts:
+            return STATUS_DEAD
+
+        # 실패할수록 재시도 간격을 두 배로 늘림
+        now = time.time() if now is None else now
+        cooldown = self.retry_cooldown * 2 ** max(entry['attempts'] - 1, 0)
+        if entry['last_tried'] is not None and now - entry['last_tried'] < cooldown:
+            return 'cooldown'
+        return 'attempt'
+
+    def record(self, key, result, url=None, path=None):
+        """다운로드 결과(_download_file 반환값)를 기록"""
+        if result['ok']:
+            status = STATUS_DONE
+        elif result.get('permanent') or result.get('http_status') in PERMANENT_HTTP_STATUS:
+            status = STATUS_DEAD
+        else:
+            status = STATUS_FAILED
+
+        with self.lock:
+            self.conn.execute('''
+                INSERT INTO downloads (key, status, url, final_url, http_status, size,
+                                       sha256, attempts, last_tried, path, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    status = excluded.status,
+                    url = excluded.url,
+                    final_url = excluded.final_url,
+                    http_status = excluded.http_status,
+                    size = excluded.size,
+                    sha256 = excluded.sha256,
+                    attempts = downloads.attempts + 1,
+                    last_tried = excluded.last_tried,
+                    path = excluded.path,
+                    error = excluded.error
+            ''', (key, status, url, result.get('final_url'), result.get('http_status'),
+                  result.get('size'), result.get('sha256'), time.time(),
+                  str(path) if path is not None else None, result.get('error')))
+            self.conn.commit()
+        return status
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
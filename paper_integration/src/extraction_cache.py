@@ -0,0 +1,63 @@
+import json
+import os
+import sqlite3
+
+class ExtractionCache:
+    """PDF 추출 결과 캐시
+
+    (경로, 크기, 수정 시각, 추출기 버전)이 같으면 이전 추출 결과를
+    재사용합니다. 추출 방식이 바뀌면 버전을 올려 캐시를 무효화합니다.
+    """
+
+    def __init__(self, path, version):
+        self.version = version
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS extractions (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                result TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def get_many(self, paths):
+        """캐시가 유효한 파일의 결과만 {경로: 결과 딕셔너리}로 반환"""
+        rows = {}
+        paths = list(paths)
+        for start in range(0, len(paths), 500):
+            batch = paths[start:start + 500]
+            rows.update((row[0], row[1:]) for row in self.conn.execute(
+                f"SELECT path, size, mtime_ns, version, result FROM extractions "
+                f"WHERE path IN ({', '.join('?' * len(batch))})", batch))
+
+        found = {}
+        for path, (size, mtime_ns, version, result) in rows.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if (stat.st_size, stat.st_mtime_ns, self.version) == (size, mtime_ns, version):
+                found[path] = json.loads(result)
+        return found
+
+    def put(self, path, result):
+        """추출 결과 저장 (commit은 flush에서 한 번에)"""
+        stat = os.stat(path)
+        self.conn.execute('INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?)',
+                          (path, stat.st_size, stat.st_mtime_ns, self.version,
+                           json.dumps(result, ensure_ascii=False)))
+
+    def move(self, old_path, new_path):
+        """파일 이름이 바뀌면 캐시 항목도 새 경로로 옮김"""
+        self.conn.execute('UPDATE OR REPLACE extractions SET path = ? WHERE path = ?',
+                          (new_path, old_path))
+
+    def flush(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
@@ -0,0 +1,379 @@
+import pandas as pd
+import os
+import glob
+import json
+import hashlib
+import sqlite3
+import time
+import logging
+import argparse
+
+from convert_bib_to_csv import iter_bibtex_records
+from paper_metrics import measure_stage, metrics
+from paper_records import RecordColumns
+from papers_dataset import (DEFAULT_FORMAT, DatasetWriter, dataset_columns, dataset_extension,
+                            format_of, new_dataset_path, read_dataset, write_latest)
+
+# 한 번에 읽어 들일 행 수 (대용량 Scopus/WoS 내보내기 파일용)
+DEFAULT_CHUNK_SIZE = 50000
+
+# 원본 파일별 정규화 결과 캐시 (output_dir 아래)
+SOURCE_CACHE_DIR = '.integrate_cache'
+# 정규화 방식이 바뀌면 올려서 캐시를 무효화
+CACHE_VERSION = 1
+
+def load_config(config_path='config.json'):
+    """설정 파일 로드"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config.setdefault('source_dir', 'source')
+    config.setdefault('output_dir', 'output')
+    config.setdefault('chunk_size', DEFAULT_CHUNK_SIZE)
+    config.setdefault('dataset_format', DEFAULT_FORMAT)
+    config.setdefault('incremental', True)
+    return config
+
+def find_source_files(config):
+    """file_patterns에 맞는 (출처, 파일 경로) 목록을 반환"""
+    source_files = []
+    seen = set()
+    for source, patterns in config['file_patterns'].items():
+        for pattern in patterns:
+            for path in sorted(glob.glob(os.path.join(config['source_dir'], pattern))):
+                if path not in seen:
+                    seen.add(path)
+                    source_files.append((source, path))
+    return source_files
+
+def normalize_column_name(column):
+    """컬럼 이름을 별칭 비교용으로 정규화 ('Document_Type ' -> 'document type')"""
+    return str(column).strip().lower().replace('_', ' ')
+
+def build_column_plan(columns, paper_mapping):
+    """원본 컬럼을 paper_mapping 기준 컬럼으로 묶는 계획을 생성
+
+    반환값은 {표준 컬럼: [원본 컬럼, ...]} 이며, 여러 원본 컬럼이 있으면
+    별칭 순서대로 앞의 값이 비어 있을 때 뒤의 값을 사용합니다.
+    """
+    normalized = {}
+    for column in columns:
+        normalized.setdefault(normalize_column_name(column), column)
+
+    plan = {}
+    for target, aliases in paper_mapping.items():
+        present = [normalized[alias] for alias in aliases if alias in normalized]
+        if present:
+            plan[target] = present
+    return plan
+
+def normalize_chunk(df, plan, paper_mapping, source):
+    """원본 DataFrame 조각을 표준 컬럼으로 변환 (행 단위 반복 없음)"""
+    result = pd.DataFrame(index=df.index)
+    for target in paper_mapping:
+        columns = plan.get(target)
+        if not columns:
+            result[target] = pd.Series(pd.NA, index=df.index, dtype='string')
+        else:
+            values = df[columns[0]]
+            for column in columns[1:]:
+                values = values.fillna(df[column])
+            result[target] = values
+
+    result['source'] = source
+    return apply_types(result)
+
+def apply_types(df):
+    """통합 데이터셋의 컬럼 타입 지정"""
+    for column in df.columns:
+        if column == 'year':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        else:
+            df[column] = df[column].astype('string').str.strip().replace('', pd.NA)
+
+    if 'doi' in df.columns:
+        df['doi'] = df['doi'].str.replace(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', '',
+                                          regex=True, case=False)
+    return df
+
+def iter_source_chunks(path, chunk_size, usecols=None):
+    """원본 파일을 chunk_size 행 단위의 DataFrame으로 읽기
+
+    파싱에 걸린 시간(조각을 받아 쓰는 쪽의 시간은 빼고)과 레코드 수를
+    형식별로 source_parse_seconds, source_records_total에 기록합니다.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    chunks = _read_source_chunks(path, ext, chunk_size, usecols)
+    elapsed, records = 0.0, 0
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        elapsed += time.perf_counter() - start
+        if chunk is None:
+            break
+        records += len(chunk)
+        yield chunk
+    metrics.observe('source_parse_seconds', elapsed, format=ext.lstrip('.'))
+    metrics.inc('source_records_total', records, format=ext.lstrip('.'))
+
+def _read_source_chunks(path, ext, chunk_size, usecols):
+    if ext == '.csv':
+        yield from pd.read_csv(path, dtype=str, encoding='utf-8-sig',
+                               usecols=usecols, chunksize=chunk_size)
+    elif ext in ('.xls', '.xlsx'):
+        # 엑셀은 조각 단위 읽기를 지원하지 않으므로 한 번에 읽은 뒤 나눔
+        df = pd.read_excel(path, dtype=str, usecols=usecols)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+    elif ext == '.bib':
+        # 레코드 딕셔너리 목록 대신 필드별 열로 모음 (연도는 정수 배열)
+        # category는 normalize_chunk에서 문자열로 바뀌므로 만들지 않음
+        records = RecordColumns()
+        for record in iter_bibtex_records(path):
+            records.append(record)
+            if len(records) >= chunk_size:
+                yield records.to_frame(categories=())
+                records = RecordColumns()
+        if records:
+            yield records.to_frame(categories=())
+    else:
+        logging.warning(f"지원하지 않는 파일 형식: {path}")
+
+def iter_file_chunks(config, source, path):
+    """원본 파일 하나를 표준 컬럼 DataFrame 조각으로 생성"""
+    paper_mapping = config['paper_mapping']
+    aliases = {alias for names in paper_mapping.values() for alias in names}
+
+    def usecols(column):
+        return normalize_column_name(column) in aliases
+
+    ext = os.path.splitext(path)[1].lower()
+    for chunk in iter_source_chunks(path, config['chunk_size'],
+                                    usecols=None if ext == '.bib' else usecols):
+        plan = build_column_plan(chunk.columns, paper_mapping)
+        yield normalize_chunk(chunk, plan, paper_mapping, source)
+
+def iter_integrated_chunks(config):
+    """모든 원본 파일을 표준 컬럼 DataFrame 조각으로 생성"""
+    for source, path in find_source_files(config):
+        logging.info(f"통합 중: {path} ({source})")
+        yield from iter_file_chunks(config, source, path)
+
+def hash_file(path):
+    """원본 파일의 SHA-256 (수정 시각만 바뀐 파일을 구별하기 위해)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class SourceCache:
+    """원본 파일별 정규화 결과 캐시 (증분 통합용)
+
+    파일마다 (크기, 수정 시각, SHA-256)과 설정 서명을 기록하고 정규화한
+    레코드를 cache_dir에 데이터셋 파일로 저장합니다. 크기와 수정 시각이
+    같으면 그대로, 다르더라도 내용 해시가 같으면 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, cache_dir, fmt):
+        self.cache_dir = cache_dir
+        self.fmt = fmt
+        os.makedirs(cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite'))
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS sources (
+                path TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                cache_file TEXT NOT NULL,
+                rows INTEGER NOT NULL
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS outputs (
+                signature TEXT PRIMARY KEY,
+                path TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def cache_file(self, path):
+        name = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}{dataset_extension(self.fmt)}")
+
+    def lookup(self, source, path, signature):
+        """캐시가 유효하면 (True, 캐시 파일 경로), 아니면 (False, None)
+
+        레코드가 0개인 원본은 캐시 파일 없이 기록되므로 (True, None)입니다.
+        """
+        row = self.conn.execute(
+            'SELECT source, size, mtime_ns, sha256, signature, cache_file, rows FROM sources WHERE path = ?',
+            (path,)).fetchone()
+        if row is None or (row[0], row[4]) != (source, signature):
+            return False, None
+        cache_file = row[5]
+        if not os.path.exists(cache_file):
+            if row[6]:
+                return False, None
+            cache_file = None
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) == (row[1], row[2]):
+            return True, cache_file
+        # 수정 시각만 바뀐 경우 (복사, touch 등)
+        if stat.st_size == row[1] and hash_file(path) == row[3]:
+            self.conn.execute('UPDATE sources SET mtime_ns = ? WHERE path = ?', (stat.st_mtime_ns, path))
+            self.conn.commit()
+            return True, cache_file
+        return False, None
+
+    def store(self, source, path, signature, chunks):
+        """정규화한 조각들을 캐시 파일에 쓰고 기록 -> 캐시 파일 경로"""
+        stat = os.stat(path)
+        sha256 = hash_file(path)
+        cache_file = self.cache_file(path)
+        with DatasetWriter(cache_file) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        self.conn.execute('INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                          (path, source, stat.st_size, stat.st_mtime_ns, sha256, signature,
+                           cache_file, writer.rows))
+        self.conn.commit()
+        return cache_file if writer.columns is not None else None
+
+    def prune(self, paths):
+        """더 이상 원본 목록에 없는 파일의 캐시 삭제 -> 삭제한 개수"""
+        rows = self.conn.execute('SELECT path, cache_file FROM sources').fetchall()
+        removed = [(path, cache_file) for path, cache_file in rows if path not in paths]
+        for path, cache_file in removed:
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+            self.conn.execute('DELETE FROM sources WHERE path = ?', (path,))
+        self.conn.commit()
+        return len(removed)
+
+    def output_for(self, signature):
+        row = self.conn.execute('SELECT path FROM outputs WHERE signature = ?', (signature,)).fetchone()
+        return row[0] if row and os.path.exists(row[0]) else None
+
+    def rows_of(self, cache_files):
+        """캐시 파일들의 레코드 수 합계"""
+        rows = self.conn.execute('SELECT cache_file, rows FROM sources').fetchall()
+        cache_files = set(cache_files)
+        return sum(count for cache_file, count in rows if cache_file in cache_files)
+
+    def record_output(self, signature, path):
+        self.conn.execute('DELETE FROM outputs')
+        self.conn.execute('INSERT INTO outputs VALUES (?, ?)', (signature, path))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def config_signature(config, source):
+    """정규화 결과에 영향을 주는 설정의 서명 (바뀌면 모든 캐시 무효화)"""
+    key = json.dumps({'version': CACHE_VERSION, 'source': source,
+                      'paper_mapping': config['paper_mapping']}, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def _collect_cached_parts(config, cache):
+    """원본 파일마다 캐시를 확인해 바뀐 파일만 다시 파싱 -> (캐시 파일 목록, 다시 파싱한 수)"""
+    parts = []
+    parsed = 0
+    source_files = find_source_files(config)
+    for source, path in source_files:
+        signature = config_signature(config, source)
+        found, cache_file = cache.lookup(source, path, signature)
+        if not found:
+            logging.info(f"통합 중: {path} ({source})")
+            cache_file = cache.store(source, path, signature, iter_file_chunks(config, source, path))
+            parsed += 1
+            metrics.inc('source_files_total', source=source, result='parsed')
+        else:
+            logging.info(f"캐시 사용: {path} ({source})")
+            metrics.inc('source_files_total', source=source, result='cached')
+        if cache_file is not None:
+            parts.append(cache_file)
+
+    removed = cache.prune({path for _, path in source_files})
+    if removed:
+        logging.info(f"사라진 원본 {removed}개의 캐시 삭제")
+    return parts, parsed
+
+def _read_cached_part(path):
+    df = read_dataset(path)
+    # csv 캐시는 읽을 때 타입 정보가 사라지므로 다시 지정
+    return apply_types(df) if format_of(path) == 'csv' else df
+
+def integrate_papers(config, output_file=None, incremental=None):
+    """원본 파일들을 하나의 papers_* 데이터셋으로 통합하고 경로를 반환
+
+    형식은 config의 dataset_format(parquet, feather, csv)을 따르며,
+    output_file을 주면 확장자로 정합니다. 조각마다 바로 파일에 이어
+    쓰므로 메모리 사용량은 chunk_size에 비례합니다.
+
+    증분 모드(config의 incremental, 기본값)에서는 원본 파일별 정규화
+    결과를 output_dir/.integrate_cache에 두고 새로 생기거나 바뀐 파일만
+    다시 파싱합니다. 원본이 전혀 바뀌지 않았으면 이전 결과를 반환합니다.
+    """
+    if incremental is None:
+        incremental = config.get('incremental', True)
+    os.makedirs(config['output_dir'], exist_ok=True)
+    if output_file is None:
+        output_file = new_dataset_path(config['output_dir'], config.get('dataset_format'))
+
+    if not incremental:
+        with DatasetWriter(output_file) as writer:
+            for chunk in iter_integrated_chunks(config):
+                writer.write(chunk)
+    else:
+        cache = SourceCache(os.path.join(config['output_dir'], SOURCE_CACHE_DIR),
+                            format_of(output_file))
+        try:
+            parts, parsed = _collect_cached_parts(config, cache)
+            # 캐시 파일 목록과 각 파일의 수정 시각으로 이번 입력 전체를 식별
+            inputs = [f"{part}:{os.stat(part).st_mtime_ns}" for part in parts]
+            signature = hashlib.sha256('\n'.join(inputs).encode('utf-8')).hexdigest()
+            previous = cache.output_for(signature)
+            if parsed == 0 and previous is not None:
+                logging.info(f"바뀐 원본이 없습니다. 기존 통합 결과 사용: {previous}")
+                # 그 사이 다른 데이터셋을 저장했더라도 최신 매니페스트는 이 결과를 가리킴
+                write_latest(config['output_dir'], previous, cache.rows_of(parts), dataset_columns(previous))
+                return previous
+
+            with DatasetWriter(output_file) as writer:
+                for part in parts:
+                    writer.write(_read_cached_part(part))
+            if writer.columns is not None:
+                cache.record_output(signature, output_file)
+        finally:
+            cache.close()
+        logging.info(f"원본 {len(parts)}개 중 {parsed}개를 다시 파싱했습니다.")
+
+    if writer.columns is None:
+        logging.warning('통합할 원본 파일을 찾을 수 없습니다.')
+        return None
+
+    write_latest(config['output_dir'], output_file, writer.rows, writer.columns)
+    logging.info(f"통합 완료: {output_file} ({writer.rows}개 레코드)")
+    return output_file
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='원본 내보내기 파일 통합')
+    parser.add_argument('--full', action='store_true', help='캐시를 쓰지 않고 모든 원본을 다시 파싱')
+    args = parser.parse_args()
+
+    config = load_config()
+    with measure_stage('integrate', config['output_dir']):
+        integrate_papers(config, incremental=False if args.full else None)
+    metrics.write(config['output_dir'], 'integrate')
+
+if __name__ == "__main__":
+    main()
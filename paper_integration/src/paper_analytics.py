@@ -0,0 +1,284 @@
+import os
+import json
+import hashlib
+import logging
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from papers_dataset import ANALYTICS_COLUMNS, latest_dataset, read_dataset
+
+# 집계 형식이 바뀌면 올려서 이전 캐시를 무효화
+ANALYTICS_VERSION = 1
+
+# output_dir 안의 데이터셋 버전별 집계 캐시
+ANALYTICS_CACHE_DIR = 'analytics_cache'
+
+# 키워드 구분자 (Scopus/IEEE는 ';', BibTeX는 주로 ',')
+KEYWORD_SEPARATORS = r'\s*[;,]\s*'
+
+# 논문 하나에서 동시 출현을 셀 최대 키워드 수 (쌍 개수는 제곱으로 늘어남)
+MAX_KEYWORDS_PER_PAPER = 30
+
+def value_counts(values):
+    """빈 값을 제외한 빈도 (많은 순, 같으면 값 순)"""
+    counts = values.dropna().value_counts()
+    order = np.lexsort((counts.index.astype(str), -counts.to_numpy()))
+    return counts.iloc[order]
+
+def split_keywords(keywords):
+    """키워드 시리즈 -> (논문 위치, 키워드 코드, 키워드 목록)
+
+    키워드는 소문자로 맞추고 논문 안에서 중복을 제거합니다.
+    논문 위치는 오름차순이고, 한 논문의 키워드는 원래 순서를 따릅니다.
+    """
+    keywords = keywords.reset_index(drop=True).astype('string').str.lower()
+    exploded = keywords.str.split(KEYWORD_SEPARATORS, regex=True).explode()
+    exploded = exploded.str.strip(' .')
+    exploded = exploded[exploded.notna() & (exploded != '')]
+    pairs = pd.DataFrame({'paper': exploded.index.to_numpy(), 'keyword': exploded.to_numpy()})
+    pairs = pairs.drop_duplicates()
+    codes, vocabulary = pd.factorize(pairs['keyword'])
+    return pairs['paper'].to_numpy(dtype=np.int64), codes.astype(np.int64), np.asarray(vocabulary, dtype=object)
+
+def group_pairs(groups, codes, limit=None):
+    """같은 그룹(논문) 안의 모든 코드 쌍 -> (앞 코드 배열, 뒤 코드 배열)
+
+    groups는 오름차순이어야 하고, limit을 주면 그룹마다 앞의 limit개만
+    사용합니다 (쌍 개수는 그룹 크기의 제곱으로 늘어남).
+    """
+    if not len(groups):
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    starts = np.r_[0, np.flatnonzero(np.diff(groups)) + 1]
+    lengths = np.diff(np.r_[starts, len(groups)])
+    longest = int(lengths.max())
+    if limit is not None and longest > limit:
+        # 그룹 안에서의 순번
+        rank = np.arange(len(groups)) - np.repeat(starts, lengths)
+        keep = rank < limit
+        groups, codes = groups[keep], codes[keep]
+        longest = limit
+
+    # 같은 그룹 안에서 거리 d만큼 떨어진 쌍을 한 번에 모음
+    first, second = [], []
+    for distance in range(1, longest):
+        left = np.flatnonzero(groups[:-distance] == groups[distance:])
+        first.append(codes[left])
+        second.append(codes[left + distance])
+    if not first:
+        return np.empty(0, codes.dtype), np.empty(0, codes.dtype)
+    return np.concatenate(first), np.concatenate(second)
+
+class CooccurrenceMatrix:
+    """키워드 동시 출현 희소 행렬 (대칭, CSR)
+
+    행 i의 indices[indptr[i]:indptr[i + 1]]가 키워드 i와 같은 논문에
+    나온 키워드, counts가 그 논문 수입니다.
+    """
+
+    def __init__(self, vocabulary, indptr, indices, counts):
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.indptr = indptr
+        self.indices = indices
+        self.counts = counts
+        self._codes = None
+
+    @classmethod
+    def from_keywords(cls, papers, codes, vocabulary):
+        """split_keywords 결과로 행렬 생성"""
+        size = len(vocabulary)
+        first, second = group_pairs(papers, codes, MAX_KEYWORDS_PER_PAPER)
+        keys = np.concatenate([first * size + second, second * size + first])
+        keys, counts = np.unique(keys, return_counts=True)
+        rows, indices = np.divmod(keys, size) if size else (keys, keys)
+        indptr = np.searchsorted(rows, np.arange(size + 1))
+        return cls(vocabulary, indptr.astype(np.int64), indices.astype(np.int64), counts.astype(np.int64))
+
+    @property
+    def nnz(self):
+        return len(self.counts)
+
+    def code(self, keyword):
+        if self._codes is None:
+            self._codes = {keyword: code for code, keyword in enumerate(self.vocabulary)}
+        return self._codes.get(keyword.lower())
+
+    def neighbors(self, keyword, limit=10):
+        """keyword와 가장 자주 함께 나온 키워드 [(키워드, 논문 수)]"""
+        code = self.code(keyword)
+        if code is None:
+            return []
+        start, end = self.indptr[code], self.indptr[code + 1]
+        counts = self.counts[start:end]
+        order = np.argsort(-counts, kind='stable')[:limit]
+        return [(self.vocabulary[self.indices[start + i]], int(counts[i])) for i in order]
+
+    def top_pairs(self, limit=20):
+        """가장 자주 함께 나온 키워드 쌍 [(키워드, 키워드, 논문 수)]"""
+        rows = np.repeat(np.arange(len(self.vocabulary)), np.diff(self.indptr))
+        upper = np.flatnonzero(rows < self.indices)
+        if len(upper) > limit:
+            upper = upper[np.argpartition(-self.counts[upper], limit - 1)[:limit]]
+        upper = upper[np.argsort(-self.counts[upper], kind='stable')]
+        return [(self.vocabulary[rows[i]], self.vocabulary[self.indices[i]], int(self.counts[i]))
+                for i in upper]
+
+    def dense(self, keywords):
+        """keywords끼리의 동시 출현 수 DataFrame (히트맵용)"""
+        codes = [self.code(keyword) for keyword in keywords]
+        position = {code: i for i, code in enumerate(codes)}
+        matrix = np.zeros((len(codes), len(codes)), dtype=np.int64)
+        for i, code in enumerate(codes):
+            start, end = self.indptr[code], self.indptr[code + 1]
+            for column, count in zip(self.indices[start:end], self.counts[start:end]):
+                if column in position:
+                    matrix[i, position[column]] = count
+        return pd.DataFrame(matrix, index=keywords, columns=keywords)
+
+class PaperAnalytics:
+    """연도/학회지/출처/키워드 빈도와 키워드 동시 출현 집계"""
+
+    def __init__(self, year_counts, venue_counts, source_counts, year_source,
+                 keyword_counts, cooccurrence, papers=0, version=None):
+        self.year_counts = year_counts
+        self.venue_counts = venue_counts
+        self.source_counts = source_counts
+        self.year_source = year_source
+        self.keyword_counts = keyword_counts
+        self.cooccurrence = cooccurrence
+        self.papers = papers
+        self.version = version
+
+    @classmethod
+    def from_dataframe(cls, df, version=None):
+        """데이터셋 DataFrame 한 번으로 모든 집계 계산"""
+        year = df['year'].astype('Int64')
+        source = df['source'].astype('string')
+        year_source = pd.crosstab(year, source).sort_index()
+
+        papers, codes, vocabulary = split_keywords(df['keywords'])
+        keyword_counts = pd.Series(np.bincount(codes, minlength=len(vocabulary)),
+                                   index=pd.Index(vocabulary, dtype=object), name='count')
+        order = np.lexsort((vocabulary.astype(str), -keyword_counts.to_numpy()))
+
+        return cls(
+            year_counts=year.value_counts().sort_index(),
+            venue_counts=value_counts(df['publication'].astype('string').str.strip()),
+            source_counts=value_counts(source),
+            year_source=year_source,
+            keyword_counts=keyword_counts.iloc[order],
+            cooccurrence=CooccurrenceMatrix.from_keywords(papers, codes, vocabulary),
+            papers=len(df),
+            version=version,
+        )
+
+    def save(self, path):
+        """집계는 JSON(path.json), 동시 출현 행렬은 npz(path.npz)로 저장"""
+        def series(counts):
+            return {'index': counts.index.tolist(), 'counts': counts.tolist()}
+
+        summary = {
+            'version': self.version,
+            'papers': self.papers,
+            'year': series(self.year_counts),
+            'venue': series(self.venue_counts),
+            'source': series(self.source_counts),
+            'keyword': series(self.keyword_counts),
+            'year_source': json.loads(self.year_source.to_json(orient='split')),
+            'vocabulary': self.cooccurrence.vocabulary.tolist(),
+        }
+        temp_path = path + '.json.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
+        np.savez(path + '.npz', indptr=self.cooccurrence.indptr,
+                 indices=self.cooccurrence.indices, counts=self.cooccurrence.counts)
+        # JSON이 마지막에 생기므로 JSON이 있으면 npz도 완성된 상태
+        os.replace(temp_path, path + '.json')
+
+    @classmethod
+    def load(cls, path):
+        with open(path + '.json', 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        arrays = np.load(path + '.npz')
+
+        def series(data, dtype=None):
+            return pd.Series(data['counts'], index=pd.Index(data['index'], dtype=dtype), name='count')
+
+        year_source = summary['year_source']
+        return cls(
+            year_counts=series(summary['year'], 'Int64'),
+            venue_counts=series(summary['venue'], object),
+            source_counts=series(summary['source'], object),
+            year_source=pd.DataFrame(year_source['data'], index=pd.Index(year_source['index'], dtype='Int64'),
+                                     columns=year_source['columns']),
+            keyword_counts=series(summary['keyword'], object),
+            cooccurrence=CooccurrenceMatrix(summary['vocabulary'], arrays['indptr'],
+                                            arrays['indices'], arrays['counts']),
+            papers=summary['papers'],
+            version=summary['version'],
+        )
+
+def dataset_version(path):
+    """데이터셋 버전 (파일 이름, 크기, 수정 시각, 집계 형식 버전의 해시)"""
+    stat = os.stat(path)
+    key = f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}:{ANALYTICS_VERSION}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def load_analytics(output_dir='output', path=None, use_cache=True, df=None):
+    """데이터셋 버전별로 캐시된 집계 (없으면 계산해서 저장)
+
+    path를 주지 않으면 최신 통합 데이터셋을 사용합니다. 이미 읽어 둔
+    데이터셋(df)을 주면 파일을 다시 읽지 않습니다.
+    """
+    path = path or latest_dataset(output_dir)
+    version = dataset_version(path)
+    cache_dir = os.path.join(output_dir, ANALYTICS_CACHE_DIR)
+    cache_path = os.path.join(cache_dir, version)
+
+    if use_cache and os.path.exists(cache_path + '.json'):
+        logging.info(f"캐시된 집계 사용: {os.path.basename(path)} ({version})")
+        return PaperAnalytics.load(cache_path)
+
+    logging.info(f"집계 계산: {os.path.basename(path)}")
+    if df is None:
+        df = read_dataset(path, columns=ANALYTICS_COLUMNS)
+    analytics = PaperAnalytics.from_dataframe(df, version)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    analytics.save(cache_path)
+    # 이전 버전 캐시 정리
+    for name in os.listdir(cache_dir):
+        if not name.startswith(version):
+            os.remove(os.path.join(cache_dir, name))
+    return analytics
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='통합 논문 데이터셋 집계')
+    parser.add_argument('--output-dir', default='output')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 무시하고 다시 계산')
+    args = parser.parse_args()
+
+    analytics = load_analytics(args.output_dir, use_cache=not args.no_cache)
+    cooccurrence = analytics.cooccurrence
+    print(f"논문 {analytics.papers}개, 키워드 {len(analytics.keyword_counts)}개, "
+          f"동시 출현 쌍 {cooccurrence.nnz // 2}개")
+    print("\n[출처별]")
+    print(analytics.source_counts.to_string())
+    print(f"\n[학회/저널 상위 {args.top}]")
+    print(analytics.venue_counts.head(args.top).to_string())
+    print(f"\n[키워드 상위 {args.top}]")
+    print(analytics.keyword_counts.head(args.top).to_string())
+    print(f"\n[함께 나온 키워드 상위 {args.top}]")
+    for first, second, count in cooccurrence.top_pairs(args.top):
+        print(f"{first} + {second}: {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import os
+import sys
+import json
+import sqlite3
+import argparse
+import importlib
+
+PROG = 'paper-integration'
+
+# 하위 명령 -> (모듈, 함수, 앞에 붙일 인자, 설명)
+# 모듈은 그 명령을 실행할 때만 import하므로 --help나 status는 pandas,
+# matplotlib, PyPDF2 등을 읽지 않습니다. 옵션은 각 모듈의 main이 처리합니다.
+COMMANDS = {
+    'status': (None, 'status', [], '최신 데이터셋, 다운로드, 파이프라인 진행 상황'),
+    'integrate': ('integrate_papers', 'main', [], '원본 내보내기 파일 통합'),
+    'dataset': ('papers_dataset', 'main', [], '최신 데이터셋 확인 / CSV 내보내기'),
+    'dedup': ('dedup_papers', 'main', [], '중복 논문 병합'),
+    'url-list': ('paper_downloader', 'main', [], '논문 URL 목록(마크다운) 생성'),
+    'download': ('paper_downloader', 'main', ['--download'], 'PDF 다운로드'),
+    'verify-store': ('pdf_store', 'main', [], 'PDF 저장소 점검'),
+    'rename': ('rename_papers', 'main', [], 'PDF 파일명 정리'),
+    'analytics': ('paper_analytics', 'main', [], '연도/학회/키워드 집계'),
+    'graph': ('paper_graph', 'main', [], '공저/인용 네트워크 분석'),
+    'report': ('visualize_papers', 'main', [], '시각화 보고서'),
+    'index': ('paper_search', 'main', ['--update'], '검색 색인 갱신 (바뀐 레코드/PDF만)'),
+    'search': ('paper_search', 'main', [], '제목/초록/키워드/저자/PDF 본문 검색'),
+    'pipeline': ('paper_pipeline', 'main', [], '통합부터 보고서까지 한 번에 실행'),
+}
+
+# paper_pipeline.CHECKPOINT_FILE, paper_search.SEARCH_INDEX_DIR
+# (status가 pandas를 읽지 않도록 import하지 않음)
+CHECKPOINT_FILE = 'pipeline_checkpoint.json'
+SEARCH_INDEX_DIR = 'search_index'
+
+def read_config(config_path='config.json'):
+    """status에 필요한 경로 설정만 읽기 (파일이 없으면 기본값)"""
+    config = {}
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    config.setdefault('output_dir', 'output')
+    config.setdefault('download_dir', 'downloads')
+    return config
+
+def status(argv=None):
+    """최신 데이터셋, 다운로드 매니페스트, PDF 수, 파이프라인 완료 기록 출력"""
+    from papers_dataset import LATEST_MANIFEST
+
+    parser = argparse.ArgumentParser(description=COMMANDS['status'][3])
+    parser.add_argument('--config', default='config.json')
+    args = parser.parse_args(argv)
+    config = read_config(args.config)
+    output_dir = config['output_dir']
+
+    latest_path = os.path.join(output_dir, LATEST_MANIFEST)
+    if os.path.exists(latest_path):
+        with open(latest_path, 'r', encoding='utf-8') as f:
+            latest = json.load(f)
+        print(f"최신 데이터셋: {os.path.join(output_dir, latest['path'])} "
+              f"({latest.get('rows')}개 레코드, {latest.get('created')})")
+    else:
+        print("최신 데이터셋: 없음 (integrate를 먼저 실행하세요)")
+
+    manifest_path = config.get('manifest_path') or os.path.join(output_dir, 'download_manifest.sqlite')
+    if os.path.exists(manifest_path):
+        conn = sqlite3.connect(manifest_path)
+        try:
+            counts = dict(conn.execute('SELECT status, COUNT(*) FROM downloads GROUP BY status'))
+        finally:
+            conn.close()
+        print("다운로드: " + ', '.join(f"{key} {count}개" for key, count in sorted(counts.items())))
+    else:
+        print("다운로드: 기록 없음")
+
+    download_dir = config['download_dir']
+    if os.path.isdir(download_dir):
+        pdfs = sum(name.endswith('.pdf') for name in os.listdir(download_dir))
+        print(f"PDF: {pdfs}개 ({download_dir})")
+
+    index_path = os.path.join(output_dir, SEARCH_INDEX_DIR, 'index.sqlite')
+    if os.path.exists(index_path):
+        conn = sqlite3.connect(index_path)
+        try:
+            documents, pdfs = conn.execute('SELECT COUNT(*), COUNT(pdf) FROM documents').fetchone()
+        finally:
+            conn.close()
+        print(f"검색 색인: 문서 {documents}개 (PDF 본문 {pdfs}개)")
+
+    checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            stages = json.load(f).get('stages', {})
+        done = ', '.join(f"{stage} ({info['finished']})" for stage, info in stages.items())
+        print(f"파이프라인 완료 단계: {done or '없음'}")
+
+def load_command(name):
+    """하위 명령의 실행 함수 (이때 처음으로 해당 모듈을 import)"""
+    module_name, function_name, _, _ = COMMANDS[name]
+    if module_name is None:
+        return globals()[function_name]
+    return getattr(importlib.import_module(module_name), function_name)
+
+def run_command(name, argv):
+    """하위 명령 실행 (각 모듈의 main이 sys.argv에서 자기 옵션을 읽음)"""
+    _, _, preset, _ = COMMANDS[name]
+    function = load_command(name)
+    sys.argv = [f'{PROG} {name}', *preset, *argv]
+    return function()
+
+def main(argv=None):
+    commands = '\n'.join(f"  {name:<13} {help_text}" for name, (_, _, _, help_text) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog=PROG, description='논문 통합/다운로드/정리/분석 도구',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"명령:\n{commands}\n\n명령별 옵션: {PROG} <명령> --help")
+    parser.add_argument('command', choices=COMMANDS, metavar='명령', help='실행할 명령 (아래 목록)')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    return run_command(args.command, args.args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import pandas as pd
+
+from doi_resolver import DOI_BASE_URL
+
+# 논문 DataFrame에서 파생 컬럼(DOI 링크, 파일명, 저장 경로, URL)을 한 번에 계산하는 함수들
+# 행마다 Series를 만드는 iterrows 대신 pandas 문자열 연산을 사용합니다.
+
+# 다운로드 파일명에 쓰는 제목 최대 길이
+MAX_TITLE_LENGTH = 100
+
+def text(df, column, missing=''):
+    """컬럼을 문자열 시리즈로 (없는 컬럼이나 빈 값은 missing)"""
+    if column not in df.columns:
+        return pd.Series(missing, index=df.index, dtype='string')
+    # 정수(Int64) 연도는 '2020', CSV에서 실수로 읽힌 연도는 예전처럼 '2020.0'
+    return df[column].astype('string').fillna(missing)
+
+def doi_url(doi):
+    """DOI 시리즈 -> https://doi.org/ 링크 (빈 DOI는 NA)"""
+    doi = doi.astype('string')
+    return (DOI_BASE_URL + doi).where(doi.fillna('') != '')
+
+def resolved_urls(doi, resolved):
+    """DOIResolver 결과 {doi: (landing_url, pdf_url)}를 (랜딩 URL, PDF URL) 시리즈로"""
+    resolved = resolved or {}
+    landing = pd.Series({key: value[0] for key, value in resolved.items()}, dtype='string')
+    pdf = pd.Series({key: value[1] for key, value in resolved.items()}, dtype='string')
+    doi = doi.astype('string')
+    return doi.map(landing).astype('string'), doi.map(pdf).astype('string')
+
+def download_url(df, resolved=None):
+    """다운로드할 URL: DOI가 있으면 직접 PDF URL, 랜딩 URL, doi.org 순, 없으면 url 컬럼"""
+    doi = text(df, 'doi')
+    landing, pdf = resolved_urls(doi, resolved)
+    by_doi = pdf.fillna(landing).fillna(doi_url(doi))
+    url = text(df, 'url')
+    return by_doi.where(doi != '', url.where(url != ''))
+
+def link_url(df, resolved=None):
+    """목록용 링크: url 컬럼이 있으면 그것, 없으면 직접 PDF URL이나 doi.org 링크"""
+    doi = text(df, 'doi')
+    _, pdf = resolved_urls(doi, resolved)
+    url = text(df, 'url')
+    return url.where(url != '', pdf.fillna(doi_url(doi)))
+
+def safe_filename(title):
+    """다운로드 파일명용 제목 (특수문자 제거, 공백은 _, 최대 100자)"""
+    title = title.astype('string').fillna('')
+    title = title.str.replace(r'[^\w\s-]', '', regex=True)
+    title = title.str.replace(r'\s+', '_', regex=True)
+    return title.str.slice(0, MAX_TITLE_LENGTH)
+
+def download_filename(df):
+    """다운로더가 저장하는 파일명: <연도>_<정리한 제목>.pdf"""
+    return text(df, 'year', 'nan') + '_' + safe_filename(text(df, 'title')) + '.pdf'
+
+def sanitize_filename(filename):
+    """윈도우에서 사용할 수 없는 문자들을 '-'로 변경"""
+    return filename.astype('string').str.replace(r'[<>:"/\\|?*]', '-', regex=True)
+
+def paper_filename(df):
+    """rename_papers가 붙이는 파일명 (확장자 제외): <제목>-<연도>-<출처>"""
+    return sanitize_filename(text(df, 'title', 'nan') + '-' + text(df, 'year', 'nan') + '-'
+                             + text(df, 'source', 'nan'))
+
+def url_list_entries(df, resolved=None):
+    """URL 목록 마크다운 항목 시리즈 (URL이나 DOI가 있는 논문만)
+
+    DOI가 있으면 doi.org 링크(ACM 테스트 DOI 10.5555는 DOI 그대로)와
+    해석해 둔 직접 PDF URL을, 없으면 url 컬럼을 씁니다.
+    """
+    doi = text(df, 'doi')
+    url = text(df, 'url')
+    has_doi = doi != ''
+    _, pdf = resolved_urls(doi, resolved)
+
+    heading = ('## ' + text(df, 'title') + ' (' + text(df, 'year') + ')\n'
+               + '- 출처: ' + text(df, 'source') + '\n')
+    link = ('- URL: ' + url + '\n').where(url != '', '')
+    by_doi = ('- URL: ' + DOI_BASE_URL + doi + '\n').mask(doi.str.startswith('10.5555'),
+                                                         '- DOI: ' + doi + '\n')
+    by_doi = by_doi + ('- PDF: ' + pdf + '\n').fillna('')
+    entries = heading + by_doi.where(has_doi, link) + '\n'
+    return entries[has_doi | (url != '')]
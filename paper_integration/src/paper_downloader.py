@@ -3,21 +3,83 @@ import os
 from datetime import datetime
 import json
 from pathlib import Path
-import requests
 import time
-import re
-from urllib.parse import urljoin
+import random
+import hashlib
+import functools
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 import logging
 
+from dedup_papers import deduplicate_papers
+from papers_dataset import DOWNLOAD_COLUMNS, latest_dataset, read_dataset
+from paper_columns import download_filename, download_url, url_list_entries
+from download_manifest import DownloadManifest, PERMANENT_HTTP_STATUS, manifest_keys
+from doi_resolver import DOI_BASE_URL, DOIResolver
+from paper_metrics import measure_stage, metrics, write_atomic
+from pdf_store import PDFStore, has_pdf_header, is_valid_pdf
+from rate_limiter import HostRateLimiter
+
+# 스트리밍 다운로드 시 한 번에 기록할 크기
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+def unique_download_filenames(filenames, keys):
+    """다운로드 파일명 시리즈에서 서로 다른 논문끼리 겹치는 이름을 구분
+
+    같은 해에 나온 같은 제목의 다른 논문('Editorial', 'Preface' 등)은
+    같은 파일명을 받으므로, 매니페스트 키가 다른 논문과 이름이 겹치면
+    모두 키 해시 8자리를 붙입니다. 키로 정하므로 데이터셋의 행 순서가
+    바뀌어도 논문마다 같은 이름입니다. 키까지 같은 행은 같은 논문입니다.
+    """
+    frame = pd.DataFrame({'filename': filenames.to_numpy(), 'key': keys.fillna('').to_numpy()})
+    clash = frame.groupby('filename')['key'].transform('nunique').to_numpy() > 1
+    if not clash.any():
+        return filenames
+    suffixes = [hashlib.sha1(key.encode('utf-8')).hexdigest()[:8] for key in frame['key'][clash]]
+    stems = frame['filename'][clash].str.slice(0, -len('.pdf'))
+    frame.loc[clash, 'filename'] = stems + '_' + pd.Series(suffixes, index=stems.index) + '.pdf'
+    return pd.Series(frame['filename'].to_numpy(), index=filenames.index, name=filenames.name)
+
 class PaperDownloader:
     def __init__(self, config_path='config.json'):
-        self.config = self._load_config(config_path)
-        self.setup_logging()
-        
+        # 설정, 로그 파일, HTTP 세션은 처음 필요할 때 준비
+        # (URL 목록만 만들 때는 세션도 로그 파일도 만들지 않음)
+        self.config_path = config_path
+        self.rate_limiter = None
+        self.session = None
+        self.store = None
+
+    @functools.cached_property
+    def config(self):
+        """설정 (처음 사용할 때 로드)"""
+        return self._load_config(self.config_path)
+
+    def connect(self):
+        """HTTP 세션과 호스트별 속도 제한기 준비 (다운로드 스레드를 띄우기 전에 호출)"""
+        if self.session is None:
+            # DOI 해석기도 이 제한기를 씀 (doi.org는 리다이렉트만 하므로 resolver_delay 간격)
+            self.rate_limiter = HostRateLimiter(
+                self.config['delay'], self.config['host_burst'],
+                host_delays={urlparse(DOI_BASE_URL).netloc: self.config['resolver_delay']})
+            self.session = self._create_session()
+
+    def _create_session(self):
+        """연결을 재사용하는 HTTP 세션 생성"""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.config['max_workers'],
+                              pool_maxsize=self.config['max_workers'])
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def setup_logging(self):
-        """로깅 설정"""
+        """로깅 설정 (다운로드를 시작할 때)"""
         log_dir = Path(self.config['output_dir']) / 'logs'
-        log_dir.mkdir(exist_ok=True)
+        log_dir.mkdir(parents=True, exist_ok=True)
         
         logging.basicConfig(
             level=logging.INFO,
@@ -42,10 +104,33 @@ class PaperDownloader:
                     config['retry_count'] = 3
                 if 'delay' not in config:
                     config['delay'] = 2
+                if 'max_workers' not in config:
+                    config['max_workers'] = 8
+                if 'host_burst' not in config:
+                    config['host_burst'] = 1
+                if 'max_backoff' not in config:
+                    config['max_backoff'] = 60
+                if 'max_attempts' not in config:
+                    config['max_attempts'] = 5
+                if 'retry_cooldown' not in config:
+                    config['retry_cooldown'] = 3600
+                if 'resolve_dois' not in config:
+                    config['resolve_dois'] = True
+                if 'resolver_delay' not in config:
+                    config['resolver_delay'] = 0.1
+                if 'doi_cache_ttl' not in config:
+                    config['doi_cache_ttl'] = 2592000
+                if 'doi_negative_ttl' not in config:
+                    config['doi_negative_ttl'] = 86400
+                if 'doi_cache_max_entries' not in config:
+                    config['doi_cache_max_entries'] = 200000
+                if 'dedup_before_download' not in config:
+                    config['dedup_before_download'] = False
                 return config
         else:
-            # 기본 설정
-            default_config = {
+            # 기본 설정 (파일은 만들지 않음)
+            logging.info(f"설정 파일이 없어 기본 설정을 사용합니다: {config_path}")
+            return {
                 "source_dir": "source",
                 "output_dir": "output",
                 "download_dir": "downloads",
@@ -57,122 +142,378 @@ class PaperDownloader:
                 },
                 "timeout": 30,
                 "retry_count": 3,
-                "delay": 2
+                "delay": 2,
+                "max_workers": 8,
+                "host_burst": 1,
+                "max_backoff": 60,
+                "max_attempts": 5,
+                "retry_cooldown": 3600,
+                "resolve_dois": True,
+                "resolver_delay": 0.1,
+                "doi_cache_ttl": 2592000,
+                "doi_negative_ttl": 86400,
+                "doi_cache_max_entries": 200000,
+                "dedup_before_download": False
             }
-            # 기본 설정 파일 생성
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=4, ensure_ascii=False)
-            return default_config
-
-    def _clean_filename(self, title):
-        """파일명 정리"""
-        # 특수문자 제거 및 공백을 언더스코어로 변경
-        clean_title = re.sub(r'[^\w\s-]', '', title)
-        clean_title = re.sub(r'\s+', '_', clean_title)
-        return clean_title[:100]  # 파일명 길이 제한
-
-    def _download_file(self, url, output_path, retry_count=0):
-        """파일 다운로드"""
-        try:
-            response = requests.get(
-                url,
-                timeout=self.config['timeout']
-            )
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            if retry_count < self.config['retry_count']:
-                logging.warning(f"다운로드 재시도 중... ({retry_count + 1}/{self.config['retry_count']})")
-                time.sleep(self.config['delay'])
-                return self._download_file(url, output_path, retry_count + 1)
-            else:
-                logging.error(f"다운로드 실패: {url} - {str(e)}")
-                return False
-
-    def _get_paper_url(self, paper):
-        """논문 URL 생성"""
-        if pd.notna(paper['doi']):
-            # DOI를 통한 URL 생성
-            return f"https://doi.org/{paper['doi']}"
-        elif pd.notna(paper['url']):
-            # 기존 URL 사용
-            return paper['url']
+
+    def _backoff(self, attempt):
+        """지수 백오프 + 지터 대기 시간 (full jitter)"""
+        ceiling = min(self.config['max_backoff'], self.config['delay'] * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def _is_acceptable_response(self, response):
+        """PDF로 저장할 만한 응답인지 확인 (HTML 오류/랜딩 페이지 제외)"""
+        content_type = response.headers.get('Content-Type', '').lower()
+        return 'html' not in content_type
+
+    def _download_file(self, url, output_path):
+        """파일 다운로드
+
+        응답을 조각 단위로 output_path.part에 기록하고, 검사를 통과하면
+        최종 경로로 원자적으로 이름을 바꿉니다. 전송이 중간에 끊기면
+        Range 요청으로 이어서 받습니다.
+
+        반환값은 ok, http_status, final_url, size, sha256, error, permanent
+        키를 가진 결과 딕셔너리입니다.
+        """
+        part_path = output_path.with_name(output_path.name + '.part')
+        retry_count = self.config['retry_count']
+        result = {'ok': False}
+        host = urlparse(url).netloc.lower()
+
+        for attempt in range(retry_count + 1):
+            try:
+                # 같은 호스트에 대한 요청 간격 준수
+                with metrics.timer('rate_limit_wait_seconds', host=host):
+                    self.rate_limiter.acquire(url)
+
+                offset = part_path.stat().st_size if part_path.exists() else 0
+                headers = {'Range': f'bytes={offset}-'} if offset else {}
+                fetch_start = time.perf_counter()
+                received = 0
+                with self.session.get(url, headers=headers, stream=True,
+                                      timeout=self.config['timeout']) as response:
+                    metrics.inc('http_responses_total', host=host, status=response.status_code)
+                    result['http_status'] = response.status_code
+                    result['final_url'] = response.url
+                    if response.status_code == 416:
+                        # 이어받을 범위가 잘못됨: 처음부터 다시 받기
+                        part_path.unlink()
+                        raise IOError('Range 요청 실패 (416)')
+                    response.raise_for_status()
+
+                    if not self._is_acceptable_response(response):
+                        # 랜딩 페이지일 수 있으므로 죽은 링크로 두지 않고 쿨다운 뒤 다시 시도
+                        # (그 사이 DOI 해석 캐시가 직접 PDF URL을 찾을 수 있음)
+                        logging.error(f"PDF가 아닌 응답: {url} ({response.headers.get('Content-Type')})")
+                        part_path.unlink(missing_ok=True)
+                        result.update(error='PDF가 아닌 응답')
+                        return result
+
+                    # 서버가 Range를 무시하면 처음부터 다시 기록
+                    if response.status_code != 206:
+                        offset = 0
+                    expected_size = self._expected_size(response, offset)
+
+                    # 이어받는 경우 기존 부분도 해시에 포함
+                    digest = hashlib.sha256()
+                    if offset:
+                        with open(part_path, 'rb') as f:
+                            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                                digest.update(chunk)
+
+                    with open(part_path, 'ab' if offset else 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
+                            received += len(chunk)
+
+                # 요청부터 본문 수신까지 걸린 시간과 받은 바이트 (호스트별 속도 계산용)
+                metrics.observe('http_fetch_seconds', time.perf_counter() - fetch_start, host=host)
+                metrics.inc('http_bytes_total', received, host=host)
+                size = part_path.stat().st_size
+                if expected_size is not None and size != expected_size:
+                    raise IOError(f'전송 중단 ({size}/{expected_size} bytes)')
+
+                # 내용 검사: PDF 헤더가 없으면 오류 페이지, 트레일러가 없으면 잘린 파일
+                if not has_pdf_header(part_path):
+                    logging.error(f"PDF가 아닌 응답: {url} (%PDF 헤더 없음)")
+                    part_path.unlink()
+                    result.update(error='PDF가 아닌 응답')
+                    return result
+                if not is_valid_pdf(part_path):
+                    part_path.unlink()
+                    raise IOError('PDF 트레일러(%%EOF) 없음')
+
+                os.replace(part_path, output_path)
+                sha256 = digest.hexdigest()
+                if self.store is not None:
+                    # 같은 내용의 PDF가 이미 있으면 하나의 blob으로 연결
+                    _, _, duplicate = self.store.add(output_path, sha256)
+                    if duplicate:
+                        logging.info(f"중복 PDF 연결: {output_path.name}")
+                result.update(ok=True, size=size, sha256=sha256, error=None)
+                return result
+            except Exception as e:
+                result['error'] = str(e)
+                if result.get('http_status') in PERMANENT_HTTP_STATUS:
+                    logging.error(f"다운로드 실패: {url} - {str(e)}")
+                    return result
+                if attempt < retry_count:
+                    metrics.inc('http_retries_total', host=host)
+                    wait = self._backoff(attempt)
+                    logging.warning(f"다운로드 재시도 중... ({attempt + 1}/{retry_count}, {wait:.1f}초 후) - {str(e)}")
+                    time.sleep(wait)
+                else:
+                    logging.error(f"다운로드 실패: {url} - {str(e)}")
+        return result
+
+    def _expected_size(self, response, offset):
+        """응답 헤더로 계산한 완성 파일 크기 (알 수 없으면 None)"""
+        # 압축 전송이면 Content-Length가 실제 파일 크기와 다름
+        if response.headers.get('Content-Encoding'):
+            return None
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and not content_range.endswith('/*'):
+            return int(content_range.rsplit('/', 1)[1])
+        content_length = response.headers.get('Content-Length')
+        if content_length is not None:
+            return offset + int(content_length)
         return None
 
+    def _download_job(self, job):
+        """작업 하나 (key, url, output_path)를 다운로드하고 매니페스트에 기록"""
+        key, url, output_path = job
+        result = self._download_file(url, output_path)
+        if result['ok']:
+            logging.info(f"다운로드 성공: {output_path.name}")
+        if key is not None:
+            self.manifest.record(key, result, url=url,
+                                 path=output_path if result['ok'] else None)
+        return result['ok']
+
     def download_papers(self, papers_file):
         """논문 다운로드 실행"""
-        # 결과 파일 읽기
-        papers_df = pd.read_csv(papers_file)
-        
-        # 다운로드 디렉토리 생성
-        download_dir = Path(self.config['download_dir'])
-        download_dir.mkdir(exist_ok=True)
-        
-        # 다운로드 통계
-        stats = {
-            'total': len(papers_df),
+        self.setup_logging()
+        with measure_stage('download', self.config['output_dir']):
+            # 결과 파일 읽기 (다운로드에 필요한 컬럼만)
+            papers_df = read_dataset(papers_file, columns=DOWNLOAD_COLUMNS)
+
+            # 설정하면 여러 데이터베이스에서 들어온 같은 논문은 한 번만 다운로드
+            papers_df = self.deduplicate(papers_df)
+
+            # 다운로드 디렉토리 생성
+            download_dir = Path(self.config['download_dir'])
+            download_dir.mkdir(exist_ok=True)
+
+            stats = self.new_stats(len(papers_df))
+            self.open_stores(download_dir)
+            try:
+                candidates, targets = self.plan_downloads(papers_df, download_dir, stats)
+
+                # 다운로드할 논문의 DOI를 한 번에 (캐시 확인 후 동시에) 해석한 뒤,
+                # 호스트별 속도 제한을 지키면서 여러 논문을 동시에 다운로드
+                jobs = list(self.iter_download_jobs(candidates, targets, stats))
+                with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+                    for success in executor.map(self._download_job, jobs):
+                        stats['success' if success else 'failed'] += 1
+            finally:
+                self.close_stores()
+
+        # 결과 보고서 생성
+        self._generate_report(stats, download_dir)
+
+    def deduplicate(self, papers_df):
+        """여러 데이터베이스에서 들어온 같은 논문을 하나로 (dedup_before_download일 때만)
+
+        잘못 합쳐지면 그 논문은 다운로드되지 않으므로, 제외한 레코드는
+        output_dir/download_merge_map.csv에 남깁니다.
+        """
+        if not self.config['dedup_before_download']:
+            return papers_df
+        total_records = len(papers_df)
+        deduped, merge_map = deduplicate_papers(papers_df)
+        if len(merge_map):
+            merge_map['source_title'] = papers_df['title'].iloc[merge_map['source_index']].to_numpy()
+            merge_map['canonical_title'] = papers_df['title'].iloc[merge_map['canonical_index']].to_numpy()
+            os.makedirs(self.config['output_dir'], exist_ok=True)
+            merge_map_file = os.path.join(self.config['output_dir'], 'download_merge_map.csv')
+            write_atomic(merge_map_file, merge_map.to_csv(index=False))
+            logging.info(f"중복 레코드 {len(merge_map)}개 제외: {total_records} -> {len(deduped)} "
+                         f"(병합 맵: {merge_map_file})")
+        return deduped
+
+    def new_stats(self, total):
+        """다운로드 통계"""
+        return {
+            'total': total,
             'success': 0,
             'failed': 0,
-            'skipped': 0
+            'skipped': 0,
+            'cooldown': 0,
+            'dead': 0
         }
+
+    def open_stores(self, download_dir):
+        """PDF 저장소와 다운로드 매니페스트 열기"""
+        self.connect()
+        # 내용 해시 기반 저장소 (중복 PDF는 하나의 blob으로 연결)
+        self.store = PDFStore(download_dir)
+        self.manifest = self._open_manifest()
+
+    def close_stores(self):
+        self.manifest.close()
+        self.store.close()
+
+    def plan_downloads(self, papers_df, download_dir, stats):
+        """다운로드할 논문 선별 -> ([(행 위치, 매니페스트 키, 저장 경로)], 해당 행 DataFrame)"""
+        # 매니페스트를 한 번에 읽어 논문별 상태를 O(1)로 확인
+        entries = self.manifest.load()
+        keys = manifest_keys(papers_df)
         
-        for _, paper in papers_df.iterrows():
-            # 파일명 생성
-            filename = f"{paper['year']}_{self._clean_filename(paper['title'])}.pdf"
-            output_path = download_dir / filename
-            
+        # 파일명은 컬럼 단위로 한 번에 만들고, 기존 파일은 디렉토리를 한 번만 읽어 확인
+        filenames = unique_download_filenames(download_filename(papers_df), keys)
+        existing = set(os.listdir(download_dir))
+        
+        # 다운로드 대상 선별 (같은 파일에 동시에 쓰지 않도록 이번에 받을 파일명도 확인)
+        candidates = []
+        planned = set()
+        for row, key, filename in zip(range(len(papers_df)), keys, filenames):
+            key = None if pd.isna(key) else key
+            if filename in planned:
+                logging.info(f"같은 논문이 여러 번 있어 건너뛰기: {filename}")
+                stats['skipped'] += 1
+                continue
+            planned.add(filename)
+            entry = entries.get(key)
+            decision = self.manifest.decide(entry)
+            if decision == 'done' and not self.store.has_download(entry):
+                # 받았다고 기록됐지만 파일이 지워진 경우 다시 받음
+                logging.info(f"다운로드 기록은 있지만 파일이 없어 다시 받기: {filename}")
+                decision = 'attempt'
+            if decision == 'done':
+                stats['skipped'] += 1
+                continue
+            if decision == 'cooldown':
+                stats['cooldown'] += 1
+                continue
+            if decision == 'dead':
+                stats['dead'] += 1
+                continue
+
             # 이미 다운로드된 파일 건너뛰기
-            if output_path.exists():
+            if filename in existing:
                 logging.info(f"이미 존재하는 파일 건너뛰기: {filename}")
                 stats['skipped'] += 1
                 continue
             
-            # 논문 URL 가져오기
-            url = self._get_paper_url(paper)
-            if not url:
-                logging.warning(f"URL 없음: {paper['title']}")
-                stats['failed'] += 1
-                continue
-            
-            # 다운로드 시도
-            if self._download_file(url, output_path):
-                logging.info(f"다운로드 성공: {filename}")
-                stats['success'] += 1
-            else:
-                stats['failed'] += 1
-            
-            # API 제한 준수를 위한 대기
-            time.sleep(self.config['delay'])
-        
-        # 결과 보고서 생성
-        self._generate_report(stats, download_dir)
+            candidates.append((row, key, download_dir / filename))
+        return candidates, papers_df.iloc[[row for row, _, _ in candidates]]
+
+    def iter_download_jobs(self, candidates, targets, stats, batch_size=None):
+        """다운로드 작업 (key, url, output_path) 생성
+
+        DOI는 batch_size개씩 (기본: 한 번에 모두) 해석하므로, 파이프라인에서는
+        첫 묶음을 해석하자마자 다운로드를 시작할 수 있습니다.
+        """
+        if self.config['resolve_dois']:
+            # 해석기가 다운로더의 세션과 호스트별 속도 제한기를 함께 쓰도록 먼저 준비
+            self.connect()
+        resolver = self._open_resolver() if self.config['resolve_dois'] else None
+        batch_size = batch_size or max(len(candidates), 1)
+        try:
+            for start in range(0, len(candidates), batch_size):
+                batch = targets.iloc[start:start + batch_size]
+                resolved = resolver.resolve_many(batch['doi'].dropna()) if resolver else {}
+
+                # URL은 컬럼 단위로 계산
+                urls = download_url(batch, resolved)
+                for (_, key, output_path), title, url in zip(candidates[start:start + batch_size],
+                                                             batch['title'], urls):
+                    if pd.isna(url):
+                        logging.warning(f"URL 없음: {title}")
+                        stats['failed'] += 1
+                        continue
+                    yield key, url, output_path
+        finally:
+            if resolver is not None:
+                resolver.close()
+
+    def _open_resolver(self):
+        """다운로더와 세션을 공유하는 DOI 해석기 열기 (세션이 없으면 해석할 때 만듦)"""
+        cache_path = self.config.get('doi_cache_path') or \
+            Path(self.config['output_dir']) / 'doi_cache.sqlite'
+        return DOIResolver(cache_path,
+                           ttl=self.config['doi_cache_ttl'],
+                           max_entries=self.config['doi_cache_max_entries'],
+                           session=self.session,
+                           rate_limiter=self.rate_limiter,
+                           negative_ttl=self.config['doi_negative_ttl'],
+                           max_workers=self.config['max_workers'],
+                           timeout=self.config['timeout'])
+
+    def _open_manifest(self):
+        """다운로드 매니페스트 열기"""
+        manifest_path = self.config.get('manifest_path') or \
+            Path(self.config['output_dir']) / 'download_manifest.sqlite'
+        return DownloadManifest(manifest_path,
+                                max_attempts=self.config['max_attempts'],
+                                retry_cooldown=self.config['retry_cooldown'])
         
     def _generate_report(self, stats, download_dir):
-        """다운로드 결과 보고서 생성"""
-        report = f"""
-다운로드 결과 보고서
-====================
-총 논문 수: {stats['total']}
-다운로드 성공: {stats['success']}
-다운로드 실패: {stats['failed']}
-건너뛴 파일: {stats['skipped']}
-다운로드 위치: {download_dir}
-생성 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-"""
-        
-        report_path = download_dir / 'download_report.txt'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
-        
+        """다운로드 결과 보고서 생성
+
+        download_dir/download_report.json에 결과별 논문 수와 호스트별
+        요청 수, 재시도, 응답 시간(p50/p95), 전송 속도를 기록하고, 전체
+        지표는 output_dir/metrics/download.json과 download.prom에 저장합니다.
+        """
+        for result, count in stats.items():
+            if result != 'total':
+                metrics.inc('downloads_total', count, result=result)
+
+        hosts = {}
+        for labels, histogram in metrics.histogram('http_fetch_seconds').items():
+            host = dict(labels)['host']
+            received = metrics.value('http_bytes_total', host=host)
+            hosts[host] = {
+                'requests': histogram.count,
+                'retries': metrics.value('http_retries_total', host=host),
+                'bytes': received,
+                'fetch_seconds': histogram.sum,
+                'fetch_p50': histogram.quantile(0.5),
+                'fetch_p95': histogram.quantile(0.95),
+                'bytes_per_second': received / histogram.sum if histogram.sum else None,
+                'rate_limit_wait_seconds': sum(wait.sum for wait in metrics.histogram(
+                    'rate_limit_wait_seconds', host=host).values()),
+            }
+        received = sum(host['bytes'] for host in hosts.values())
+        fetch_seconds = sum(host['fetch_seconds'] for host in hosts.values())
+        report = {
+            **stats,
+            'download_dir': str(download_dir),
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'bytes': received,
+            'bytes_per_second': received / fetch_seconds if fetch_seconds else None,
+            'hosts': hosts,
+        }
+
+        report_path = download_dir / 'download_report.json'
+        write_atomic(report_path, json.dumps(report, ensure_ascii=False, indent=2))
+        metrics.write(self.config['output_dir'], 'download')
+
+        logging.info(f"다운로드 결과: 성공 {stats['success']}, 실패 {stats['failed']}, "
+                     f"건너뜀 {stats['skipped']}, 재시도 대기 {stats['cooldown']}, "
+                     f"포기 {stats['dead']} / 전체 {stats['total']}")
         logging.info(f"다운로드 보고서가 생성되었습니다: {report_path}")
 
     def generate_url_list(self, input_file):
-        # CSV 파일 읽기
-        df = pd.read_csv(input_file)
+        # 데이터셋 읽기 (URL 목록에 필요한 컬럼만)
+        df = read_dataset(input_file, columns=DOWNLOAD_COLUMNS)
+
+        # 이미 해석해 둔 직접 PDF URL (네트워크 요청 없이 캐시만 사용)
+        resolver = self._open_resolver()
+        resolved = resolver.cached(df['doi'].dropna().astype(str))
+        resolver.close()
         
         # 마크다운 파일 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -182,30 +523,7 @@ class PaperDownloader:
         
         with open(md_filename, 'w', encoding='utf-8') as f:
             f.write('# 논문 URL 리스트\n\n')
-            
-            for _, row in df.iterrows():
-                title = row['title']
-                year = row['year']
-                source = row['source']
-                doi = row.get('doi', '')
-                url = row.get('url', '')
-                
-                # URL이 있거나 DOI가 있는 경우만 포함
-                if url or doi:
-                    f.write(f'## {title} ({year})\n')
-                    f.write(f'- 출처: {source}\n')
-                    
-                    # DOI가 있는 경우 DOI URL 생성
-                    if doi:
-                        if doi.startswith('10.5555'):  # ACM 테스트 DOI도 포함
-                            f.write(f'- DOI: {doi}\n')
-                        else:
-                            f.write(f'- URL: https://doi.org/{doi}\n')
-                    # DOI가 없고 URL이 있는 경우 URL 사용
-                    elif url:
-                        f.write(f'- URL: {url}\n')
-                    
-                    f.write('\n')
+            f.write(''.join(url_list_entries(df, resolved)))
         
         logging.info(f'URL 리스트가 생성되었습니다:')
         logging.info(f'- 마크다운 파일: {md_filename}')
@@ -218,23 +536,31 @@ def main():
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
-    
-    # 최신 papers 파일 찾기
-    output_dir = 'output'
-    papers_files = [f for f in os.listdir(output_dir) if f.startswith('papers_') and f.endswith('.csv')]
-    if not papers_files:
-        logging.error('papers 파일을 찾을 수 없습니다.')
+
+    parser = argparse.ArgumentParser(description='논문 URL 목록 생성 / PDF 다운로드')
+    parser.add_argument('--config', default='config.json')
+    parser.add_argument('--download', action='store_true', help='URL 목록 대신 PDF 다운로드')
+    args = parser.parse_args()
+
+    # 최신 papers 데이터셋 찾기
+    downloader = PaperDownloader(args.config)
+    output_dir = downloader.config['output_dir']
+    try:
+        input_file = latest_dataset(output_dir)
+    except FileNotFoundError as e:
+        logging.error(str(e))
         return
-    
-    latest_papers_file = max(papers_files)
-    input_file = os.path.join(output_dir, latest_papers_file)
-    
+
+    if args.download:
+        logging.info(f'다운로드 시작: {input_file}')
+        downloader.download_papers(input_file)
+        return
+
     # downloads 디렉토리 생성
     downloads_dir = 'downloads'
     os.makedirs(downloads_dir, exist_ok=True)
     
     logging.info(f'URL 리스트 생성 시작: {input_file}')
-    downloader = PaperDownloader()
     downloader.generate_url_list(input_file)
 
 if __name__ == "__main__":
@@ -0,0 +1,275 @@
+import os
+import logging
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from dedup_papers import normalize_doi, normalize_title
+from paper_analytics import group_pairs
+from papers_dataset import GRAPH_COLUMNS, read_papers
+
+# 저자 구분자 (BibTeX는 ' and ', Scopus/IEEE/WoS는 ';')
+AUTHOR_SEPARATORS = r'\s+and\s+|\s*;\s*'
+
+# 논문 하나에서 공저 관계를 만들 최대 저자 수 (대형 공동연구 논문의 쌍 폭증 방지)
+MAX_AUTHORS_PER_PAPER = 50
+
+# 참고문헌 구분자와 참고문헌 안의 DOI (';'는 다음 참고문헌이므로 제외)
+REFERENCE_SEPARATOR = r'\s*;\s*'
+REFERENCE_DOI_PATTERN = r'(10\.\d{4,9}/[^\s"<>;,]+)'
+
+# 참고문헌 조각을 제목으로 볼 최소 길이 (짧은 조각은 저자/학회명과 겹침)
+MIN_REFERENCE_TITLE_LENGTH = 20
+
+def normalize_author(names):
+    """저자 이름 시리즈 -> '성 이름첫글자' 키 시리즈
+
+    'Kim, Jihoon', 'Kim J.', 'J. Kim', 'Jihoon Kim'을 모두 'kim j'로 맞춥니다.
+    """
+    names = names.astype('string').str.normalize('NFKD').str.replace('[\u0300-\u036f]', '', regex=True)
+    # 쉼표/마침표/하이픈을 뺀 ASCII 문장부호 제거 (pyarrow 정규식의 \w는 ASCII만 포함)
+    names = names.str.lower().str.replace(r'[!-+/:-@\[-`{-~]', '', regex=True)
+    names = names.str.replace(r'\s+', ' ', regex=True).str.strip(' ,')
+
+    # 'Kim, Jihoon' / 'Kim, J' (WoS, BibTeX)
+    comma = names.str.extract(r'^(?P<last>[^,]+),\s*(?P<first>.*)$')
+    # 'Kim J.' / 'Kim J.-H.' / 'Kim J' (Scopus: 성 뒤에 이니셜)
+    initials_after = names.str.extract(r'^(?P<last>.+?)\s+(?P<first>(?:[^\s.,\-]\.[\s\-]*)+|[^\s.,\-])$')
+    # 'J. Kim' / 'Jihoon Kim' (IEEE: 마지막 단어가 성)
+    plain = names.str.extract(r'^(?:(?P<first>.*)\s)?(?P<last>\S+)$')
+
+    last = comma['last'].fillna(initials_after['last']).fillna(plain['last'])
+    first = comma['first'].fillna(initials_after['first']).fillna(plain['first']).fillna('')
+    initial = first.str.strip(' .-').str.slice(0, 1)
+    key = last.str.strip(' .-') + (' ' + initial).where(initial != '', '')
+    return key.replace('', pd.NA)
+
+def split_authors(authors):
+    """저자 문자열 시리즈 -> (논문 위치, 저자 코드, 저자 이름 목록)
+
+    같은 키로 정규화되는 이름은 처음 나온 표기를 대표 이름으로 씁니다.
+    논문 위치는 오름차순이고, 한 논문의 저자는 원래 순서를 따릅니다.
+    """
+    authors = authors.reset_index(drop=True).astype('string')
+    exploded = authors.str.split(AUTHOR_SEPARATORS, regex=True).explode().str.strip()
+    exploded = exploded[exploded.notna() & (exploded != '')]
+    # 같은 표기는 한 번만 정규화
+    spellings, unique_spellings = pd.factorize(exploded)
+    keys = normalize_author(pd.Series(unique_spellings, dtype='string')).to_numpy(dtype=object)[spellings]
+    entries = pd.DataFrame({'paper': exploded.index.to_numpy(), 'key': keys,
+                            'name': exploded.to_numpy()})
+    entries = entries[entries['key'].notna()].drop_duplicates(['paper', 'key'])
+    codes, _ = pd.factorize(entries['key'])
+    names = entries['name'].groupby(codes, sort=True).first().to_numpy(dtype=object)
+    return entries['paper'].to_numpy(dtype=np.int64), codes.astype(np.int64), names
+
+class Graph:
+    """정수 노드 ID의 CSR 희소 그래프
+
+    노드 i의 이웃은 indices[indptr[i]:indptr[i + 1]], 간선 가중치는
+    weights의 같은 위치입니다. 무방향 그래프는 간선을 양방향으로
+    저장합니다. 노드 수가 2^31 미만이면 indices는 int32입니다.
+    """
+
+    def __init__(self, labels, indptr, indices, weights, directed=False):
+        self.labels = np.asarray(labels, dtype=object)
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_edges(cls, labels, sources, targets, directed=False):
+        """간선 목록으로 그래프 생성 (같은 간선은 합쳐서 가중치로, 자기 자신 간선은 제외)"""
+        size = len(labels)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keep = sources != targets
+        sources, targets = sources[keep], targets[keep]
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+
+        keys, weights = np.unique(sources * size + targets, return_counts=True)
+        rows, indices = np.divmod(keys, size) if size else (keys, keys)
+        index_type = np.int32 if size < 2 ** 31 else np.int64
+        indptr = np.searchsorted(rows, np.arange(size + 1)).astype(np.int64)
+        return cls(labels, indptr, indices.astype(index_type), weights.astype(np.int32), directed)
+
+    @property
+    def n_nodes(self):
+        return len(self.labels)
+
+    @property
+    def n_edges(self):
+        """간선 수 (무방향 그래프는 양방향을 한 번만)"""
+        return len(self.indices) if self.directed else len(self.indices) // 2
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def _rows(self):
+        return np.repeat(np.arange(self.n_nodes, dtype=self.indices.dtype), np.diff(self.indptr))
+
+    def degree(self, weighted=False):
+        """나가는 차수 (weighted면 가중치 합: 공저 논문 수)"""
+        if not weighted:
+            return np.diff(self.indptr)
+        return np.bincount(self._rows(), weights=self.weights, minlength=self.n_nodes).astype(np.int64)
+
+    def in_degree(self, weighted=False):
+        """들어오는 차수 (인용 그래프에서 피인용 수)"""
+        return np.bincount(self.indices, weights=self.weights if weighted else None,
+                           minlength=self.n_nodes).astype(np.int64)
+
+    def components(self):
+        """(약)연결 요소 -> 노드별 요소 번호 (0부터, 큰 요소 순)
+
+        간선 단위로 작은 대표에 붙이고 경로를 압축하는 과정을 배열 연산으로
+        반복합니다 (반복 횟수는 대략 지름의 로그).
+        """
+        parent = np.arange(self.n_nodes, dtype=np.int64)
+        sources, targets = self._rows(), self.indices
+        while True:
+            a, b = parent[sources], parent[targets]
+            differs = a != b
+            if not differs.any():
+                break
+            np.minimum.at(parent, np.maximum(a[differs], b[differs]), np.minimum(a[differs], b[differs]))
+            # 경로 압축: 대표의 대표가 자기 자신이 될 때까지
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+        roots, labels, sizes = np.unique(parent, return_inverse=True, return_counts=True)
+        rank = np.empty(len(roots), dtype=np.int64)
+        rank[np.argsort(-sizes, kind='stable')] = np.arange(len(roots))
+        return rank[labels]
+
+    def pagerank(self, damping=0.85, tol=1e-6, max_iter=100):
+        """가중 PageRank (거듭제곱법, 나가는 간선이 없는 노드의 점수는 균등 분배)"""
+        size = self.n_nodes
+        if size == 0:
+            return np.empty(0)
+        rows = self._rows()
+        strength = np.bincount(rows, weights=self.weights, minlength=size)
+        dangling = strength == 0
+        edge_share = self.weights / strength[rows]
+        rank = np.full(size, 1.0 / size)
+        for _ in range(max_iter):
+            spread = np.bincount(self.indices, weights=rank[rows] * edge_share, minlength=size)
+            new_rank = (1 - damping) / size + damping * (spread + rank[dangling].sum() / size)
+            if np.abs(new_rank - rank).sum() < tol:
+                return new_rank
+            rank = new_rank
+        logging.warning(f"PageRank가 {max_iter}번 안에 수렴하지 않았습니다.")
+        return rank
+
+    def top(self, scores, limit=10):
+        """점수 상위 노드 [(이름, 점수)]"""
+        limit = min(limit, self.n_nodes)
+        if limit == 0:
+            return []
+        best = np.argpartition(-scores, limit - 1)[:limit]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.labels[i], scores[i].item()) for i in best]
+
+    def save(self, path):
+        np.savez(path, labels=self.labels.astype(str), indptr=self.indptr, indices=self.indices,
+                 weights=self.weights, directed=self.directed)
+
+    @classmethod
+    def load(cls, path):
+        arrays = np.load(path)
+        return cls(arrays['labels'].astype(object), arrays['indptr'], arrays['indices'],
+                   arrays['weights'], bool(arrays['directed']))
+
+def coauthor_graph(authors):
+    """저자 문자열 시리즈 -> 공저 그래프 (가중치: 함께 쓴 논문 수)"""
+    papers, codes, names = split_authors(authors)
+    first, second = group_pairs(papers, codes, MAX_AUTHORS_PER_PAPER)
+    return Graph.from_edges(names, first, second)
+
+def citation_graph(df):
+    """논문 DataFrame -> 인용 그래프 (노드: 논문 위치, 간선: 인용하는 논문 -> 인용된 논문)
+
+    references 컬럼의 참고문헌을 DOI로, DOI가 없으면 쉼표로 나눈 조각 중
+    데이터셋의 제목과 같은 것으로 연결합니다.
+    """
+    df = df.reset_index(drop=True)
+    references = df['references'].astype('string').str.split(REFERENCE_SEPARATOR, regex=True).explode()
+    references = references[references.notna() & (references != '')]
+    citing = references.index.to_numpy(dtype=np.int64)
+    references = references.reset_index(drop=True)
+
+    # DOI로 연결
+    node_dois = normalize_doi(df['doi'])
+    reference_dois = normalize_doi(references.str.extract(REFERENCE_DOI_PATTERN, expand=False)
+                                   .str.rstrip('.)'))
+    cited = _first_indexer(node_dois, reference_dois)
+    by_doi = cited >= 0
+
+    # DOI로 못 찾은 참고문헌은 조각을 제목으로 찾음
+    pending = np.flatnonzero(~by_doi)
+    segments = references.iloc[pending].str.split(',').explode()
+    segments = normalize_title(segments)
+    segments = segments[segments.str.len() >= MIN_REFERENCE_TITLE_LENGTH]
+    title_cited = _first_indexer(normalize_title(df['title']), segments)
+    found = title_cited >= 0
+    matched = pd.Series(title_cited[found], index=segments.index[found])
+    matched = matched[~matched.index.duplicated()]
+
+    # matched의 인덱스는 references의 위치 (explode가 원래 인덱스를 유지)
+    sources = np.concatenate([citing[by_doi], citing[matched.index.to_numpy()]])
+    targets = np.concatenate([cited[by_doi], matched.to_numpy()])
+    return Graph.from_edges(df['title'].astype(object).to_numpy(), sources, targets, directed=True)
+
+def _first_indexer(keys, values):
+    """values 각각이 keys에서 처음 나오는 위치 (없으면 -1)"""
+    keys = keys.reset_index(drop=True)
+    first = keys[keys.notna()].drop_duplicates()
+    positions = pd.Series(first.index.to_numpy(), index=pd.Index(first.to_numpy()))
+    return positions.reindex(values.to_numpy()).fillna(-1).to_numpy(dtype=np.int64)
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='공저/인용 네트워크 분석')
+    parser.add_argument('--output-dir', default='output')
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    df = read_papers(args.output_dir, columns=GRAPH_COLUMNS)
+    graph_dir = os.path.join(args.output_dir, 'graphs')
+    os.makedirs(graph_dir, exist_ok=True)
+
+    coauthors = coauthor_graph(df['author'])
+    coauthors.save(os.path.join(graph_dir, 'coauthors.npz'))
+    components = coauthors.components()
+    logging.info(f"공저 그래프: 저자 {coauthors.n_nodes}명, 관계 {coauthors.n_edges}개, "
+                 f"연결 요소 {components.max() + 1 if len(components) else 0}개")
+    print(f"\n[공저자가 많은 저자 상위 {args.top}]")
+    for name, degree in coauthors.top(coauthors.degree(), args.top):
+        print(f"{name}: {degree}")
+    print(f"\n[공저 PageRank 상위 {args.top}]")
+    for name, score in coauthors.top(coauthors.pagerank(), args.top):
+        print(f"{name}: {score:.6f}")
+
+    if df['references'].notna().any():
+        citations = citation_graph(df)
+        citations.save(os.path.join(graph_dir, 'citations.npz'))
+        logging.info(f"인용 그래프: 논문 {citations.n_nodes}개, 인용 {citations.n_edges}개")
+        print(f"\n[데이터셋 안에서 많이 인용된 논문 상위 {args.top}]")
+        for title, count in citations.top(citations.in_degree(), args.top):
+            print(f"{title}: {count}")
+    else:
+        logging.info("참고문헌(references) 컬럼이 없어 인용 그래프를 건너뜁니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import os
+import io
+import sys
+import json
+import time
+import bisect
+import pstats
+import cProfile
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+# 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Prometheus 지표 이름 접두어
+METRIC_PREFIX = 'paper'
+
+# output_dir 안의 지표/프로파일 저장 위치
+METRICS_DIR = 'metrics'
+PROFILES_DIR = 'profiles'
+
+# 프로파일할 단계: 'rename', 'download:sample,rename:cprofile', 'all' 등
+PROFILE_ENV = 'PAPER_PROFILE'
+PROFILE_MODES = ('cprofile', 'sample')
+
+# 샘플링 프로파일러 간격 (초)
+SAMPLE_INTERVAL = 0.005
+
+# 프로파일 요약으로 로그에 남길 함수 수
+PROFILE_TOP = 15
+
+class Histogram:
+    """구간별 개수, 합계, 최솟값/최댓값"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """구간 안을 선형 보간한 분위수 추정 (Prometheus histogram_quantile과 같은 방식)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(max(estimate, self.min), self.max)
+            seen += count
+        return self.max
+
+    def to_dict(self):
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.sum / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'buckets': buckets,
+        }
+
+class Metrics:
+    """카운터와 히스토그램 모음 (여러 스레드에서 동시에 기록 가능)
+
+    같은 이름의 값은 레이블(host, stage 등)별로 따로 셉니다. 작업
+    프로세스에서 잰 값은 결과와 함께 돌려받아 부모 프로세스에서 기록합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록의 실행 시간을 name 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def value(self, name, **labels):
+        """레이블이 맞는 카운터 값의 합"""
+        wanted = set(labels.items())
+        with self.lock:
+            return sum(value for (key, key_labels), value in self.counters.items()
+                       if key == name and wanted <= set(key_labels))
+
+    def histogram(self, name, **labels):
+        """레이블이 맞는 히스토그램 -> {레이블: Histogram}"""
+        wanted = set(labels.items())
+        with self.lock:
+            return {key_labels: histogram for (key, key_labels), histogram in self.histograms.items()
+                    if key == name and wanted <= set(key_labels)}
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                             for (name, labels), value in sorted(self.counters.items())],
+                'histograms': [{'name': name, 'labels': dict(labels), **histogram.to_dict()}
+                               for (name, labels), histogram in sorted(self.histograms.items(),
+                                                                        key=lambda item: item[0])],
+            }
+
+    def to_prometheus(self, job=None):
+        """Prometheus 텍스트 형식 (node_exporter textfile 수집기로 읽을 수 있음)"""
+        def series(name, labels, extra=()):
+            items = ([('job', job)] if job else []) + list(labels) + list(extra)
+            if not items:
+                return name
+            values = ','.join(f'{key}="{_escape_label(value)}"' for key, value in items)
+            return f'{name}{{{values}}}'
+
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items(), key=lambda item: item[0])
+        typed = set()
+        for (name, labels), value in counters:
+            metric = f'{METRIC_PREFIX}_{name}'
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{series(metric, labels)} {value}')
+        for (name, labels), histogram in histograms:
+            metric = f'{METRIC_PREFIX}_{name}'
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f'# TYPE {metric} histogram')
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{series(metric + "_bucket", labels, [("le", bound)])} {cumulative}')
+            lines.append(f'{series(metric + "_bucket", labels, [("le", "+Inf")])} {histogram.count}')
+            lines.append(f'{series(metric + "_sum", labels)} {histogram.sum:.6f}')
+            lines.append(f'{series(metric + "_count", labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, output_dir='output', name='metrics'):
+        """output_dir/metrics/<name>.json과 <name>.prom 저장 -> (json 경로, prom 경로)"""
+        metrics_dir = os.path.join(output_dir, METRICS_DIR)
+        os.makedirs(metrics_dir, exist_ok=True)
+        report = {'name': name, 'generated_at': datetime.now().isoformat(timespec='seconds'),
+                  **self.to_dict()}
+        json_path = os.path.join(metrics_dir, f'{name}.json')
+        prom_path = os.path.join(metrics_dir, f'{name}.prom')
+        write_atomic(json_path, json.dumps(report, ensure_ascii=False, indent=2))
+        write_atomic(prom_path, self.to_prometheus(job=name))
+        logging.info(f"지표 저장: {json_path}, {prom_path}")
+        return json_path, prom_path
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def write_atomic(path, content):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않음)"""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+# 프로세스 전체에서 공유하는 지표
+metrics = Metrics()
+
+class StackSampler(threading.Thread):
+    """모든 스레드의 호출 스택을 interval초마다 모으는 샘플링 프로파일러
+
+    cProfile은 켠 스레드만 보므로 다운로드 작업자처럼 여러 스레드에서
+    도는 단계는 샘플링으로 봅니다. 결과는 flamegraph.pl이나 speedscope가
+    읽는 folded 형식(스택;...;함수 개수)입니다.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(name='stack-sampler', daemon=True)
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        names = {}
+        while not self.stopped.wait(self.interval):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for ident, frame in sys._current_frames().items():
+                if ident == self.ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+    def save(self, path):
+        write_atomic(path, ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common()))
+        # 가장 많이 잡힌 함수 (스택 맨 위 기준)
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        total = sum(leaves.values()) or 1
+        return '\n'.join(f"{count / total * 100:5.1f}% {leaf}" for leaf, count in leaves.most_common(PROFILE_TOP))
+
+def profile_mode(stage):
+    """PAPER_PROFILE 환경 변수에서 stage의 프로파일 방식 ('cprofile', 'sample' 또는 None)"""
+    for item in os.environ.get(PROFILE_ENV, '').split(','):
+        name, _, mode = item.strip().partition(':')
+        if name in (stage, 'all'):
+            return mode or 'cprofile'
+    return None
+
+@contextmanager
+def measure_stage(name, output_dir='output'):
+    """단계 실행 시간을 stage_seconds에 기록하고, PAPER_PROFILE로 켠 단계는 프로파일을 남김
+
+    cprofile은 output_dir/profiles/<단계>_<시각>.prof(pstats/snakeviz로 열기),
+    sample은 .folded 파일을 남기고 상위 함수를 로그에 출력합니다.
+    """
+    mode = profile_mode(name)
+    if mode is not None and mode not in PROFILE_MODES:
+        logging.warning(f"알 수 없는 프로파일 방식: {mode} (가능: {', '.join(PROFILE_MODES)})")
+        mode = None
+    profiler = None
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == 'sample':
+        profiler = StackSampler()
+        profiler.start()
+    try:
+        with metrics.timer('stage_seconds', stage=name):
+            yield
+    finally:
+        if profiler is not None:
+            _save_profile(profiler, name, mode, output_dir)
+
+def _save_profile(profiler, name, mode, output_dir):
+    profiles_dir = os.path.join(output_dir, PROFILES_DIR)
+    os.makedirs(profiles_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if mode == 'cprofile':
+        profiler.disable()
+        path = os.path.join(profiles_dir, f'{name}_{timestamp}.prof')
+        profiler.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_TOP)
+        summary = summary.getvalue().strip()
+    else:
+        profiler.stop()
+        path = os.path.join(profiles_dir, f'{name}_{timestamp}.folded')
+        summary = profiler.save(path)
+    logging.info(f"{name} 단계 프로파일 저장: {path}\n{summary}")
+    return path
@@ -0,0 +1,339 @@
+import os
+import json
+import time
+import queue
+import logging
+import argparse
+import threading
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from extraction_cache import ExtractionCache
+from integrate_papers import integrate_papers, load_config
+from paper_analytics import load_analytics
+from paper_downloader import PaperDownloader
+from paper_metrics import PROFILE_ENV, measure_stage, metrics
+from paper_search import open_index
+from papers_dataset import (ANALYTICS_COLUMNS, DOWNLOAD_COLUMNS, RENAME_COLUMNS, latest_dataset,
+                            read_dataset)
+from rename_papers import (EXTRACTOR_VERSION, PaperRenamer, extract_pdf_info, extraction_executor,
+                           is_already_renamed, papers_info_from_dataframe, record_extraction)
+from visualize_papers import render_report
+
+# 파이프라인 단계 (변환은 통합 단계가 .bib을 직접 읽으므로 통합에 포함)
+STAGES = ('integrate', 'download', 'rename', 'report', 'index')
+
+# 단계 사이 큐 크기 (가득 차면 앞 단계가 기다림)
+QUEUE_SIZE = 32
+
+# 다운로드를 시작하기 전에 한 번에 해석할 DOI 수
+RESOLVE_BATCH_SIZE = 50
+
+# output_dir 안의 단계별 완료 기록
+CHECKPOINT_FILE = 'pipeline_checkpoint.json'
+
+# 큐의 끝 표시
+_DONE = object()
+
+class PipelineCheckpoint:
+    """단계별 완료 기록
+
+    통합 데이터셋 경로와 함께 저장하므로 데이터셋이 바뀌면 이전 기록은
+    무시하고 모든 단계를 다시 실행합니다. 단계 안의 진행 상황은 다운로드
+    매니페스트와 추출 캐시가 논문/파일 단위로 기록합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.state = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    def start(self, dataset, resume=True):
+        if not resume or self.state.get('dataset') != dataset:
+            self.state = {'dataset': dataset, 'stages': {}}
+            self.save()
+
+    def is_done(self, stage):
+        return stage in self.state.get('stages', {})
+
+    def mark_done(self, stage, **info):
+        with self.lock:
+            self.state['stages'][stage] = {'finished': datetime.now().isoformat(timespec='seconds'), **info}
+            self.save()
+
+    def save(self):
+        # 임시 파일에 쓴 뒤 교체 (중간에 멈춰도 기록이 깨지지 않음)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+
+class Pipeline:
+    """통합 -> (DOI 해석 -> 다운로드 -> 식별/이름 변경) + 보고서를 한 번에 실행
+
+    통합 데이터셋은 한 번만 읽어 모든 단계가 같은 DataFrame을 씁니다.
+    DOI는 묶음 단위로 해석해 바로 다운로드 큐에 넣고, 다운로드가 끝난
+    PDF는 곧바로 식별 단계로 넘어가므로 단계들이 겹쳐서 실행됩니다.
+    보고서는 데이터셋만 필요하므로 다운로드와 동시에 그립니다. 큐는
+    크기가 정해져 있어 느린 단계가 앞 단계를 붙잡습니다.
+    """
+
+    def __init__(self, config_path='config.json', use_processes=True, queue_size=QUEUE_SIZE,
+                 resolve_batch_size=RESOLVE_BATCH_SIZE):
+        self.config = load_config(config_path)
+        # 완료 기록과 지표를 output_dir 아래에 저장하므로 먼저 만들어 둠
+        os.makedirs(self.config['output_dir'], exist_ok=True)
+        self.downloader = PaperDownloader(config_path)
+        self.use_processes = use_processes
+        self.queue_size = queue_size
+        self.resolve_batch_size = resolve_batch_size
+        self.output_dir = self.config['output_dir']
+        self.download_dir = Path(self.downloader.config['download_dir'])
+        self.checkpoint = PipelineCheckpoint(os.path.join(self.output_dir, CHECKPOINT_FILE))
+        # 스레드가 여럿 떠 있는 상태에서 fork하지 않도록 작업 프로세스는 forkserver로 생성
+        methods = multiprocessing.get_all_start_methods()
+        self.mp_context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self.stop = threading.Event()
+        self.errors = []
+        self.timings = {}
+
+    def run(self, resume=True, stages=STAGES):
+        """파이프라인 실행 -> 단계별 (시작, 끝) 시각"""
+        started = time.perf_counter()
+        if 'integrate' in stages:
+            dataset = self._timed('integrate', self.integrate)
+        else:
+            dataset = latest_dataset(self.output_dir)
+        if dataset is None:
+            return self.timings
+        self.checkpoint.start(dataset, resume)
+        if 'integrate' in stages:
+            self.checkpoint.mark_done('integrate')
+
+        # 통합 데이터셋을 한 번만 읽어 모든 단계가 공유
+        df = read_dataset(dataset)
+        logging.info(f"통합 데이터셋: {dataset} ({len(df)}개 레코드)")
+
+        self.download_dir.mkdir(exist_ok=True)
+        running = [stage for stage in ('report', 'download', 'rename')
+                   if stage in stages and not self.checkpoint.is_done(stage)]
+        # 받은 PDF를 넘길 큐는 식별 단계가 실행될 때만 (받는 쪽이 없으면 가득 차서 멈춤)
+        pdf_queue = queue.Queue(maxsize=self.queue_size) if 'rename' in running else None
+        if pdf_queue is not None and 'download' not in running:
+            pdf_queue.put(_DONE)
+        threads = []
+        for stage, target, args in [
+            ('report', self.report, (dataset, df)),
+            ('download', self.download, (df, pdf_queue)),
+            ('rename', self.rename, (df, pdf_queue)),
+        ]:
+            if stage not in running:
+                logging.info(f"단계 건너뛰기: {stage}")
+                continue
+            thread = threading.Thread(target=self._run_stage, args=(stage, target, args),
+                                      name=f'pipeline-{stage}')
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+        if self.errors:
+            stage, error = self.errors[0]
+            raise RuntimeError(f"파이프라인 {stage} 단계 실패: {error}") from error
+
+        # 검색 색인은 이름을 바꾼 PDF의 본문까지 넣으므로 다른 단계가 끝난 뒤 실행
+        if 'index' in stages and not self.checkpoint.is_done('index'):
+            self._timed('index', self.index, df)
+            self.checkpoint.mark_done('index')
+        else:
+            logging.info("단계 건너뛰기: index")
+
+        total = time.perf_counter() - started
+        for stage, (start, end) in self.timings.items():
+            logging.info(f"- {stage}: {end - start:.2f}s")
+        logging.info(f"파이프라인 완료: 전체 {total:.2f}s "
+                     f"(단계 합계 {sum(end - start for start, end in self.timings.values()):.2f}s)")
+        metrics.observe('pipeline_seconds', total)
+        metrics.write(self.output_dir, 'pipeline')
+        return self.timings
+
+    def _timed(self, name, target, *args):
+        start = time.perf_counter()
+        try:
+            with measure_stage(name, self.output_dir):
+                return target(*args)
+        finally:
+            self.timings[name] = (start, time.perf_counter())
+
+    def _run_stage(self, stage, target, args):
+        try:
+            self._timed(stage, target, *args)
+            if not self.stop.is_set():
+                self.checkpoint.mark_done(stage)
+        except BaseException as e:
+            logging.error(f"{stage} 단계 오류: {e}")
+            self.errors.append((stage, e))
+            # 다른 단계가 큐에서 기다리다 멈추지 않도록 중단 신호
+            self.stop.set()
+
+    def _put(self, q, item):
+        """큐가 가득 차면 기다림 (중단 신호가 오면 False)"""
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        """큐에서 꺼냄 (중단 신호가 오면 _DONE)"""
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def integrate(self):
+        """원본(.bib 포함) 통합 (바뀐 원본이 없으면 이전 결과 재사용)"""
+        return integrate_papers(self.config)
+
+    def download(self, df, pdf_queue):
+        """DOI를 묶음으로 해석하면서 다운로드하고, 받은 PDF를 식별 큐로 넘김
+
+        식별 단계를 실행하지 않으면 pdf_queue는 None이고 PDF를 넘기지 않습니다.
+        """
+        downloader = self.downloader
+        # 중복 제거는 설정(dedup_before_download)했을 때만
+        papers_df = downloader.deduplicate(df.reindex(columns=DOWNLOAD_COLUMNS))
+        stats = downloader.new_stats(len(papers_df))
+        downloader.open_stores(self.download_dir)
+        try:
+            candidates, targets = downloader.plan_downloads(papers_df, self.download_dir, stats)
+            logging.info(f"다운로드 대상: {len(candidates)}개")
+            job_queue = queue.Queue(maxsize=self.queue_size)
+            lock = threading.Lock()
+
+            def work():
+                try:
+                    while True:
+                        job = self._get(job_queue)
+                        if job is _DONE:
+                            return
+                        success = downloader._download_job(job)
+                        with lock:
+                            stats['success' if success else 'failed'] += 1
+                        if success and pdf_queue is not None:
+                            self._put(pdf_queue, str(job[2]))
+                except BaseException as e:
+                    logging.error(f"download 작업 오류: {e}")
+                    self.errors.append(('download', e))
+                    self.stop.set()
+
+            workers = [threading.Thread(target=work, name=f'pipeline-download-{i}')
+                       for i in range(downloader.config['max_workers'])]
+            for worker in workers:
+                worker.start()
+            try:
+                for job in downloader.iter_download_jobs(candidates, targets, stats,
+                                                         self.resolve_batch_size):
+                    if not self._put(job_queue, job):
+                        break
+            finally:
+                for _ in workers:
+                    self._put(job_queue, _DONE)
+                for worker in workers:
+                    worker.join()
+        finally:
+            downloader.close_stores()
+            if pdf_queue is not None:
+                self._put(pdf_queue, _DONE)
+        downloader._generate_report(stats, self.download_dir)
+
+    def rename(self, df, pdf_queue):
+        """받은 PDF를 바로 식별해 이름 변경 (이전 실행에서 남은 PDF부터 처리)"""
+        papers_info = papers_info_from_dataframe(df.reindex(columns=RENAME_COLUMNS))
+        cache = ExtractionCache(str(self.download_dir / '.extraction_cache.sqlite'), EXTRACTOR_VERSION)
+        renamer = PaperRenamer(papers_info, cache)
+        workers = os.cpu_count() or 1
+        in_flight = {}
+
+        def finish(futures):
+            for future in futures:
+                pdf_path = in_flight.pop(future)
+                info = future.result()
+                record_extraction(info)
+                cache.put(pdf_path, info)
+                logging.info(renamer.rename(os.path.basename(pdf_path), pdf_path, info))
+
+        def submit(executor, pdf_path):
+            pdf_file = os.path.basename(pdf_path)
+            if not os.path.exists(pdf_path) or is_already_renamed(pdf_file, papers_info):
+                return
+            info = cache.get_many([pdf_path]).get(pdf_path)
+            metrics.inc('extraction_cache_total', result='miss' if info is None else 'hit')
+            if info is not None:
+                logging.info(renamer.rename(pdf_file, pdf_path, info))
+                return
+            # 추출 중인 파일 수도 제한 (가득 차면 하나가 끝날 때까지 기다림)
+            if len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                finish(done)
+            in_flight[executor.submit(extract_pdf_info, pdf_path)] = pdf_path
+
+        # 이전 실행에서 받았지만 아직 이름을 바꾸지 못한 PDF
+        leftover = sorted(str(self.download_dir / name) for name in os.listdir(self.download_dir)
+                          if name.endswith('.pdf'))
+        try:
+            with extraction_executor(workers, self.use_processes, self.mp_context) as executor:
+                for pdf_path in leftover:
+                    submit(executor, pdf_path)
+                while True:
+                    pdf_path = self._get(pdf_queue)
+                    if pdf_path is _DONE:
+                        break
+                    submit(executor, pdf_path)
+                finish(list(wait(in_flight).done))
+        finally:
+            cache.close()
+        renamer.log_hit_rates()
+
+    def index(self, df):
+        """공유 데이터셋과 download_dir의 PDF로 검색 색인 갱신 (바뀐 문서만 다시 색인)"""
+        open_index(self.output_dir).update(df, str(self.download_dir), self.use_processes)
+
+    def report(self, dataset, df):
+        """공유 데이터셋으로 집계(데이터셋 버전별 캐시)와 보고서 그래프 생성"""
+        analytics = load_analytics(self.output_dir, path=dataset, df=df.reindex(columns=ANALYTICS_COLUMNS))
+        render_report(analytics, os.path.join(self.output_dir, 'visualization'),
+                      mp_context=self.mp_context)
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='논문 통합/다운로드/이름 변경/보고서 파이프라인')
+    parser.add_argument('--config', default='config.json')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"실행할 단계 (쉼표로 구분, 기본: {','.join(STAGES)})")
+    parser.add_argument('--fresh', action='store_true', help='완료 기록을 무시하고 처음부터 실행')
+    parser.add_argument('--threads', action='store_true', help='PDF 추출을 프로세스 대신 스레드로')
+    parser.add_argument('--profile', help=f"프로파일할 단계 ({PROFILE_ENV}와 같음, 예: rename,download:sample)")
+    args = parser.parse_args()
+    if args.profile:
+        os.environ[PROFILE_ENV] = args.profile
+
+    pipeline = Pipeline(args.config, use_processes=not args.threads)
+    pipeline.run(resume=not args.fresh, stages=tuple(args.stages.split(',')))
+
+if __name__ == "__main__":
+    main()
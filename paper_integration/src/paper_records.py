@@ -0,0 +1,189 @@
+import sys
+from array import array
+
+import numpy as np
+import pandas as pd
+
+# 논문 레코드를 메모리에 작게 들고 있기 위한 자료 구조
+# 레코드마다 딕셔너리를 만드는 대신 필드별 열(리스트/배열)에 모으고,
+# 값 종류가 적은 필드는 문자열 객체 하나를 공유하거나 category 코드로,
+# 연도는 정수 배열로 둡니다. 제목 대신 정수 행 번호로 논문을 가리킵니다.
+
+# 값 종류가 적은 필드: 모을 때 sys.intern으로 같은 문자열 객체를 공유하고
+# DataFrame으로 만들 때 category로 변환
+CATEGORICAL_COLUMNS = ('source', 'document_type', 'publisher', 'journal', 'booktitle')
+
+# 정수 연도 배열에서 연도가 없거나 숫자가 아닌 값 (int16 범위 안의 연도만 인정)
+MISSING_YEAR = 0
+MAX_YEAR = 2 ** 15 - 1
+
+# 해시할 때 한 번에 파이썬 문자열로 꺼내는 값 수 (역색인을 만들 때의 최대 메모리)
+HASH_BATCH = 65536
+
+def parse_year(value):
+    """'2020' -> 2020 (없거나 정수 연도가 아니면 MISSING_YEAR)"""
+    try:
+        year = float(value)
+    except (TypeError, ValueError):
+        return MISSING_YEAR
+    if year.is_integer() and MISSING_YEAR < year <= MAX_YEAR:
+        return int(year)
+    return MISSING_YEAR
+
+def compact_years(values):
+    """연도 시리즈 -> Int16 배열 (정수 연도가 아닌 값은 NA)"""
+    years = pd.to_numeric(pd.Series(values), errors='coerce').astype('Float64')
+    valid = (years > MISSING_YEAR) & (years <= MAX_YEAR) & (years % 1 == 0)
+    return years.where(valid).astype('Int16').array
+
+class RecordColumns:
+    """레코드(필드 -> 값 딕셔너리)를 필드별 열로 모으는 버퍼
+
+    레코드 딕셔너리는 append한 뒤 버려지므로 레코드 수만큼 딕셔너리가
+    쌓이지 않습니다. 레코드마다 있는 필드가 달라도 되며, 처음 나온
+    필드의 빠진 값은 None으로 채웁니다(나중에 한꺼번에). year는 정수 배열
+    (array('h'))에, CATEGORICAL_COLUMNS 값은 intern한 문자열로 모읍니다.
+    """
+
+    __slots__ = ('columns', 'rows')
+
+    def __init__(self):
+        self.columns = {}
+        self.rows = 0
+
+    def __len__(self):
+        return self.rows
+
+    def _padding(self, field, count):
+        """빠진 값 count개 (year는 MISSING_YEAR, 나머지는 None)"""
+        if field == 'year':
+            return array('h', [MISSING_YEAR]) * count
+        return [None] * count
+
+    def append(self, record):
+        columns = self.columns
+        rows = self.rows
+        for field, value in record.items():
+            column = columns.get(field)
+            if column is None:
+                column = columns[field] = self._padding(field, rows)
+            elif len(column) < rows:
+                # 앞 레코드들에 없던 필드는 값이 들어올 때 한꺼번에 채움
+                column.extend(self._padding(field, rows - len(column)))
+            if field == 'year':
+                column.append(parse_year(value))
+            elif field in CATEGORICAL_COLUMNS and type(value) is str:
+                column.append(sys.intern(value))
+            else:
+                column.append(value)
+        self.rows = rows + 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+        return self
+
+    def to_frame(self, categories=CATEGORICAL_COLUMNS):
+        """DataFrame으로 변환 (컬럼 순서는 필드가 처음 나온 순서)
+
+        year는 Int16, categories에 있는 필드는 category, 나머지는 string
+        컬럼입니다. 정수 연도가 하나도 없으면 year 컬럼을 만들지 않습니다.
+        변환한 열은 바로 버리므로 변환 후 버퍼는 비어 있습니다.
+        """
+        data = {}
+        rows = self.rows
+        for field in list(self.columns):
+            column = self.columns.pop(field)
+            column.extend(self._padding(field, rows - len(column)))
+            if field == 'year':
+                years = np.array(column, dtype=np.int16)
+                missing = years == MISSING_YEAR
+                if not missing.all():
+                    data[field] = pd.arrays.IntegerArray(years, missing)
+            elif field in categories:
+                data[field] = pd.Categorical(column)
+            else:
+                data[field] = pd.array(column, dtype='string')
+            del column
+        self.rows = 0
+        return pd.DataFrame(data, index=pd.RangeIndex(rows))
+
+def hash_values(values):
+    """문자열 배열 -> 64비트 해시 (pyarrow 문자열 배열과 파이썬 문자열이 같은 값)"""
+    return pd.util.hash_array(values if isinstance(values, pd.api.extensions.ExtensionArray)
+                              else np.asarray(values, dtype=object))
+
+class HashLookup:
+    """문자열 -> 행 번호 역색인
+
+    값마다 파이썬 문자열과 딕셔너리 항목을 만드는 dict 대신 정렬한 64비트
+    해시 배열과 행 번호 배열만 두고, 해시가 같은 행은 원본 배열의 값과
+    비교해 확인합니다. 같은 값이 여러 행에 있으면 dict에 차례로 넣은
+    것처럼 마지막 행을 돌려줍니다. NA와 빈 문자열은 색인하지 않습니다.
+    """
+
+    __slots__ = ('values', 'hashes', 'rows')
+
+    def __init__(self, values):
+        self.values = values
+        present = np.flatnonzero(pd.Series(values, dtype='string').fillna('').ne('').to_numpy())
+        hashes = np.concatenate([np.empty(0, dtype=np.uint64)] + [
+            hash_values(values[present[start:start + HASH_BATCH]])
+            for start in range(0, len(present), HASH_BATCH)])
+        order = np.argsort(hashes, kind='stable')
+        self.hashes = hashes[order]
+        self.rows = present[order].astype(np.int32)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, value):
+        return self.get(value) is not None
+
+    def get(self, value, default=None):
+        if not isinstance(value, str) or not value:
+            return default
+        key = hash_values([value])[0]
+        start = np.searchsorted(self.hashes, key, side='left')
+        end = np.searchsorted(self.hashes, key, side='right')
+        for row in reversed(self.rows[start:end].tolist()):
+            if self.values[row] == value:
+                return row
+        return default
+
+class PapersInfo:
+    """이름 변경용 논문 정보 표 (rename_papers)
+
+    논문은 행 번호(0..n-1)로 가리킵니다. 제목, 정규화한 DOI, 파일명은
+    pyarrow 문자열 배열, 연도는 Int16 배열, 출처는 category로 두고
+    파일명/DOI 역색인(by_filename, by_doi)은 행 번호를 돌려줍니다.
+    예전의 제목 -> 정보 딕셔너리처럼 논문마다 딕셔너리와 문자열 객체를
+    만들지 않습니다.
+    """
+
+    __slots__ = ('titles', 'years', 'sources', 'dois', 'filenames', 'by_filename', 'by_doi')
+
+    def __init__(self, titles, years, sources, dois, filenames):
+        self.titles = titles
+        self.years = years
+        self.sources = sources
+        self.dois = dois
+        self.filenames = filenames
+        self.by_filename = HashLookup(filenames)
+        self.by_doi = HashLookup(dois)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def paper(self, paper_id):
+        """논문 하나의 정보 딕셔너리 (로그/디버깅용)"""
+        year = self.years[paper_id]
+        source = self.sources[paper_id]
+        doi = self.dois[paper_id]
+        return {
+            'title': self.titles[paper_id],
+            'year': None if pd.isna(year) else int(year),
+            'source': None if pd.isna(source) else source,
+            'doi': None if pd.isna(doi) else doi,
+            'filename': self.filenames[paper_id],
+        }
@@ -0,0 +1,681 @@
+import os
+import re
+import json
+import time
+import shutil
+import sqlite3
+import logging
+import argparse
+import functools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from download_manifest import manifest_keys
+from extraction_cache import ExtractionCache
+from paper_columns import download_filename, paper_filename, text
+from paper_metrics import measure_stage, metrics
+from papers_dataset import SEARCH_COLUMNS, read_papers
+from rename_papers import TEXT_EXTRACTOR_VERSION, extract_pdf_text, extraction_executor
+
+# output_dir 안의 검색 색인 위치
+SEARCH_INDEX_DIR = 'search_index'
+
+# 토큰화나 점수 방식이 바뀌면 올려서 색인을 다시 만듦
+INDEX_VERSION = 1
+
+# 필드별 가중치: 토큰 빈도에 곱해 문서 하나의 가중 빈도로 합침 (BM25F)
+FIELD_WEIGHTS = {'title': 3, 'keywords': 2, 'author': 1, 'publication': 1, 'abstract': 1, 'fulltext': 1}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 토큰 구분자: ASCII 문장부호, 라틴-1 기호, 일반 문장부호(따옴표/대시 등), CJK 문장부호, 공백
+# (pyarrow 정규식의 \w는 ASCII만 포함하므로 \W 대신 구간으로 지정)
+TOKEN_SEPARATORS = '[!-/:-@\\[-`{-~\u00a0-\u00bf\u2000-\u206f\u3000-\u303f\\s]+'
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 40
+
+_SEPARATORS = re.compile(TOKEN_SEPARATORS)
+
+STOPWORDS = frozenset('an and are as at be by for from has have in into is it its of on or that the '
+                      'their this to was were which with'.split())
+
+# 가중 빈도 상한 (uint16으로 저장)
+MAX_FREQ = np.iinfo(np.uint16).max
+
+# 한 번에 토큰화할 문서 수와 조각 하나의 최대 문서 수
+BATCH_DOCS = 20000
+SEGMENT_DOCS = 100000
+
+# 작은 조각(SEGMENT_DOCS의 1/4 미만)이 이만큼 쌓이면 하나로 합침
+MERGE_SEGMENTS = 4
+
+# download_dir 안의 PDF 본문 캐시
+TEXT_CACHE_FILE = '.text_cache.sqlite'
+
+# 검색 결과에 담는 문서 정보
+RESULT_COLUMNS = ('key', 'title', 'author', 'year', 'source', 'venue', 'doi', 'pdf')
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS documents (
+        id INTEGER PRIMARY KEY,
+        key TEXT NOT NULL UNIQUE,
+        signature TEXT NOT NULL,
+        segment INTEGER NOT NULL,
+        length REAL NOT NULL,
+        title TEXT,
+        author TEXT,
+        year INTEGER,
+        source TEXT,
+        venue TEXT,
+        doi TEXT,
+        pdf TEXT
+    );
+    CREATE INDEX IF NOT EXISTS documents_segment ON documents (segment);
+    CREATE TABLE IF NOT EXISTS segments (
+        id INTEGER PRIMARY KEY,
+        docs INTEGER NOT NULL,
+        postings INTEGER NOT NULL,
+        created TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+'''
+
+def tokenize(values):
+    """문자열 시리즈 -> 토큰 시리즈 (인덱스는 원래 행 위치)
+
+    소문자로 바꿔 문장부호와 공백으로 나누고, 너무 짧거나 긴 토큰과
+    불용어는 뺍니다. 질의도 같은 함수로 나눕니다.
+    """
+    values = values.reset_index(drop=True).astype('string').fillna('')
+    tokens = values.str.lower().str.replace(TOKEN_SEPARATORS, ' ', regex=True).str.split().explode()
+    tokens = tokens[tokens.notna()]
+    length = tokens.str.len()
+    return tokens[(length >= MIN_TOKEN_LENGTH) & (length <= MAX_TOKEN_LENGTH) & ~tokens.isin(STOPWORDS)]
+
+def query_terms(query):
+    """질의 문자열 -> 용어 해시 (tokenize와 같은 규칙, 한 줄이라 pandas를 거치지 않음)"""
+    tokens = {token for token in _SEPARATORS.split(str(query).lower())
+              if MIN_TOKEN_LENGTH <= len(token) <= MAX_TOKEN_LENGTH and token not in STOPWORDS}
+    return np.unique(hash_terms(sorted(tokens)))
+
+def hash_terms(terms):
+    """토큰 -> 64비트 용어 해시 (색인은 문자열 대신 정렬한 해시를 저장)"""
+    return pd.util.hash_array(np.asarray(terms, dtype=object))
+
+def build_postings(fields, ids):
+    """문서 필드 DataFrame -> (용어 해시, 문서 id, 가중 빈도, 문서 길이)
+
+    필드마다 토큰 빈도에 FIELD_WEIGHTS를 곱해 더하고, 문서 길이도 같은
+    가중치로 셉니다. 앞의 세 배열은 (용어, 문서) 쌍마다 한 줄입니다.
+    """
+    fields = fields.reset_index(drop=True)
+    n = len(fields)
+    parts, weights = [], []
+    for field, weight in FIELD_WEIGHTS.items():
+        if field in fields.columns:
+            tokens = tokenize(fields[field])
+            parts.append(tokens)
+            weights.append(np.full(len(tokens), weight, dtype=np.float64))
+    tokens = pd.concat(parts)
+    weights = np.concatenate(weights)
+    positions = tokens.index.to_numpy(dtype=np.int64)
+
+    codes, terms = pd.factorize(tokens)
+    pairs, inverse = np.unique(codes.astype(np.int64) * n + positions, return_inverse=True)
+    freqs = np.minimum(np.bincount(inverse, weights=weights), MAX_FREQ).astype(np.uint16)
+    lengths = np.bincount(positions, weights=weights, minlength=n)
+    return hash_terms(terms)[pairs // n], ids[pairs % n].astype(np.int32), freqs, lengths
+
+class Segment:
+    """한 번 쓰면 바뀌지 않는 역색인 조각
+
+    용어 해시 순으로 정렬한 CSR 형태로, 용어 terms[i]가 나오는 문서는
+    docs[starts[i]:starts[i + 1]], 가중 빈도는 freqs의 같은 위치입니다.
+    배열은 .npy 파일을 메모리 맵으로 열어 질의에 필요한 부분만 읽습니다.
+    """
+
+    ARRAYS = ('terms', 'starts', 'docs', 'freqs')
+
+    def __init__(self, terms, starts, docs, freqs):
+        self.terms = terms
+        self.starts = starts
+        self.docs = docs
+        self.freqs = freqs
+
+    @classmethod
+    def from_postings(cls, terms, docs, freqs):
+        # 문서 id 순으로 들어온 쌍을 용어 순으로 (같은 용어 안에서는 문서 순서 유지)
+        order = np.argsort(terms, kind='stable')
+        terms = terms[order]
+        starts = np.flatnonzero(np.r_[True, terms[1:] != terms[:-1]]) if len(terms) else np.array([], np.int64)
+        return cls(terms[starts], np.append(starts, len(terms)).astype(np.int64), docs[order], freqs[order])
+
+    @property
+    def n_postings(self):
+        return len(self.docs)
+
+    def postings(self, term):
+        """용어 해시의 (문서 id, 가중 빈도) (없으면 None)"""
+        i = np.searchsorted(self.terms, term)
+        if i == len(self.terms) or self.terms[i] != term:
+            return None
+        start, end = self.starts[i], self.starts[i + 1]
+        return self.docs[start:end], self.freqs[start:end]
+
+    def all_postings(self):
+        """(용어 해시, 문서 id, 가중 빈도) 전체 (조각 병합용)"""
+        return np.repeat(self.terms, np.diff(self.starts)), self.docs, self.freqs
+
+    def save(self, path):
+        # 임시 디렉터리에 다 쓴 뒤 이름을 바꿔 반쯤 쓴 조각이 보이지 않게 함
+        temp_path = path + '.tmp'
+        shutil.rmtree(temp_path, ignore_errors=True)
+        os.makedirs(temp_path)
+        for name in self.ARRAYS:
+            np.save(os.path.join(temp_path, f'{name}.npy'), getattr(self, name))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        return cls(*(np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r') for name in cls.ARRAYS))
+
+def index_documents(df):
+    """데이터셋 -> 색인할 문서 DataFrame
+
+    키는 다운로드 매니페스트와 같은 DOI/제목 키이고, 서명은 색인하는
+    컬럼 값의 해시라서 레코드가 바뀌면 서명도 바뀝니다.
+    """
+    df = df.reset_index(drop=True)
+    fields = pd.DataFrame({column: text(df, column) for column in SEARCH_COLUMNS})
+    docs = fields.assign(
+        key=manifest_keys(df).astype('string'),
+        signature=pd.util.hash_pandas_object(fields, index=False).map('{:016x}'.format).astype('string'),
+        year=pd.to_numeric(fields['year'], errors='coerce').round().astype('Int64'),
+    )
+    docs = docs[docs['key'].notna() & (docs['key'] != 'title:')]
+    return docs.drop_duplicates('key')
+
+def attach_pdfs(docs, df, download_dir):
+    """download_dir의 PDF를 문서에 연결 (pdf 컬럼, 서명에 파일 크기/수정 시각 추가)
+
+    rename_papers가 붙인 이름이나 다운로더가 저장한 이름으로 레코드를
+    찾고, 찾지 못한 PDF는 'pdf:<파일명>' 키의 문서로 따로 색인합니다.
+    """
+    names = sorted(name for name in os.listdir(download_dir) if name.endswith('.pdf'))
+    df = df.reset_index(drop=True)
+    keys = manifest_keys(df).to_numpy()
+    by_name = pd.concat([pd.Series(keys, index=(paper_filename(df) + '.pdf').to_numpy()),
+                         pd.Series(keys, index=download_filename(df).to_numpy())])
+    by_name = by_name[by_name.notna()]
+    by_name = by_name[~by_name.index.duplicated()]
+
+    stats = [os.stat(os.path.join(download_dir, name)) for name in names]
+    pdfs = pd.DataFrame({
+        'key': by_name.reindex(names).to_numpy(),
+        'pdf': [os.path.join(download_dir, name) for name in names],
+        'stamp': [f":{stat.st_size}:{stat.st_mtime_ns}" for stat in stats],
+        'name': [os.path.splitext(name)[0] for name in names],
+    }, dtype='string')
+    pdfs['key'] = pdfs['key'].fillna('pdf:' + pdfs['name'])
+    pdfs = pdfs.drop_duplicates('key')
+
+    docs = docs.merge(pdfs, on='key', how='outer')
+    docs['title'] = docs['title'].fillna(docs['name'])
+    docs['signature'] = docs['signature'].fillna('') + docs['stamp'].fillna('')
+    return docs.drop(columns=['stamp', 'name'])
+
+def extract_texts(paths, download_dir, use_processes=True):
+    """PDF 경로 -> 본문 텍스트 (download_dir의 본문 캐시에 없는 파일만 추출)"""
+    cache = ExtractionCache(os.path.join(download_dir, TEXT_CACHE_FILE), TEXT_EXTRACTOR_VERSION)
+    try:
+        found = cache.get_many(paths)
+        missing = [path for path in paths if path not in found]
+        metrics.inc('text_cache_total', len(found), result='hit')
+        metrics.inc('text_cache_total', len(missing), result='miss')
+        if missing:
+            logging.info(f"PDF 본문 추출: {len(missing)}개 (캐시 재사용 {len(found)}개)")
+            workers = os.cpu_count() or 1
+            with extraction_executor(workers, use_processes) as executor:
+                chunksize = max(1, len(missing) // (workers * 4)) if use_processes else 1
+                for path, info in zip(missing, executor.map(extract_pdf_text, missing, chunksize=chunksize)):
+                    metrics.observe('pdf_text_seconds', info['seconds'])
+                    found[path] = info
+                    cache.put(path, info)
+            cache.flush()
+    finally:
+        cache.close()
+    return {path: info['text'] for path, info in found.items()}
+
+class SearchIndex:
+    """BM25 전문 검색 색인
+
+    문서 정보와 변경 감지용 서명은 SQLite(index.sqlite)에, 역색인은
+    조각(segments/<번호>/*.npy)에 저장합니다. update는 새로 생기거나
+    바뀐 문서만 새 조각으로 추가하고, 바뀌거나 사라진 문서의 이전 id는
+    documents에서 지워 질의에서 빠지게 합니다. 작은 조각이 쌓이거나
+    지워진 문서가 절반을 넘는 조각은 합칩니다.
+
+    질의는 메모리에 올린 문서 배열(길이, 연도, 출처, 학회)과 조각의
+    메모리 맵만 사용합니다. 한 인스턴스를 여러 스레드가 함께 쓸 수 있고,
+    다른 프로세스가 색인을 갱신하면 다음 질의에서 다시 읽습니다.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        os.makedirs(os.path.join(self.path, 'segments'), exist_ok=True)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(os.path.join(self.path, 'index.sqlite'), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(_SCHEMA)
+        version = self._meta('version')
+        if version != str(INDEX_VERSION):
+            if version is not None:
+                logging.info(f"색인 형식이 바뀌어 색인을 비웁니다 ({version} -> {INDEX_VERSION})")
+            self.clear()
+        else:
+            self._load()
+
+    def _meta(self, name, default=None):
+        row = self.conn.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, **values):
+        self.conn.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                              [(name, str(value)) for name, value in values.items()])
+
+    def _segment_path(self, segment):
+        return os.path.join(self.path, 'segments', str(segment))
+
+    def clear(self):
+        """모든 문서와 조각 삭제"""
+        with self.lock:
+            self.conn.execute('DELETE FROM documents')
+            self.conn.execute('DELETE FROM segments')
+            self.conn.execute('DELETE FROM meta')
+            self._set_meta(version=INDEX_VERSION, next_doc=0, next_segment=0, generation=0)
+            self.conn.commit()
+            shutil.rmtree(os.path.join(self.path, 'segments'), ignore_errors=True)
+            os.makedirs(os.path.join(self.path, 'segments'))
+            self._load()
+
+    def _load(self):
+        """문서 배열과 조각을 다시 읽음"""
+        with self.lock:
+            generation = self._meta('generation')
+            size = int(self._meta('next_doc', 0))
+            docs = pd.read_sql_query('SELECT id, length, year, source, venue FROM documents', self.conn)
+            segments = [Segment.load(self._segment_path(segment))
+                        for segment, in self.conn.execute('SELECT id FROM segments ORDER BY id')]
+
+            ids = docs['id'].to_numpy(dtype=np.int64)
+            alive = np.zeros(size, dtype=bool)
+            alive[ids] = True
+            lengths = np.zeros(size, dtype=np.float32)
+            lengths[ids] = docs['length'].to_numpy(dtype=np.float32)
+            years = np.full(size, -1, dtype=np.int32)
+            years[ids] = docs['year'].fillna(-1).to_numpy(dtype=np.int32)
+            source_codes, sources = pd.factorize(docs['source'].astype('string').str.lower())
+            venue_codes, venues = pd.factorize(docs['venue'].astype('string'))
+            self.sources = pd.Series(sources, dtype='string')
+            self.venues = pd.Series(venues, dtype='string').str.lower()
+            self.source_codes = np.full(size, -1, dtype=np.int32)
+            self.source_codes[ids] = source_codes
+            self.venue_codes = np.full(size, -1, dtype=np.int32)
+            self.venue_codes[ids] = venue_codes
+
+            self.alive, self.lengths, self.years = alive, lengths, years
+            self.n_docs = len(docs)
+            self.avg_length = float(lengths[ids].mean()) if len(ids) else 1.0
+            self.segments = segments
+            self.generation = generation
+
+    def refresh(self):
+        """다른 프로세스가 색인을 갱신했으면 다시 읽음"""
+        with self.lock:
+            if self._meta('generation') != self.generation:
+                self._load()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'documents': self.n_docs,
+                'pdfs': self.conn.execute('SELECT COUNT(*) FROM documents WHERE pdf IS NOT NULL').fetchone()[0],
+                'segments': len(self.segments),
+                'postings': sum(segment.n_postings for segment in self.segments),
+            }
+
+    def update(self, df, download_dir=None, use_processes=True):
+        """데이터셋(df)과 download_dir의 PDF로 색인 갱신 -> {'added', 'updated', 'removed'} 문서 수"""
+        docs = index_documents(df)
+        if download_dir is not None and os.path.isdir(download_dir):
+            docs = attach_pdfs(docs, df, download_dir)
+        else:
+            docs['pdf'] = pd.Series(pd.NA, index=docs.index, dtype='string')
+
+        with self.lock:
+            existing = pd.read_sql_query('SELECT key, signature FROM documents', self.conn)
+            known = pd.Series(existing['signature'].to_numpy(), index=existing['key'].to_numpy())
+            previous = known.reindex(docs['key'].to_numpy()).to_numpy(dtype=object)
+            is_new = pd.isna(previous)
+            stale = is_new | (previous != docs['signature'].to_numpy(dtype=object))
+            changed = docs[stale].reset_index(drop=True)
+            removed = known.index.difference(pd.Index(docs['key'].to_numpy())).tolist()
+            counts = {'added': int(is_new.sum()), 'updated': int((stale & ~is_new).sum()),
+                      'removed': len(removed)}
+            for change, count in counts.items():
+                metrics.inc('search_documents_total', count, change=change)
+            if not len(changed) and not removed:
+                logging.info(f"검색 색인 최신 상태: 문서 {self.n_docs}개")
+                return counts
+
+            paths = changed['pdf'].dropna().tolist()
+            texts = extract_texts(paths, download_dir, use_processes) if paths else {}
+            changed['fulltext'] = changed['pdf'].map(texts).astype('string')
+
+            self._add_documents(changed, removed)
+            self._merge_segments()
+            self._load()
+        logging.info(f"검색 색인 갱신: 추가 {counts['added']}개, 변경 {counts['updated']}개, "
+                     f"삭제 {counts['removed']}개 (문서 {self.n_docs}개, 조각 {len(self.segments)}개)")
+        return counts
+
+    def _add_documents(self, changed, removed):
+        """바뀐 문서를 새 id로 새 조각에 쓰고, 이전 id와 사라진 문서를 한 트랜잭션에서 삭제"""
+        next_doc = int(self._meta('next_doc'))
+        next_segment = int(self._meta('next_segment'))
+        ids = np.arange(next_doc, next_doc + len(changed), dtype=np.int64)
+        written, rows, segments = [], [], []
+        try:
+            for start in range(0, len(changed), SEGMENT_DOCS):
+                part = changed.iloc[start:start + SEGMENT_DOCS]
+                part_ids = ids[start:start + SEGMENT_DOCS]
+                segment, lengths = self._write_segment(next_segment + len(segments), part, part_ids)
+                written.append(self._segment_path(next_segment + len(segments)))
+                segments.append((next_segment + len(segments), len(part), segment.n_postings,
+                                 time.strftime('%Y-%m-%dT%H:%M:%S')))
+                rows += zip(part_ids.tolist(), part['key'], part['signature'],
+                            [segments[-1][0]] * len(part), lengths.tolist(),
+                            *(_nullable(part[column]) for column in ('title', 'author', 'year', 'source',
+                                                                     'publication', 'doi', 'pdf')))
+
+            keys = [(key,) for key in changed['key'].tolist() + removed]
+            self.conn.executemany('DELETE FROM documents WHERE key = ?', keys)
+            self.conn.executemany('INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self.conn.executemany('INSERT INTO segments VALUES (?, ?, ?, ?)', segments)
+            self._set_meta(next_doc=next_doc + len(changed), next_segment=next_segment + len(segments),
+                           generation=int(self._meta('generation')) + 1)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            for path in written:
+                shutil.rmtree(path, ignore_errors=True)
+            raise
+
+    def _write_segment(self, segment_id, part, ids):
+        """문서를 BATCH_DOCS개씩 토큰화해 조각 하나로 저장 -> (조각, 문서 길이)"""
+        terms, docs, freqs, lengths = [], [], [], []
+        for start in range(0, len(part), BATCH_DOCS):
+            batch = build_postings(part.iloc[start:start + BATCH_DOCS], ids[start:start + BATCH_DOCS])
+            for values, array in zip((terms, docs, freqs, lengths), batch):
+                values.append(array)
+        segment = Segment.from_postings(np.concatenate(terms), np.concatenate(docs), np.concatenate(freqs))
+        segment.save(self._segment_path(segment_id))
+        return segment, np.concatenate(lengths)
+
+    def _merge_segments(self):
+        """작은 조각이 MERGE_SEGMENTS개 이상이거나 지워진 문서가 절반을 넘는 조각을 합침
+
+        합친 조각에는 살아 있는 문서의 항목만 남깁니다.
+        """
+        live = dict(self.conn.execute('SELECT segment, COUNT(*) FROM documents GROUP BY segment'))
+        segments = self.conn.execute('SELECT id, docs FROM segments ORDER BY id').fetchall()
+        small = [segment for segment, _ in segments if live.get(segment, 0) < SEGMENT_DOCS // 4]
+        sparse = [segment for segment, docs in segments if live.get(segment, 0) < docs / 2]
+        targets = sorted(set(sparse) | set(small if len(small) >= MERGE_SEGMENTS else []))
+        if not targets:
+            return
+
+        placeholders = ', '.join('?' * len(targets))
+        alive = np.array([row[0] for row in self.conn.execute(
+            f'SELECT id FROM documents WHERE segment IN ({placeholders})', targets)], dtype=np.int64)
+        terms, docs, freqs = [], [], []
+        for segment in targets:
+            segment_terms, segment_docs, segment_freqs = Segment.load(self._segment_path(segment)).all_postings()
+            keep = np.isin(segment_docs, alive)
+            terms.append(segment_terms[keep])
+            docs.append(segment_docs[keep])
+            freqs.append(segment_freqs[keep])
+
+        merged = None
+        next_segment = int(self._meta('next_segment'))
+        if len(alive):
+            merged = Segment.from_postings(np.concatenate(terms), np.concatenate(docs), np.concatenate(freqs))
+            merged.save(self._segment_path(next_segment))
+        try:
+            if merged is not None:
+                self.conn.execute(f'UPDATE documents SET segment = ? WHERE segment IN ({placeholders})',
+                                  [next_segment, *targets])
+                self.conn.execute('INSERT INTO segments VALUES (?, ?, ?, ?)',
+                                  (next_segment, len(alive), merged.n_postings, time.strftime('%Y-%m-%dT%H:%M:%S')))
+            self.conn.execute(f'DELETE FROM segments WHERE id IN ({placeholders})', targets)
+            self._set_meta(next_segment=next_segment + 1, generation=int(self._meta('generation')) + 1)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            shutil.rmtree(self._segment_path(next_segment), ignore_errors=True)
+            raise
+        # 이미 메모리 맵으로 연 프로세스는 지운 뒤에도 그대로 읽을 수 있음
+        for segment in targets:
+            shutil.rmtree(self._segment_path(segment), ignore_errors=True)
+        logging.info(f"검색 색인 조각 병합: {len(targets)}개 -> 문서 {len(alive)}개")
+
+    def _filter(self, year_from, year_to, source, venue):
+        """필터 -> 문서 id 배열을 받아 통과 여부를 돌려주는 함수 (필터가 없으면 None)
+
+        질의어가 나오는 문서에만 적용하므로 전체 문서 배열을 훑지 않습니다.
+        """
+        checks = []
+        if year_from is not None or year_to is not None:
+            low, high = year_from or 0, year_to or np.iinfo(np.int32).max
+            checks.append(lambda docs: (self.years[docs] >= low) & (self.years[docs] <= high))
+        if source:
+            wanted = [source] if isinstance(source, str) else source
+            sources = np.flatnonzero(self.sources.isin([name.lower() for name in wanted]).to_numpy())
+            checks.append(lambda docs: np.isin(self.source_codes[docs], sources))
+        if venue:
+            venues = np.flatnonzero(self.venues.str.contains(venue.lower(), regex=False).fillna(False).to_numpy())
+            checks.append(lambda docs: np.isin(self.venue_codes[docs], venues))
+        if not checks:
+            return None
+        return lambda docs: np.logical_and.reduce([check(docs) for check in checks])
+
+    def search(self, query, limit=10, year_from=None, year_to=None, source=None, venue=None, match_all=True):
+        """질의에 맞는 문서를 BM25 점수 순으로 -> [{key, title, author, year, source, venue, doi, pdf, score}]
+
+        match_all이면 모든 질의어가 들어 있는 문서만, 아니면 하나라도 들어
+        있는 문서를 찾습니다. year_from/year_to, source(출처 이름 또는 목록),
+        venue(학회/저널 이름 일부, 대소문자 무시)로 거를 수 있습니다.
+        """
+        start = time.perf_counter()
+        self.refresh()
+        terms = query_terms(query)
+        with self.lock:
+            results = self._search(terms, limit, self._filter(year_from, year_to, source, venue),
+                                   match_all)
+        metrics.observe('search_query_seconds', time.perf_counter() - start, mode='all' if match_all else 'any')
+        return results
+
+    def _search(self, terms, limit, accept, match_all):
+        hits, scores = [], []
+        for term in terms:
+            found = [postings for postings in (segment.postings(term) for segment in self.segments)
+                     if postings is not None]
+            docs = np.concatenate([docs for docs, _ in found]) if found else np.array([], dtype=np.int32)
+            freqs = np.concatenate([freqs for _, freqs in found]) if found else np.array([], dtype=np.uint16)
+            live = self.alive[docs]
+            docs, freqs = docs[live], freqs[live].astype(np.float32)
+            if not len(docs):
+                if match_all:
+                    return []
+                continue
+
+            # 문서 빈도와 평균 길이는 필터와 관계없이 색인 전체 기준
+            idf = np.log1p((self.n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            if accept is not None:
+                keep = accept(docs)
+                docs, freqs = docs[keep], freqs[keep]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[docs] / self.avg_length)
+            hits.append(docs)
+            scores.append(idf * freqs * (BM25_K1 + 1) / (freqs + norm))
+        if not hits:
+            return []
+
+        # 문서별 점수 합: 맞는 항목이 적으면 정렬로, 많으면 문서 id 크기의 배열로
+        docs = np.concatenate(hits)
+        scores = np.concatenate(scores)
+        if len(docs) * 8 < len(self.alive):
+            candidates, inverse, matched = np.unique(docs, return_inverse=True, return_counts=True)
+            total = np.bincount(inverse, weights=scores)
+        else:
+            matched = np.bincount(docs, minlength=len(self.alive))
+            candidates = np.flatnonzero(matched)
+            total = np.bincount(docs, weights=scores, minlength=len(self.alive))[candidates]
+            matched = matched[candidates]
+        if match_all:
+            keep = matched == len(terms)
+            candidates, total = candidates[keep], total[keep]
+        if len(candidates) > limit:
+            top = np.argpartition(-total, limit)[:limit]
+            candidates, total = candidates[top], total[top]
+        # 점수가 높은 순, 같으면 먼저 색인한 문서부터
+        order = np.lexsort((candidates, -total))
+        candidates, total = candidates[order], total[order]
+
+        results = self._documents(candidates.tolist())
+        for result, score in zip(results, total.tolist()):
+            result['score'] = round(score, 4)
+        return results
+
+    def _documents(self, ids):
+        rows = self.conn.execute(f"SELECT id, {', '.join(RESULT_COLUMNS)} FROM documents "
+                                 f"WHERE id IN ({', '.join('?' * len(ids))})", ids).fetchall()
+        by_id = {row[0]: dict(zip(RESULT_COLUMNS, row[1:])) for row in rows}
+        return [by_id[doc] for doc in ids]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def _nullable(values):
+    """pandas 시리즈 -> SQLite에 넣을 값 목록 (빈 값은 None)"""
+    values = values.astype(object)
+    return values.where(values.notna() & (values != ''), None).tolist()
+
+def update_index(output_dir='output', download_dir='downloads', df=None, use_processes=True, index=None):
+    """최신 통합 데이터셋과 download_dir의 PDF로 검색 색인 갱신"""
+    if df is None:
+        df = read_papers(output_dir, columns=SEARCH_COLUMNS)
+    index = index or open_index(output_dir)
+    with measure_stage('index', output_dir):
+        return index.update(df, download_dir, use_processes)
+
+def open_index(output_dir='output'):
+    """output_dir의 검색 색인 (경로마다 하나를 열어 여러 스레드가 공유)"""
+    return _open_index(os.path.abspath(os.path.join(output_dir, SEARCH_INDEX_DIR)))
+
+@functools.lru_cache(maxsize=None)
+def _open_index(path):
+    return SearchIndex(path)
+
+# MCP 서버의 tools/list 응답에 그대로 쓸 수 있는 도구 설명 (호출은 search_tool)
+SEARCH_TOOL = {
+    'name': 'search_papers',
+    'description': '통합 논문 데이터셋과 다운로드한 PDF 본문에서 논문 검색 (BM25)',
+    'inputSchema': {
+        'type': 'object',
+        'properties': {
+            'query': {'type': 'string', 'description': '검색어'},
+            'limit': {'type': 'integer', 'default': 10},
+            'year_from': {'type': 'integer'},
+            'year_to': {'type': 'integer'},
+            'source': {'type': 'string', 'description': 'acm, ieee, scopus, wos, bib'},
+            'venue': {'type': 'string', 'description': '학회/저널 이름 일부'},
+            'match_all': {'type': 'boolean', 'default': True, 'description': '모든 검색어가 들어 있는 논문만'},
+        },
+        'required': ['query'],
+    },
+}
+
+def search_tool(arguments, output_dir='output'):
+    """SEARCH_TOOL 인자로 검색 -> JSON으로 바꿀 수 있는 결과 목록 (Chainlit/MCP 서버용)"""
+    allowed = SEARCH_TOOL['inputSchema']['properties']
+    return open_index(output_dir).search(**{name: value for name, value in arguments.items() if name in allowed})
+
+def parse_years(value):
+    """'2020' -> (2020, 2020), '2018-2021' -> (2018, 2021), '2018-' -> (2018, None)"""
+    if not value:
+        return None, None
+    first, dash, last = value.partition('-')
+    year_from = int(first) if first else None
+    year_to = (int(last) if last else None) if dash else year_from
+    return year_from, year_to
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='논문 검색 (제목/초록/키워드/저자/PDF 본문, BM25)')
+    parser.add_argument('query', nargs='*', help='검색어 (없으면 색인 상태 출력)')
+    parser.add_argument('--output-dir', default='output')
+    parser.add_argument('--download-dir', default='downloads')
+    parser.add_argument('--update', action='store_true', help='최신 데이터셋과 PDF로 색인 갱신')
+    parser.add_argument('--rebuild', action='store_true', help='색인을 비우고 처음부터 다시 만들기')
+    parser.add_argument('--threads', action='store_true', help='PDF 본문 추출을 프로세스 대신 스레드로')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--year', help='연도 또는 범위 (예: 2020, 2018-2021, 2018-)')
+    parser.add_argument('--source', action='append', help='출처 (여러 번 지정 가능)')
+    parser.add_argument('--venue', help='학회/저널 이름 일부')
+    parser.add_argument('--any', action='store_true', help='검색어 중 하나라도 들어 있는 논문')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    index = open_index(args.output_dir)
+    if args.rebuild:
+        index.clear()
+    if args.update or args.rebuild:
+        update_index(args.output_dir, args.download_dir, use_processes=not args.threads, index=index)
+        metrics.write(args.output_dir, 'index')
+
+    if not args.query:
+        stats = index.stats()
+        print(f"검색 색인: 문서 {stats['documents']}개 (PDF 본문 {stats['pdfs']}개), "
+              f"조각 {stats['segments']}개, 색인 항목 {stats['postings']}개")
+        return
+
+    year_from, year_to = parse_years(args.year)
+    start = time.perf_counter()
+    results = index.search(' '.join(args.query), args.limit, year_from, year_to, args.source, args.venue,
+                           match_all=not args.any)
+    elapsed = (time.perf_counter() - start) * 1000
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    print(f"검색 결과 {len(results)}개 ({elapsed:.1f}ms)")
+    for rank, result in enumerate(results, 1):
+        print(f"\n{rank}. {result['title']} ({result['year'] or '-'}, {result['source'] or '-'}) "
+              f"[{result['score']:.2f}]")
+        for label, column in (('저자', 'author'), ('학회/저널', 'venue'), ('DOI', 'doi'), ('PDF', 'pdf')):
+            if result[column]:
+                print(f"   {label}: {result[column]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import os
+import json
+import glob
+import logging
+import argparse
+import functools
+import importlib.util
+from datetime import datetime
+
+DATASET_FORMATS = ('parquet', 'feather', 'csv')
+DEFAULT_FORMAT = 'parquet'
+
+# output_dir 안에서 최신 통합 데이터셋을 가리키는 파일
+LATEST_MANIFEST = 'papers_latest.json'
+
+_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'csv': '.csv'}
+
+# 도구별로 읽는 컬럼 (나머지 초록/키워드 등 큰 텍스트 컬럼은 읽지 않음)
+DOWNLOAD_COLUMNS = ['title', 'year', 'source', 'doi', 'url']
+RENAME_COLUMNS = ['title', 'year', 'source', 'doi']
+URL_COLUMNS = ['title', 'doi', 'url']
+ANALYTICS_COLUMNS = ['year', 'publication', 'source', 'keywords']
+GRAPH_COLUMNS = ['title', 'author', 'doi', 'references']
+SEARCH_COLUMNS = ['title', 'author', 'abstract', 'keywords', 'publication', 'year', 'source', 'doi']
+
+@functools.lru_cache(maxsize=None)
+def _arrow():
+    """(pyarrow, pyarrow.parquet, pyarrow.feather) - 처음 데이터셋을 읽거나 쓸 때 import"""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    return pa, pq, feather
+
+def resolve_format(fmt=None):
+    """요청한 저장 형식 (pyarrow가 없으면 csv)"""
+    fmt = (fmt or DEFAULT_FORMAT).lower()
+    if fmt not in DATASET_FORMATS:
+        raise ValueError(f"지원하지 않는 데이터셋 형식: {fmt}")
+    # pyarrow가 없으면 CSV로만 저장 (import하지 않고 설치 여부만 확인)
+    if fmt != 'csv' and importlib.util.find_spec('pyarrow') is None:
+        logging.warning(f"pyarrow가 설치되어 있지 않아 {fmt} 대신 csv로 저장합니다.")
+        return 'csv'
+    return fmt
+
+def format_of(path):
+    """파일 확장자로 데이터셋 형식 판단"""
+    ext = os.path.splitext(str(path))[1].lower()
+    for fmt, known in _EXTENSIONS.items():
+        if ext == known:
+            return fmt
+    raise ValueError(f"알 수 없는 데이터셋 파일: {path}")
+
+def dataset_extension(fmt=None):
+    """저장 형식의 파일 확장자"""
+    return _EXTENSIONS[resolve_format(fmt)]
+
+def new_dataset_path(output_dir, fmt=None, prefix='papers'):
+    """output_dir/papers_<시각>.<확장자> 경로"""
+    ext = dataset_extension(fmt)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(output_dir, f"{prefix}_{timestamp}{ext}")
+    # 같은 초에 여러 번 저장해도 이전 파일을 덮어쓰지 않도록
+    count = 1
+    while os.path.exists(path):
+        path = os.path.join(output_dir, f"{prefix}_{timestamp}_{count}{ext}")
+        count += 1
+    return path
+
+class DatasetWriter:
+    """DataFrame 조각을 하나의 데이터셋 파일에 이어 쓰기
+
+    parquet은 조각마다 row group을, feather(Arrow IPC)는 record batch를
+    추가하고, csv는 헤더를 한 번만 씁니다. 스키마는 첫 조각을 따릅니다.
+    """
+
+    def __init__(self, path, fmt=None):
+        self.path = str(path)
+        self.fmt = fmt or format_of(path)
+        self.rows = 0
+        self.columns = None
+        self.schema = None
+        self._writer = None
+
+    def write(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+        df = df[self.columns]
+
+        if self.fmt == 'csv':
+            df.to_csv(self.path, mode='w' if self.rows == 0 else 'a', header=self.rows == 0,
+                      index=False, encoding='utf-8')
+        else:
+            pa, pq, _ = _arrow()
+            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+            if self._writer is None:
+                self.schema = table.schema
+                if self.fmt == 'parquet':
+                    self._writer = pq.ParquetWriter(self.path, self.schema)
+                else:
+                    self._writer = pa.ipc.new_file(self.path, self.schema)
+            self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_latest(output_dir, path, rows=None, columns=None):
+    """최신 데이터셋 매니페스트 갱신 (임시 파일에 쓴 뒤 교체)"""
+    manifest = {
+        'path': os.path.relpath(path, output_dir),
+        'format': format_of(path),
+        'rows': rows,
+        'columns': columns,
+        'created': datetime.now().isoformat(timespec='seconds'),
+    }
+    manifest_path = os.path.join(output_dir, LATEST_MANIFEST)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+def save_papers(df, output_dir='output', fmt=None, prefix='papers'):
+    """DataFrame을 새 데이터셋 파일로 저장하고 최신 매니페스트를 갱신"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = new_dataset_path(output_dir, fmt, prefix)
+    with DatasetWriter(path) as writer:
+        writer.write(df)
+    write_latest(output_dir, path, writer.rows, writer.columns)
+    return path
+
+def latest_dataset(output_dir='output'):
+    """최신 통합 데이터셋 경로
+
+    매니페스트가 있으면 그것을, 없으면 예전처럼 이름이 가장 큰
+    papers_* 파일을 사용합니다.
+    """
+    manifest_path = os.path.join(output_dir, LATEST_MANIFEST)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            path = os.path.join(output_dir, json.load(f)['path'])
+        if os.path.exists(path):
+            return path
+        logging.warning(f"매니페스트가 가리키는 파일이 없습니다: {path}")
+
+    papers_files = [path for ext in _EXTENSIONS.values()
+                    for path in glob.glob(os.path.join(output_dir, f'papers_*{ext}'))]
+    if not papers_files:
+        raise FileNotFoundError('papers 파일을 찾을 수 없습니다.')
+    return max(papers_files, key=os.path.basename)
+
+def _available_columns(path, fmt):
+    if fmt == 'csv':
+        import pandas as pd
+        return list(pd.read_csv(path, nrows=0).columns)
+    pa, pq, _ = _arrow()
+    if fmt == 'parquet':
+        return pq.read_schema(path).names
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).schema.names
+
+def dataset_columns(path):
+    """데이터셋 파일의 컬럼 목록 (데이터는 읽지 않음)"""
+    return _available_columns(path, format_of(path))
+
+def read_dataset(path, columns=None):
+    """데이터셋 파일 읽기
+
+    columns를 주면 그 컬럼만 읽고(파일에 없는 컬럼은 빈 값으로 채움),
+    parquet/feather는 메모리 맵으로 엽니다.
+    """
+    import pandas as pd
+
+    fmt = format_of(path)
+    present = None
+    if columns is not None:
+        available = set(_available_columns(path, fmt))
+        present = [column for column in columns if column in available]
+
+    if fmt == 'csv':
+        df = pd.read_csv(path, usecols=present)
+    else:
+        _, pq, feather = _arrow()
+        read_table = pq.read_table if fmt == 'parquet' else feather.read_table
+        df = read_table(path, columns=present, memory_map=True).to_pandas()
+
+    if columns is not None:
+        for column in columns:
+            if column not in df.columns:
+                df[column] = pd.Series(pd.NA, index=df.index, dtype='string')
+        df = df[columns]
+    return df
+
+def read_papers(output_dir='output', columns=None):
+    """최신 통합 데이터셋 읽기 (columns로 필요한 컬럼만)"""
+    return read_dataset(latest_dataset(output_dir), columns)
+
+def export_csv(path=None, output_file=None, output_dir='output'):
+    """데이터셋을 CSV로 내보내고 경로를 반환 (기본: 최신 데이터셋)"""
+    path = path or latest_dataset(output_dir)
+    output_file = output_file or os.path.splitext(path)[0] + '.csv'
+    if os.path.abspath(output_file) == os.path.abspath(path):
+        return path
+    read_dataset(path).to_csv(output_file, index=False, encoding='utf-8')
+    return output_file
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='통합 논문 데이터셋 도구')
+    parser.add_argument('--export-csv', nargs='?', const='', metavar='OUTPUT',
+                        help='최신 데이터셋을 CSV로 내보내기')
+    parser.add_argument('--output-dir', default='output')
+    args = parser.parse_args()
+
+    path = latest_dataset(args.output_dir)
+    logging.info(f"최신 데이터셋: {path}")
+    if args.export_csv is not None:
+        output_file = export_csv(path, args.export_csv or None)
+        logging.info(f"CSV 내보내기 완료: {output_file}")
+
+if __name__ == "__main__":
+    main()
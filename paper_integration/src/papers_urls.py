@@ -1,37 +1,92 @@
 import pandas as pd
 import os
-from datetime import datetime
-
-def get_papers_urls():
-    # output 디렉토리에서 최신 papers 파일 찾기
-    output_dir = 'output'
-    papers_files = [f for f in os.listdir(output_dir) if f.startswith('papers_') and f.endswith('.csv')]
-    if not papers_files:
-        raise FileNotFoundError('papers 파일을 찾을 수 없습니다.')
-    
-    latest_papers_file = max(papers_files)
-    input_file = os.path.join(output_dir, latest_papers_file)
-    
-    # CSV 파일 읽기
-    df = pd.read_csv(input_file)
-    
-    # 논문 URL 딕셔너리 생성
-    papers_urls = {}
-    
-    for _, row in df.iterrows():
-        title = row['title']
-        doi = row.get('doi', '')
-        url = row.get('url', '')
-        
-        # URL이 있거나 DOI가 있는 경우만 포함
-        if url:
-            papers_urls[title] = url
-        elif doi:
-            papers_urls[title] = f"https://doi.org/{doi}"
-        else:
-            papers_urls[title] = None
-    
-    return papers_urls
-
-# URL 목록 생성
-papers_urls = get_papers_urls() 
\ No newline at end of file
+import threading
+
+from dedup_papers import normalize_doi
+from doi_resolver import DOIResolver
+from paper_columns import link_url
+from papers_dataset import URL_COLUMNS, latest_dataset, read_dataset
+
+# 다운로더가 해석한 DOI 결과 캐시 (output_dir 안)
+DOI_CACHE_FILE = 'doi_cache.sqlite'
+
+# output_dir -> (데이터셋 경로/수정 시각 키, PapersURLs)
+_url_maps = {}
+_url_maps_lock = threading.Lock()
+
+class PapersURLs:
+    """논문 제목/DOI -> 링크 URL 사전
+
+    링크는 url 컬럼, 해석해 둔 직접 PDF URL, doi.org 링크 순이고
+    셋 다 없으면 None입니다. DOI는 정규화(소문자, doi.org 접두어 제거)한
+    값으로 찾습니다.
+    """
+
+    def __init__(self, df, resolved=None):
+        urls = link_url(df, resolved)
+        urls = urls.astype(object).where(urls.notna(), None)
+        self.by_title = dict(zip(df['title'], urls))
+        dois = normalize_doi(df['doi'])
+        has_doi = dois.notna()
+        self.by_doi = dict(zip(dois[has_doi], urls[has_doi]))
+
+    def __len__(self):
+        return len(self.by_title)
+
+    def urls_for_titles(self, titles):
+        """제목 목록의 URL 목록 (모르는 제목은 None)"""
+        return [self.by_title.get(title) for title in titles]
+
+    def urls_for_dois(self, dois):
+        """DOI 목록의 URL 목록 (모르는 DOI는 None)"""
+        normalized = normalize_doi(pd.Series(list(dois), dtype='string'))
+        return [None if pd.isna(doi) else self.by_doi.get(doi) for doi in normalized]
+
+def _dataset_key(output_dir):
+    """URL 사전을 다시 만들어야 하는지 판단할 키 (데이터셋 경로와 수정 시각)"""
+    path = latest_dataset(output_dir)
+    cache_path = os.path.join(output_dir, DOI_CACHE_FILE)
+    # 다운로더가 DOI를 새로 해석하면 직접 PDF URL도 바뀜
+    cache_mtime = os.stat(cache_path).st_mtime_ns if os.path.exists(cache_path) else None
+    return path, os.stat(path).st_mtime_ns, cache_mtime
+
+def _build_url_map(output_dir, path):
+    # 최신 papers 데이터셋에서 필요한 컬럼만 읽기
+    df = read_dataset(path, columns=URL_COLUMNS)
+
+    # 다운로더가 해석해 둔 직접 PDF URL (캐시가 있을 때만)
+    resolved = {}
+    cache_path = os.path.join(output_dir, DOI_CACHE_FILE)
+    if os.path.exists(cache_path):
+        resolver = DOIResolver(cache_path)
+        resolved = resolver.cached(df['doi'].dropna().astype(str))
+        resolver.close()
+    return PapersURLs(df, resolved)
+
+def get_url_map(output_dir='output'):
+    """최신 데이터셋의 URL 사전 (처음 사용할 때 만들고, 데이터셋이 바뀔 때만 다시 만듦)"""
+    key = _dataset_key(output_dir)
+    with _url_maps_lock:
+        cached = _url_maps.get(output_dir)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        url_map = _build_url_map(output_dir, key[0])
+        _url_maps[output_dir] = (key, url_map)
+        return url_map
+
+def get_papers_urls(output_dir='output'):
+    """{제목: URL} 사전"""
+    return get_url_map(output_dir).by_title
+
+def lookup_urls(titles=None, dois=None, output_dir='output'):
+    """제목 또는 DOI 목록을 한 번에 URL 목록으로 변환"""
+    url_map = get_url_map(output_dir)
+    if dois is not None:
+        return url_map.urls_for_dois(dois)
+    return url_map.urls_for_titles([] if titles is None else titles)
+
+def __getattr__(name):
+    # 예전 모듈 변수 papers_urls: import 시점이 아니라 처음 접근할 때 계산
+    if name == 'papers_urls':
+        return get_papers_urls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,247 @@
+import os
+import sqlite3
+import hashlib
+import threading
+import logging
+import argparse
+from pathlib import Path
+
+# PDF 검사 기준: 앞부분의 %PDF- 헤더와 끝부분의 %%EOF 트레일러
+PDF_MAGIC = b'%PDF-'
+PDF_HEADER_WINDOW = 1024
+PDF_TRAILER = b'%%EOF'
+PDF_TRAILER_WINDOW = 4096
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def has_pdf_header(path):
+    """파일 앞부분에 %PDF- 헤더가 있는지 확인 (HTML 오류 페이지 등 구별)"""
+    try:
+        with open(path, 'rb') as f:
+            return PDF_MAGIC in f.read(PDF_HEADER_WINDOW)
+    except OSError:
+        return False
+
+def is_valid_pdf(path):
+    """파일이 PDF 헤더와 트레일러를 모두 가지고 있는지 확인"""
+    if not has_pdf_header(path):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - PDF_TRAILER_WINDOW))
+            return PDF_TRAILER in f.read()
+    except OSError:
+        return False
+
+def hash_file(path):
+    """파일의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class PDFStore:
+    """내용 해시 기반 PDF 저장소
+
+    downloads의 각 PDF를 .blobs/<해시 앞 2자리>/<해시>.pdf 하나로 모으고,
+    사람이 읽는 파일명은 그 blob에 대한 하드 링크(불가능하면 심볼릭
+    링크)로 둡니다. 해시 인덱스에 (경로, 크기, 수정 시각, inode)를 저장해
+    verify는 새로 생기거나 바뀐 파일만 다시 해시합니다.
+    """
+
+    def __init__(self, download_dir):
+        self.download_dir = Path(download_dir)
+        self.blob_dir = self.download_dir / '.blobs'
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.download_dir / '.store_index.sqlite'),
+                                    check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                valid INTEGER NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS files_inode ON files (inode, size, mtime_ns)')
+        self.conn.commit()
+
+    def blob_path(self, sha256):
+        return self.blob_dir / sha256[:2] / f'{sha256}.pdf'
+
+    def add(self, path, sha256=None):
+        """파일을 저장소에 등록하고 (sha256, 유효 여부, 중복 여부)를 반환
+
+        다운로드 중 이미 계산한 해시를 넘기면 다시 읽지 않습니다.
+        같은 내용의 blob이 있으면 path를 그 blob에 대한 링크로 바꿉니다.
+        """
+        path = Path(path)
+        sha256 = sha256 or hash_file(path)
+        valid = is_valid_pdf(path)
+
+        with self.lock:
+            duplicate = self._store(path, sha256, valid)
+            self._index(path, sha256, valid)
+            self.conn.commit()
+        return sha256, valid, duplicate
+
+    def _store(self, path, sha256, valid):
+        """유효한 PDF를 blob에 연결하고, 기존 blob과 중복이었는지 반환"""
+        duplicate = False
+        if valid:
+            blob = self.blob_path(sha256)
+            if blob.exists():
+                if not os.path.samefile(blob, path):
+                    self._link(blob, path)
+                    duplicate = True
+            else:
+                blob.parent.mkdir(exist_ok=True)
+                try:
+                    os.link(path, blob)
+                except OSError:
+                    # 하드 링크를 못 쓰는 파일 시스템: blob으로 옮기고 심볼릭 링크
+                    os.replace(path, blob)
+                    os.symlink(os.path.abspath(blob), path)
+        return duplicate
+
+    def has_download(self, entry):
+        """매니페스트 항목(path, sha256)의 PDF가 아직 download_dir에 있는지
+
+        저장한 경로에 없더라도 (rename_papers가 이름을 바꾼 경우) 같은 내용의
+        blob에 다른 하드 링크가 있거나, 인덱스에 같은 해시의 파일이 남아
+        있으면 있는 것으로 봅니다.
+        """
+        if entry.get('path') and os.path.exists(entry['path']):
+            return True
+        sha256 = entry.get('sha256')
+        if not sha256:
+            return False
+        blob = self.blob_path(sha256)
+        if blob.exists() and blob.stat().st_nlink > 1:
+            return True
+        with self.lock:
+            rows = self.conn.execute('SELECT path FROM files WHERE sha256 = ?', (sha256,)).fetchall()
+        return any(os.path.exists(path) for path, in rows)
+
+    def _link(self, blob, path):
+        """path를 blob에 대한 링크로 원자적으로 교체"""
+        temp = path.with_name(path.name + '.link')
+        try:
+            os.link(blob, temp)
+        except OSError:
+            os.symlink(os.path.abspath(blob), temp)
+        os.replace(temp, path)
+
+    def _index(self, path, sha256, valid):
+        """인덱스에 파일 상태 기록 (commit은 호출한 쪽에서)"""
+        stat = path.stat()
+        self.conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)',
+                          (str(path), stat.st_size, stat.st_mtime_ns, stat.st_ino, sha256, int(valid)))
+
+    def _known_hash(self, path, stat):
+        """인덱스에 같은 (경로 또는 inode, 크기, 수정 시각)이 있으면 그 해시"""
+        row = self.conn.execute(
+            'SELECT sha256, valid FROM files WHERE path = ? AND size = ? AND mtime_ns = ?',
+            (str(path), stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row is None:
+            # 이름만 바뀐 파일 (rename_papers 등)
+            row = self.conn.execute(
+                'SELECT sha256, valid FROM files WHERE inode = ? AND size = ? AND mtime_ns = ?',
+                (stat.st_ino, stat.st_size, stat.st_mtime_ns)).fetchone()
+        return row
+
+    def verify(self):
+        """download_dir의 PDF를 점검해 중복은 링크로 합치고 통계를 반환
+
+        인덱스와 크기/수정 시각이 같은 파일은 다시 해시하지 않습니다.
+        어떤 파일도 가리키지 않는 blob(파일을 지운 경우)은 삭제합니다.
+        """
+        stats = {'scanned': 0, 'hashed': 0, 'linked': 0, 'bytes_saved': 0, 'invalid': [],
+                 'orphans': 0, 'bytes_freed': 0}
+        referenced = set()
+
+        for path in sorted(self.download_dir.glob('*.pdf')):
+            stats['scanned'] += 1
+            stat = path.stat()
+            known = self._known_hash(path, stat)
+            if known is not None:
+                sha256, valid = known
+                blob = self.blob_path(sha256)
+                if valid and blob.exists() and os.path.samefile(blob, path):
+                    # 이름만 바뀐 경우를 위해 경로 갱신
+                    self._index(path, sha256, valid)
+                    referenced.add(sha256)
+                    continue
+                if not valid:
+                    stats['invalid'].append(str(path))
+                    self._index(path, sha256, valid)
+                    continue
+            else:
+                sha256 = hash_file(path)
+                stats['hashed'] += 1
+
+            _, valid, duplicate = self.add(path, sha256)
+            referenced.add(sha256)
+            if not valid:
+                stats['invalid'].append(str(path))
+            if duplicate:
+                stats['linked'] += 1
+                stats['bytes_saved'] += stat.st_size
+
+        self._collect_orphans(referenced, stats)
+
+        # 사라진 파일은 인덱스에서 제거
+        with self.lock:
+            rows = self.conn.execute('SELECT path FROM files').fetchall()
+            self.conn.executemany('DELETE FROM files WHERE path = ?',
+                                  [row for row in rows if not os.path.exists(row[0])])
+            self.conn.commit()
+        return stats
+
+    def _collect_orphans(self, referenced, stats):
+        """download_dir의 어떤 PDF도 가리키지 않는 blob 삭제
+
+        검사한 파일의 해시에 없고 다른 하드 링크도 없는 (st_nlink == 1)
+        blob만 지웁니다. 심볼릭 링크로 연결된 blob은 해시로 남습니다.
+        """
+        with self.lock:
+            for blob in self.blob_dir.glob('*/*.pdf'):
+                stat = blob.stat()
+                if blob.stem in referenced or stat.st_nlink > 1:
+                    continue
+                blob.unlink()
+                stats['orphans'] += 1
+                stats['bytes_freed'] += stat.st_size
+
+    def close(self):
+        self.conn.close()
+
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='PDF 저장소 점검 (중복 연결, 버린 blob 삭제, PDF가 아닌 파일 보고)')
+    parser.add_argument('--download-dir', default='downloads')
+    args = parser.parse_args()
+
+    store = PDFStore(args.download_dir)
+    stats = store.verify()
+    store.close()
+
+    logging.info(f"점검한 파일: {stats['scanned']}개 (새로 해시: {stats['hashed']}개)")
+    logging.info(f"중복 링크: {stats['linked']}개 ({stats['bytes_saved'] / 1024 / 1024:.1f} MB 절약)")
+    logging.info(f"버린 blob: {stats['orphans']}개 ({stats['bytes_freed'] / 1024 / 1024:.1f} MB 확보)")
+    for path in stats['invalid']:
+        logging.warning(f"PDF가 아닌 파일: {path}")
+
+if __name__ == "__main__":
+    main()
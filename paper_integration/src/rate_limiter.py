@@ -0,0 +1,41 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 속도 제한
+
+    같은 호스트에는 delay초마다 요청 하나(burst만큼 몰아서 허용)만 보내고,
+    서로 다른 호스트로의 요청은 기다리지 않습니다. host_delays로 일부
+    호스트(예: 리다이렉트만 하는 doi.org)에 다른 간격을 줄 수 있습니다.
+    """
+
+    def __init__(self, delay, burst=1, host_delays=None):
+        self.rate = self._rate(delay)
+        self.host_rates = {host.lower(): self._rate(host_delay)
+                           for host, host_delay in (host_delays or {}).items()}
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _rate(delay):
+        return 1.0 / delay if delay > 0 else None
+
+    def acquire(self, url):
+        """url의 호스트에 요청을 보낼 수 있을 때까지 대기"""
+        host = urlparse(url).netloc.lower()
+        rate = self.host_rates.get(host, self.rate)
+        if rate is None:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                tokens, updated = self.buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - updated) * rate)
+                if tokens >= 1:
+                    self.buckets[host] = (tokens - 1, now)
+                    return
+                self.buckets[host] = (tokens, now)
+                wait = (1 - tokens) / rate
+            time.sleep(wait)
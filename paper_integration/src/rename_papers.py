@@ -1,13 +1,53 @@
 import os
-import pandas as pd
+import math
+import mmap
+import signal
+import threading
+import time
+import argparse
 import re
+from contextlib import contextmanager
 from datetime import datetime
-from PyPDF2 import PdfReader
-import difflib
-from concurrent.futures import ThreadPoolExecutor
-from tqdm import tqdm
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 
+import pandas as pd
+
+from dedup_papers import normalize_doi
+from extraction_cache import ExtractionCache
+from paper_columns import paper_filename, text
+from paper_metrics import measure_stage, metrics
+from paper_records import PapersInfo, compact_years
+from papers_dataset import RENAME_COLUMNS, read_papers
+from title_index import TitleIndex
+
+# 제목 추출 방식이 바뀌면 올려서 추출 캐시를 무효화
+EXTRACTOR_VERSION = 4
+
+# 파일 하나의 추출 예산: 넘으면 실패로 기록하고 다음 파일로 넘어감
+EXTRACT_TIME_LIMIT = 10
+EXTRACT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+# 검색 색인용 본문 추출 방식이 바뀌면 올려서 본문 캐시를 무효화
+TEXT_EXTRACTOR_VERSION = 1
+
+# 본문은 앞쪽 MAX_TEXT_PAGES쪽, MAX_TEXT_CHARS자까지만 읽음 (학위논문/책 방지)
+MAX_TEXT_PAGES = 30
+MAX_TEXT_CHARS = 200000
+TEXT_TIME_LIMIT = 30
+
+# 문서 정보의 /Title을 제목으로 인정할 최소 길이
+MIN_METADATA_TITLE_LENGTH = 10
+
+# DOI 형식: 10.<등록 기관 번호>/<접미어>
+DOI_PATTERN = re.compile(r'\b10\.\d{4,9}/[^\s"<>]+', re.IGNORECASE)
+
+# 식별 방법 (rename_pdf_files의 적중률 보고 순서)
+MATCH_STRATEGIES = ('doi_metadata', 'doi_text', 'title')
+
+INHERITABLE_PAGE_ATTRIBUTES = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+MAX_PAGE_TREE_DEPTH = 64
+
 def setup_logging():
     """로깅 설정을 초기화합니다."""
     log_dir = 'logs'
@@ -36,91 +76,374 @@ def is_already_renamed(filename, papers_info):
     # 파일명에서 확장자 제거
     base_name = os.path.splitext(filename)[0]
     
-    # 논문 정보의 파일명과 비교
-    for info in papers_info.values():
-        if base_name == info['filename']:
-            return True
-    return False
+    # 논문 정보의 파일명 역색인과 비교
+    return base_name in papers_info.by_filename
+
+def _is_separator(line):
+    return all(c in '_-=*' for c in line)
+
+def _is_title_candidate(line):
+    """제목이 될 수 없는 줄(빈 줄, 구분선, DOI/URL, 페이지 번호나 연도)을 거릅니다."""
+    if not line or _is_separator(line):
+        return False
+    lower = line.lower()
+    if 'doi.org' in lower or 'http' in lower:
+        return False
+    return not line.isdigit()
+
+def _layout_lines(page):
+    """페이지 텍스트와 (줄, 글자 크기, 기준선 y) 목록을 추출합니다."""
+    fragments = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            # 텍스트 행렬과 CTM을 적용한 실제 글자 크기와 기준선 위치
+            size = font_size * math.hypot(tm[2], tm[3]) * math.hypot(cm[2], cm[3])
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            fragments.append((text.strip(), size, y))
+
+    text = page.extract_text(visitor_text=visit)
+    lines = []
+    for fragment, size, y in fragments:
+        # 기준선이 가까운 조각은 같은 줄로 합침
+        if lines and abs(lines[-1][2] - y) < 0.5 * max(size, 1):
+            line, line_size, _ = lines[-1]
+            lines[-1] = (f'{line} {fragment}', max(line_size, size), y)
+        else:
+            lines.append((fragment, size, y))
+    return text, lines
+
+def _title_by_font(lines):
+    """가장 큰 글자로 된 연속된 줄을 제목으로 봅니다 (글자 크기 정보가 없으면 None)."""
+    # 내용 스트림 순서가 아니라 위에서 아래 순서로 봄
+    lines = sorted(lines, key=lambda item: -item[2])
+    candidates = [(line, size) for line, size, _ in lines if _is_title_candidate(line)]
+    if not candidates:
+        return None
+    sizes = sorted(size for _, size in candidates)
+    largest = sizes[-1]
+    # 모든 줄의 크기가 같으면 글꼴로 구별할 수 없음
+    if largest <= sizes[len(sizes) // 2] * 1.1:
+        return None
+
+    title = []
+    for line, size in candidates:
+        if size >= largest * 0.95:
+            title.append(line)
+        elif title:
+            break
+    return ' '.join(title)
+
+def _title_by_text(text):
+    """빈 줄이나 구분선 뒤에 오는 줄 중 가장 긴 것을 제목으로 봅니다."""
+    candidates = []
+    previous = ''
+    for raw in text.split('\n'):
+        line = raw.strip()
+        # 제목으로 보일 수 있는 조건: 첫 후보이거나, 이전 줄이 빈 줄/구분선
+        if _is_title_candidate(line) and (not candidates or not previous or _is_separator(previous)):
+            candidates.append(line)
+        previous = line
+    
+    # 후보들 중 가장 긴 것을 선택 (보통 제목이 가장 긴 경우가 많음)
+    return max(candidates, key=len) if candidates else ""
+
+def _plausible_title(title):
+    """문서 정보의 /Title이 실제 논문 제목으로 보이는지 확인합니다.
+
+    'Microsoft Word - draft.docx', 'untitled', 파일명 같은 값은 제외합니다.
+    """
+    title = (title or '').strip()
+    if len(title) < MIN_METADATA_TITLE_LENGTH or len(title.split()) < 2:
+        return False
+    lower = title.lower()
+    if lower.startswith(('microsoft word', 'untitled')) or re.search(r'\.(pdf|docx?|tex|dvi|ps)$', lower):
+        return False
+    return _is_title_candidate(title)
+
+def _metadata_title(reader):
+    """문서 정보(/Info)와 XMP 메타데이터의 제목"""
+    try:
+        title = reader.metadata.title if reader.metadata else None
+        if _plausible_title(title):
+            return title.strip()
+    except Exception:
+        pass
+    try:
+        xmp = reader.xmp_metadata
+        titles = xmp.dc_title if xmp is not None else None
+        for title in (titles or {}).values():
+            if _plausible_title(title):
+                return title.strip()
+    except Exception:
+        pass
+    return None
+
+def _first_page(reader):
+    """페이지 트리의 첫 잎만 따라가 첫 페이지를 반환합니다.
+
+    reader.pages는 전체 페이지 트리를 펼치므로 수백 쪽짜리 문서에서 느립니다.
+    상속되는 속성(/Resources 등)은 _flatten과 같은 방식으로 채웁니다.
+    """
+    from PyPDF2 import PageObject
+    from PyPDF2.generic import IndirectObject, NameObject
+
+    reference = reader.trailer['/Root'].raw_get('/Pages')
+    node = reference.get_object()
+    inherited = {}
+    for _ in range(MAX_PAGE_TREE_DEPTH):
+        if node.get('/Type') == '/Page' or '/Kids' not in node:
+            page = PageObject(reader, reference if isinstance(reference, IndirectObject) else None)
+            page.update(node)
+            for key, value in inherited.items():
+                if key not in page:
+                    page[key] = value
+            return page
+        for key in INHERITABLE_PAGE_ATTRIBUTES:
+            if key in node:
+                inherited[NameObject(key)] = node.raw_get(key)
+        kids = node['/Kids']
+        if not kids:
+            return None
+        reference = kids[0]
+        node = reference.get_object()
+    raise ValueError("페이지 트리가 너무 깊습니다")
+
+def find_dois(text):
+    """텍스트에 나오는 DOI를 정규화해 순서대로 반환합니다. (중복 제거)"""
+    dois = []
+    for match in DOI_PATTERN.finditer(text or ''):
+        doi = match.group(0).lower().rstrip('.,;:')
+        # 문장 안 괄호로 감싼 DOI의 닫는 괄호 제거
+        while doi[-1] in ')]' and doi.count(doi[-1]) > doi.count('(' if doi[-1] == ')' else '['):
+            doi = doi[:-1]
+        if doi not in dois:
+            dois.append(doi)
+    return dois
+
+def _metadata_dois(reader):
+    """문서 정보(/Info)의 모든 문자열 값과 XMP 원문에서 찾은 DOI"""
+    texts = []
+    try:
+        if reader.metadata:
+            texts.extend(str(value) for value in reader.metadata.values())
+    except Exception:
+        pass
+    try:
+        xmp = reader.xmp_metadata
+        if xmp is not None:
+            texts.append(xmp.stream.get_data().decode('utf-8', 'replace'))
+    except Exception:
+        pass
+    return find_dois('\n'.join(texts))
+
+def read_pdf_info(pdf_path):
+    """첫 페이지와 문서 메타데이터만 읽어 DOI와 제목을 찾습니다.
+
+    파일은 메모리 맵으로 열어 필요한 객체만 파싱합니다.
+    메타데이터에 DOI와 쓸 만한 제목이 모두 있으면 페이지는 파싱하지 않습니다.
+    dois는 [DOI, 'metadata' 또는 'text'] 목록입니다.
+    """
+    # PyPDF2는 실제로 PDF를 읽을 때만 import (식별/이름 변경만 하는 쪽은 필요 없음)
+    from PyPDF2 import PdfReader
+
+    with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        reader = PdfReader(data)
+        dois = [[doi, 'metadata'] for doi in _metadata_dois(reader)]
+        title = _metadata_title(reader)
+        if title and dois:
+            return {'title': title, 'title_source': 'metadata', 'dois': dois}
+
+        page = _first_page(reader)
+        if page is None:
+            return {'title': title or '', 'title_source': 'metadata' if title else None, 'dois': dois}
+        text, lines = _layout_lines(page)
+        known = {doi for doi, _ in dois}
+        dois += [[doi, 'text'] for doi in find_dois(text) if doi not in known]
+        if title:
+            return {'title': title, 'title_source': 'metadata', 'dois': dois}
+        title = _title_by_font(lines)
+        if title:
+            return {'title': title, 'title_source': 'font', 'dois': dois}
+        title = _title_by_text(text or '')
+        return {'title': title, 'title_source': 'text' if title else None, 'dois': dois}
+
+class ExtractionTimeout(Exception):
+    pass
+
+@contextmanager
+def _time_limit(seconds):
+    """SIGALRM으로 시간 제한 (메인 스레드에서만 적용)
+
+    시그널 처리기는 메인 스레드에서만 설치할 수 있으므로 다른 스레드
+    (스레드 풀, 파이프라인 단계 스레드)에서는 제한 없이 실행합니다.
+    프로세스 풀 작업자는 작업을 자기 메인 스레드에서 실행하므로 그쪽의
+    제한에 맡깁니다.
+    """
+    if not seconds or not hasattr(signal, 'setitimer') or \
+            threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise ExtractionTimeout(f"{seconds}초 초과")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def _limit_worker_memory(budget):
+    """프로세스 풀 작업자 초기화: 현재 데이터 영역 + budget으로 상한 설정
+
+    RLIMIT_DATA는 힙과 익명 메모리만 세므로 읽기 전용 메모리 맵으로 연
+    큰 PDF는 한도에 포함되지 않습니다.
+    """
+    try:
+        import resource
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[5]) * os.sysconf('SC_PAGE_SIZE')
+        _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+        limit = current + budget
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_DATA, (limit, hard))
+    except (ImportError, OSError, ValueError, IndexError):
+        # /proc이나 resource가 없는 환경에서는 제한하지 않음
+        pass
+
+def extract_pdf_info(pdf_path):
+    """PDF 하나에서 이름 변경에 필요한 정보를 추출합니다. (프로세스 풀 작업 단위)
+
+    EXTRACT_TIME_LIMIT초를 넘기거나 메모리 한도를 넘으면 실패로 기록합니다.
+    (시간 제한은 메인 스레드에서 실행할 때만, 즉 프로세스 풀 작업자나
+    단독 실행에서만 걸립니다.)
+    작업 프로세스의 지표는 부모에 남지 않으므로 걸린 시간은 결과의
+    seconds에 담아 돌려주고 record_extraction으로 기록합니다.
+    """
+    start = time.perf_counter()
+    try:
+        with _time_limit(EXTRACT_TIME_LIMIT):
+            info = read_pdf_info(pdf_path)
+    except Exception as e:
+        logging.error(f"PDF 읽기 오류 ({pdf_path}): {type(e).__name__}: {str(e)}")
+        info = {'title': '', 'title_source': None, 'dois': [],
+                'error': f"{type(e).__name__}: {str(e)}"}
+    info['seconds'] = time.perf_counter() - start
+    return info
+
+def record_extraction(info):
+    """새로 추출한 결과의 시간과 제목 출처를 지표에 기록"""
+    if info.get('error'):
+        metrics.inc('pdf_extract_errors_total', error=info['error'].split(':', 1)[0])
+    if 'seconds' in info:
+        metrics.observe('pdf_extract_seconds', info['seconds'], title_source=info.get('title_source') or 'none')
 
 def extract_title_from_pdf(pdf_path):
     """PDF 파일의 첫 페이지에서 제목을 추출합니다."""
+    return extract_pdf_info(pdf_path)['title']
+
+def read_pdf_text(pdf_path, max_pages=MAX_TEXT_PAGES):
+    """앞쪽 max_pages쪽의 본문 텍스트와 읽은 쪽 수"""
+    from PyPDF2 import PdfReader
+
+    with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        reader = PdfReader(data)
+        texts, length = [], 0
+        for number in range(min(len(reader.pages), max_pages)):
+            texts.append(reader.pages[number].extract_text() or '')
+            length += len(texts[-1])
+            if length >= MAX_TEXT_CHARS:
+                break
+    return '\n'.join(texts)[:MAX_TEXT_CHARS], len(texts)
+
+def extract_pdf_text(pdf_path):
+    """검색 색인에 넣을 PDF 본문 추출 (프로세스 풀 작업 단위)
+
+    extract_pdf_info처럼 실패해도 예외를 내지 않고 error에 기록합니다.
+    """
+    start = time.perf_counter()
     try:
-        reader = PdfReader(pdf_path)
-        if len(reader.pages) > 0:
-            text = reader.pages[0].extract_text()
-            lines = text.split('\n')
-            
-            # 제목 후보들
-            candidates = []
-            
-            for line in lines:
-                line = line.strip()
-                # 빈 줄이나 특수 문자로만 이루어진 줄은 건너뛰기
-                if not line or all(c in '_-=*' for c in line):
-                    continue
-                
-                # DOI나 URL이 포함된 줄은 건너뛰기
-                if 'doi.org' in line.lower() or 'http' in line.lower():
-                    continue
-                
-                # 페이지 번호나 날짜 형식은 건너뛰기
-                if re.match(r'^\d+$', line) or re.match(r'^\d{4}$', line):
-                    continue
-                
-                # 제목으로 보일 수 있는 조건:
-                # 1. 첫 줄이거나
-                # 2. 이전 줄이 빈 줄이거나
-                # 3. 이전 줄이 특수 문자로만 이루어진 경우
-                if not candidates or not lines[lines.index(line)-1].strip() or all(c in '_-=*' for c in lines[lines.index(line)-1]):
-                    candidates.append(line)
-            
-            # 후보들 중 가장 긴 것을 선택 (보통 제목이 가장 긴 경우가 많음)
-            if candidates:
-                return max(candidates, key=len)
-            return ""
-        return ""
+        with _time_limit(TEXT_TIME_LIMIT):
+            content, pages = read_pdf_text(pdf_path)
+        info = {'text': content, 'pages': pages}
     except Exception as e:
-        logging.error(f"PDF 읽기 오류 ({pdf_path}): {str(e)}")
-        return ""
+        logging.error(f"PDF 본문 읽기 오류 ({pdf_path}): {type(e).__name__}: {str(e)}")
+        info = {'text': '', 'pages': 0, 'error': f"{type(e).__name__}: {str(e)}"}
+    info['seconds'] = time.perf_counter() - start
+    return info
+
+def find_best_match(title, papers_info, index=None):
+    """가장 유사한 제목의 논문 번호를 찾습니다 (없으면 None).
 
-def find_best_match(title, papers_info):
-    """가장 유사한 논문 제목을 찾습니다."""
-    titles = list(papers_info.keys())
-    matches = difflib.get_close_matches(title, titles, n=1, cutoff=0.5)
-    return matches[0] if matches else None
+    여러 파일을 처리할 때는 TitleIndex(papers_info.titles)를 한 번 만들어 넘기세요.
+    """
+    if index is None:
+        index = TitleIndex(papers_info.titles)
+    return index.best_match_id(title, cutoff=0.5)
 
 def get_papers_info():
-    # output 디렉토리에서 최신 papers 파일 찾기
+    # output 디렉토리의 최신 papers 데이터셋에서 필요한 컬럼만 읽기
     output_dir = 'output'
-    papers_files = [f for f in os.listdir(output_dir) if f.startswith('papers_') and f.endswith('.csv')]
-    if not papers_files:
-        raise FileNotFoundError('papers 파일을 찾을 수 없습니다.')
-    
-    latest_papers_file = max(papers_files)
-    input_file = os.path.join(output_dir, latest_papers_file)
-    
-    # CSV 파일 읽기
-    df = pd.read_csv(input_file)
-    
-    # 논문 정보 딕셔너리 생성
-    papers_info = {}
+    return papers_info_from_dataframe(read_papers(output_dir, columns=RENAME_COLUMNS))
+
+def papers_info_from_dataframe(df):
+    """논문 DataFrame(title, year, source, doi)으로 PapersInfo 생성
+
+    제목/DOI/파일명은 문자열 배열, 연도는 정수, 출처는 category로 두고
+    논문은 행 번호로 가리킵니다 (행마다 딕셔너리를 만들지 않음).
+    """
+    return PapersInfo(
+        titles=df['title'].astype('string').array,
+        years=compact_years(df['year']),
+        sources=pd.Categorical(df['source'].astype('string')),
+        dois=normalize_doi(df['doi']).astype('string').array,
+        # 파일명은 컬럼 단위로 한 번에 생성
+        filenames=paper_filename(df).array,
+    )
+
+def match_by_doi(info, papers_info):
+    """추출한 DOI 중 논문 목록에 있는 첫 번째로 찾기 -> (논문 번호, 방법) 또는 None"""
+    for doi, source in info.get('dois') or ():
+        paper_id = papers_info.by_doi.get(doi)
+        if paper_id is not None:
+            return paper_id, f'doi_{source}'
+    return None
+
+def identify_paper(info, papers_info, index=None):
+    """DOI로 먼저 찾고, 없으면 제목 유사도로 찾습니다. -> (논문 번호, 방법)"""
+    matched = match_by_doi(info, papers_info)
+    if matched:
+        return matched
+    if info.get('title'):
+        # 가장 유사한 논문 제목 찾기
+        paper_id = find_best_match(info['title'], papers_info, index)
+        if paper_id is not None:
+            return paper_id, 'title'
+    return None, None
+
+def rename_with_info(pdf_file, pdf_path, info, papers_info, index=None):
+    """추출한 정보로 논문을 찾아 파일 이름을 변경하고 (메시지, 새 경로, 식별 방법)을 반환합니다."""
+    paper_id, strategy = identify_paper(info, papers_info, index)
     
-    for _, row in df.iterrows():
-        title = row['title']
-        year = str(row.get('year', ''))
-        source = row.get('source', '')
-        
-        # 파일명 생성
-        filename = f"{title}-{year}-{source}"
-        filename = sanitize_filename(filename)
+    if paper_id is not None:
+        new_filename = f"{papers_info.filenames[paper_id]}.pdf"
+        new_path = os.path.join(os.path.dirname(pdf_path), new_filename)
         
-        papers_info[title] = {
-            'year': year,
-            'source': source,
-            'filename': filename
-        }
-    
-    return papers_info
+        try:
+            os.rename(pdf_path, new_path)
+            return f"변경 완료 ({strategy}): {pdf_file} -> {new_filename}", new_path, strategy
+        except Exception as e:
+            return f"변경 실패: {pdf_file} - 오류: {str(e)}", None, strategy
+    elif info.get('error'):
+        return f"제목 추출 실패: {pdf_file} - 오류: {info['error']}", None, None
+    elif not info.get('title'):
+        return f"제목 추출 실패: {pdf_file}", None, None
+    else:
+        return f"매칭 실패: {pdf_file}", None, None
 
 def process_pdf_file(args):
     """단일 PDF 파일을 처리합니다."""
@@ -130,56 +453,164 @@ def process_pdf_file(args):
     if is_already_renamed(pdf_file, papers_info):
         return f"이미 수정된 파일 건너뛰기: {pdf_file}"
     
-    # PDF에서 제목 추출
-    title = extract_title_from_pdf(pdf_path)
-    if not title:
-        return f"제목 추출 실패: {pdf_file}"
-    
-    # 가장 유사한 논문 제목 찾기
-    matched_title = find_best_match(title, papers_info)
-    
-    if matched_title:
-        info = papers_info[matched_title]
-        new_filename = f"{info['filename']}.pdf"
-        new_path = os.path.join(os.path.dirname(pdf_path), new_filename)
-        
-        try:
-            os.rename(pdf_path, new_path)
-            return f"변경 완료: {pdf_file} -> {new_filename}"
-        except Exception as e:
-            return f"변경 실패: {pdf_file} - 오류: {str(e)}"
-    else:
-        return f"매칭 실패: {pdf_file}"
+    return rename_with_info(pdf_file, pdf_path, extract_pdf_info(pdf_path), papers_info)[0]
+
+def extraction_executor(workers, use_processes=True, mp_context=None):
+    """PDF 추출용 실행기 (CPU 작업이므로 기본은 프로세스 풀)"""
+    if use_processes:
+        # 작업자마다 메모리 상한을 걸어 망가진 파일 하나가 전체를 멈추지 않게 함
+        return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                   initializer=_limit_worker_memory,
+                                   initargs=(EXTRACT_MEMORY_BUDGET,))
+    return ThreadPoolExecutor(max_workers=workers)
 
-def rename_pdf_files():
+def iter_extracted(pdf_paths, workers, use_processes=True):
+    """pdf_paths를 추출해 (경로, 정보)를 생성 (순서는 보장하지 않음)
+
+    메모리 한도 등으로 프로세스 풀 작업자가 죽으면 풀 전체가 깨지고
+    (BrokenProcessPool) 남은 작업이 모두 실패합니다. 그러면 깨질 때 먼저
+    제출한 workers개를 작업자 하나짜리 풀에서 하나씩 다시 추출해 작업자를
+    죽인 파일만 실패로 돌려주고, 나머지는 새 풀에서 계속 추출합니다.
+    """
+    remaining = list(pdf_paths)
+    while remaining:
+        broken = []
+        with extraction_executor(workers, use_processes) as executor:
+            futures = [(pdf_path, executor.submit(extract_pdf_info, pdf_path)) for pdf_path in remaining]
+            for pdf_path, future in futures:
+                try:
+                    yield pdf_path, future.result()
+                except BrokenExecutor:
+                    broken.append(pdf_path)
+        if not broken:
+            return
+
+        # 깨질 때 처리 중이던 파일은 먼저 제출한 것들 중에 있음
+        suspects, remaining = broken[:workers], broken[workers:]
+        for pdf_path in suspects:
+            with extraction_executor(1, use_processes) as executor:
+                try:
+                    yield pdf_path, executor.submit(extract_pdf_info, pdf_path).result()
+                except BrokenExecutor as e:
+                    logging.error(f"PDF 추출 작업자 종료 ({pdf_path}): {type(e).__name__}")
+                    yield pdf_path, {'title': '', 'title_source': None, 'dois': [],
+                                     'error': f"{type(e).__name__}: 작업 프로세스가 종료됨 (메모리 한도 초과 등)"}
+
+class PaperRenamer:
+    """추출한 정보로 PDF를 하나씩 식별해 이름을 변경하고 식별 방법별 적중 수를 셈
+
+    제목 색인은 DOI로 찾지 못한 파일이 처음 나올 때 만들고, 추출 캐시
+    항목은 새 경로로 옮깁니다.
+    """
+
+    def __init__(self, papers_info, cache=None):
+        self.papers_info = papers_info
+        self.cache = cache
+        self.index = None
+        self.processed = 0
+        self.hits = dict.fromkeys(MATCH_STRATEGIES, 0)
+
+    def rename(self, pdf_file, pdf_path, info):
+        """이름 변경 후 결과 메시지 반환"""
+        if self.index is None and match_by_doi(info, self.papers_info) is None:
+            with metrics.timer('title_index_build_seconds'):
+                self.index = TitleIndex(self.papers_info.titles)
+        start = time.perf_counter()
+        message, new_path, strategy = rename_with_info(pdf_file, pdf_path, info,
+                                                       self.papers_info, self.index)
+        metrics.observe('identify_seconds', time.perf_counter() - start, strategy=strategy or 'none')
+        if new_path and self.cache is not None:
+            self.cache.move(pdf_path, new_path)
+        if strategy:
+            self.hits[strategy] += 1
+        # 식별했지만 이름을 바꾸지 못한 경우는 failed
+        metrics.inc('renames_total', result=strategy if new_path else 'failed' if strategy else 'unmatched')
+        self.processed += 1
+        return message
+
+    def log_hit_rates(self):
+        total = self.processed
+        logging.info("식별 방법별 적중률:")
+        for strategy, count in self.hits.items():
+            rate = count / total * 100 if total else 0
+            logging.info(f"- {strategy}: {count}/{total} ({rate:.1f}%)")
+        unmatched = total - sum(self.hits.values())
+        logging.info(f"- 식별 실패: {unmatched}/{total}")
+
+def rename_pdf_files(download_dir='downloads', use_processes=True, max_workers=None):
+    """downloads의 PDF 이름을 논문 정보 형식으로 변경합니다.
+
+    PDF 파싱은 CPU 작업이므로 기본적으로 코어 수만큼의 프로세스 풀에서
+    실행하고, 결과는 (경로, 크기, 수정 시각) 기준으로 캐시해 바뀌지 않은
+    파일은 다시 파싱하지 않습니다.
+    """
     # 로깅 설정
     setup_logging()
     logging.info("파일명 변경 작업 시작")
-    
+
+    with measure_stage('rename'):
+        _rename_pdf_files(download_dir, use_processes, max_workers)
+    metrics.write('output', 'rename')
+
+    logging.info("파일명 변경 작업 완료")
+
+def _rename_pdf_files(download_dir, use_processes, max_workers):
     # 논문 정보 가져오기
     papers_info = get_papers_info()
     
-    # downloads 디렉토리 경로
-    download_dir = 'downloads'
-    
     # PDF 파일 목록 가져오기
     pdf_files = [f for f in os.listdir(download_dir) if f.endswith('.pdf')]
     logging.info(f"처리할 PDF 파일 수: {len(pdf_files)}")
-    
-    # 처리할 파일 목록 생성
-    process_args = [(f, os.path.join(download_dir, f), papers_info) for f in pdf_files]
-    
-    # 병렬 처리로 파일 이름 변경
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        results = list(tqdm(executor.map(process_pdf_file, process_args), 
-                          total=len(pdf_files),
-                          desc="파일 처리 중"))
+
+    results = []
+    pending = []
+    for pdf_file in pdf_files:
+        # 이미 수정된 파일인지 확인
+        if is_already_renamed(pdf_file, papers_info):
+            results.append(f"이미 수정된 파일 건너뛰기: {pdf_file}")
+        else:
+            pending.append((pdf_file, os.path.join(download_dir, pdf_file)))
+
+    # 캐시에 없는 파일만 추출 (중간에 멈춰도 그때까지 추출한 결과는 캐시에 남김)
+    cache = ExtractionCache(os.path.join(download_dir, '.extraction_cache.sqlite'), EXTRACTOR_VERSION)
+    try:
+        extracted = cache.get_many(pdf_path for _, pdf_path in pending)
+        to_extract = [pdf_path for _, pdf_path in pending if pdf_path not in extracted]
+        logging.info(f"캐시 재사용: {len(extracted)}개, 새로 추출: {len(to_extract)}개")
+        metrics.inc('extraction_cache_total', len(extracted), result='hit')
+        metrics.inc('extraction_cache_total', len(to_extract), result='miss')
+
+        if to_extract:
+            from tqdm import tqdm
+
+            workers = max_workers or os.cpu_count() or 1
+            for pdf_path, info in tqdm(iter_extracted(to_extract, workers, use_processes),
+                                       total=len(to_extract), desc="파일 처리 중"):
+                extracted[pdf_path] = info
+                record_extraction(info)
+                cache.put(pdf_path, info)
+            cache.flush()
+
+        # 추출 결과로 이름 변경 (제목 색인은 DOI로 찾지 못한 파일이 있을 때만 생성)
+        renamer = PaperRenamer(papers_info, cache)
+        for pdf_file, pdf_path in pending:
+            results.append(renamer.rename(pdf_file, pdf_path, extracted[pdf_path]))
+    finally:
+        cache.close()
     
     # 결과 출력 및 로깅
     for result in results:
         logging.info(result)
-    
-    logging.info("파일명 변경 작업 완료")
+    renamer.log_hit_rates()
+
+def main():
+    parser = argparse.ArgumentParser(description='다운로드한 PDF 파일명을 논문 정보 형식으로 변경')
+    parser.add_argument('--download-dir', default='downloads')
+    parser.add_argument('--workers', type=int, default=None, help='PDF 추출 작업자 수 (기본: CPU 수)')
+    parser.add_argument('--threads', action='store_true', help='PDF 추출을 프로세스 대신 스레드로')
+    args = parser.parse_args()
+
+    rename_pdf_files(args.download_dir, use_processes=not args.threads, max_workers=args.workers)
 
 if __name__ == "__main__":
-    rename_pdf_files() 
\ No newline at end of file
+    main()
@@ -0,0 +1,130 @@
+import re
+from collections.abc import Mapping
+from difflib import SequenceMatcher
+
+import numpy as np
+
+# 정규화한 제목의 바이트 3-gram 역색인으로 후보를 좁힌 뒤
+# 후보에 대해서만 difflib와 같은 유사도(ratio)를 계산
+GRAM_SIZE = 3
+SHORTLIST_SIZE = 20
+
+# 질의당 색인을 찾을 n-gram 수: 문서 빈도가 낮은(구별력이 큰) 것부터 사용
+QUERY_GRAMS = 24
+
+_NON_WORD = re.compile(r'[^\w\s]')
+_SPACES = re.compile(r'\s+')
+
+def normalize(text):
+    """제목 정규화 (소문자, 영숫자 외 문자 제거, 공백 정리)"""
+    text = _NON_WORD.sub(' ', str(text).lower())
+    return _SPACES.sub(' ', text).strip()
+
+def _pad(text):
+    return f' {text} '.encode('utf-8')
+
+def _gram_codes(data, lengths):
+    """이어 붙인 바이트열에서 제목별 3-gram 정수 코드와 소유 제목 번호 반환"""
+    data = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+    count = len(data) - GRAM_SIZE + 1
+    grams = np.zeros(max(count, 0), dtype=np.uint32)
+    for k in range(GRAM_SIZE):
+        grams = (grams << np.uint32(8)) | data[k:count + k]
+
+    # 제목 경계를 넘는 n-gram 제외
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(lengths)), lengths)[:count]
+    inside = np.arange(count) + GRAM_SIZE <= ends[owner]
+    return grams[inside], owner[inside]
+
+class TitleIndex:
+    """논문 제목 검색용 n-gram 역색인
+
+    한 번 만들어 두고 PDF마다 best_match를 호출합니다. 공유하는 n-gram
+    수(Dice 계수)로 상위 SHORTLIST_SIZE개 후보를 고른 뒤, 후보에만
+    difflib.get_close_matches와 같은 ratio 기준을 적용합니다.
+    """
+
+    def __init__(self, titles):
+        # 리스트나 문자열 배열(PapersInfo.titles)은 복사하지 않고 번호로 참조
+        if isinstance(titles, Mapping) or not hasattr(titles, '__getitem__'):
+            titles = list(titles)
+        self.titles = titles
+        encoded = [_pad(normalize(t)) for t in self.titles]
+        lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        # 정규화한 제목은 문자열 목록 대신 이어 붙인 바이트열과 경계 위치로 보관
+        self.data = b''.join(encoded)
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)])
+        del encoded
+        grams, owner = _gram_codes(self.data, lengths)
+
+        # 제목마다 같은 n-gram은 한 번만 세고, n-gram 순으로 정렬해 CSR 형태로 저장
+        keys = np.unique((owner.astype(np.uint64) << np.uint64(32)) | grams.astype(np.uint64))
+        owner = (keys >> np.uint64(32)).astype(np.int64)
+        grams = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        order = np.argsort(grams, kind='stable')
+        self.postings = owner[order]
+        self.vocab, self.starts = np.unique(grams[order], return_index=True)
+        self.ends = np.append(self.starts[1:], len(self.postings))
+        self.gram_counts = np.bincount(owner, minlength=len(self.titles))
+
+    def shortlist(self, query, size=SHORTLIST_SIZE):
+        """n-gram을 많이 공유하는 제목 번호를 최대 size개 반환"""
+        data = _pad(query)
+        grams, _ = _gram_codes(data, np.array([len(data)]))
+        grams = np.unique(grams)
+        if not len(self.vocab) or not len(grams):
+            return np.array([], dtype=np.int64)
+
+        slots = np.minimum(np.searchsorted(self.vocab, grams), len(self.vocab) - 1)
+        slots = slots[self.vocab[slots] == grams]
+        if not len(slots):
+            return np.array([], dtype=np.int64)
+        # 흔한 n-gram(' th', 'ing' 등)은 목록이 길고 구별력이 작으므로 제외
+        slots = slots[np.argsort(self.ends[slots] - self.starts[slots], kind='stable')[:QUERY_GRAMS]]
+
+        ids = np.concatenate([self.postings[s:e] for s, e in zip(self.starts[slots], self.ends[slots])])
+        shared = np.bincount(ids, minlength=len(self.titles))
+        candidates = np.flatnonzero(shared)
+        shared = shared[candidates]
+        dice = 2 * shared / (len(slots) + self.gram_counts[candidates])
+        if len(candidates) > size:
+            candidates = candidates[np.argpartition(dice, -size)[-size:]]
+        return candidates
+
+    def normalized(self, i):
+        """i번 제목의 정규화한 문자열"""
+        return self.data[self.offsets[i] + 1:self.offsets[i + 1] - 1].decode('utf-8')
+
+    def best_match(self, title, cutoff=0.5):
+        """가장 유사한 제목 (ratio가 cutoff 미만이면 None)"""
+        i = self.best_match_id(title, cutoff)
+        return None if i is None else self.titles[i]
+
+    def best_match_id(self, title, cutoff=0.5):
+        """가장 유사한 제목의 번호 (ratio가 cutoff 미만이면 None)"""
+        query = normalize(title)
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+
+        # ratio <= quick_ratio이므로 상한이 큰 후보부터 계산하고,
+        # 상한이 현재 최고 점수보다 낮아지면 중단
+        bounds = []
+        for i in self.shortlist(query).tolist():
+            matcher.set_seq1(self.normalized(i))
+            if matcher.real_quick_ratio() >= cutoff:
+                bound = matcher.quick_ratio()
+                if bound >= cutoff:
+                    bounds.append((bound, i))
+        bounds.sort(reverse=True)
+
+        best = None
+        for bound, i in bounds:
+            if best is not None and bound < best[0]:
+                break
+            matcher.set_seq1(self.normalized(i))
+            score = matcher.ratio()
+            # difflib처럼 점수가 같으면 문자열이 큰 쪽, 같은 제목이면 뒤의 것
+            if score >= cutoff and (best is None or (score, str(self.titles[i]), i) > best):
+                best = (score, str(self.titles[i]), i)
+        return best[2] if best else None
@@ -1,55 +1,168 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
 import os
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from paper_analytics import load_analytics
+from paper_metrics import measure_stage, metrics
+
+# 그래프에 표시할 상위 항목 수
+TOP_VENUES = 20
+TOP_KEYWORDS = 30
+HEATMAP_KEYWORDS = 20
+
+# matplotlib/seaborn은 import에만 1초 넘게 걸리므로 그래프를 그리는 함수 안에서 import
+
+def plot_papers_by_year(year_counts, path):
+    """연도별 논문 수 막대 그래프"""
+    import matplotlib.pyplot as plt
 
-def visualize_papers_by_year():
-    # output 디렉토리에서 최신 papers 파일 찾기
-    output_dir = 'output'
-    papers_files = [f for f in os.listdir(output_dir) if f.startswith('papers_') and f.endswith('.csv')]
-    if not papers_files:
-        raise FileNotFoundError('papers 파일을 찾을 수 없습니다.')
-    
-    latest_papers_file = max(papers_files)
-    input_file = os.path.join(output_dir, latest_papers_file)
-    
-    # CSV 파일 읽기
-    df = pd.read_csv(input_file)
-    
-    # 연도별 논문 수 계산
-    year_counts = df['year'].value_counts().sort_index()
-    
     # 시각화 설정
     plt.figure(figsize=(12, 6))
-    
+
     # 막대 그래프 생성
-    bars = plt.bar(year_counts.index, year_counts.values)
-    
+    bars = plt.bar(year_counts.index.astype(int), year_counts.values)
+
     # 막대 위에 값 표시
     for bar in bars:
         height = bar.get_height()
         plt.text(bar.get_x() + bar.get_width()/2., height,
                 f'{int(height)}',
                 ha='center', va='bottom')
-    
+
     # 그래프 스타일 설정
     plt.title('연도별 논문 수', fontsize=14, pad=20)
     plt.xlabel('연도', fontsize=12)
     plt.ylabel('논문 수', fontsize=12)
     plt.grid(True, axis='y', linestyle='--', alpha=0.7)
-    
+
     # x축 레이블 회전
     plt.xticks(rotation=45)
-    
+
     # 여백 조정
     plt.tight_layout()
-    
+
     # 그래프 저장
-    plt.savefig('output/visualization/papers_by_year.png', dpi=300, bbox_inches='tight')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close()
+    return path
+
+def plot_year_source(year_source, path):
+    """연도별/출처별 논문 수 누적 막대 그래프"""
+    import matplotlib.pyplot as plt
+
+    ax = year_source.plot(kind='bar', stacked=True, figsize=(12, 6), width=0.8)
+    ax.set_title('연도별 출처별 논문 수', fontsize=14, pad=20)
+    ax.set_xlabel('연도', fontsize=12)
+    ax.set_ylabel('논문 수', fontsize=12)
+    ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+    ax.legend(title='출처')
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close()
+    return path
+
+def plot_top_counts(counts, title, xlabel, path):
+    """상위 항목 가로 막대 그래프 (학회/저널, 키워드, 출처)"""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, max(4, len(counts) * 0.3)))
+    plt.barh(counts.index.astype(str)[::-1], counts.values[::-1])
+    plt.title(title, fontsize=14, pad=20)
+    plt.xlabel(xlabel, fontsize=12)
+    plt.grid(True, axis='x', linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
     plt.close()
-    
+    return path
+
+def plot_cooccurrence(matrix, path):
+    """상위 키워드 동시 출현 히트맵"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 10))
+    sns.heatmap(matrix, cmap='YlOrRd', square=True, linewidths=0.5,
+                cbar_kws={'label': '함께 나온 논문 수'})
+    plt.title('키워드 동시 출현', fontsize=14, pad=20)
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close()
+    return path
+
+def _render(task):
+    function, args = task
+    return function(*args)
+
+def report_tasks(analytics, visualization_dir):
+    """그릴 그래프 목록 [(함수, 인자)] (워커에는 작은 집계 결과만 전달)"""
+    def path(name):
+        return os.path.join(visualization_dir, name)
+
+    tasks = [
+        (plot_papers_by_year, (analytics.year_counts, path('papers_by_year.png'))),
+        (plot_year_source, (analytics.year_source, path('papers_by_year_source.png'))),
+        (plot_top_counts, (analytics.source_counts, '출처별 논문 수', '논문 수',
+                           path('papers_by_source.png'))),
+        (plot_top_counts, (analytics.venue_counts.head(TOP_VENUES), f'학회/저널 상위 {TOP_VENUES}',
+                           '논문 수', path('top_venues.png'))),
+        (plot_top_counts, (analytics.keyword_counts.head(TOP_KEYWORDS), f'키워드 상위 {TOP_KEYWORDS}',
+                           '논문 수', path('top_keywords.png'))),
+    ]
+    keywords = analytics.keyword_counts.index[:HEATMAP_KEYWORDS].tolist()
+    if keywords:
+        tasks.append((plot_cooccurrence, (analytics.cooccurrence.dense(keywords),
+                                          path('keyword_cooccurrence.png'))))
+    return tasks
+
+def visualize_report(output_dir='output', max_workers=None, use_cache=True):
+    """집계를 한 번 계산(또는 캐시에서 읽기)하고 모든 그래프를 워커 프로세스에서 동시에 그림"""
+    with measure_stage('report', output_dir):
+        analytics = load_analytics(output_dir, use_cache=use_cache)
+        return render_report(analytics, os.path.join(output_dir, 'visualization'), max_workers)
+
+def render_report(analytics, visualization_dir, max_workers=None, mp_context=None):
+    """집계 결과로 보고서 그래프를 그리고 경로 목록 반환"""
+    os.makedirs(visualization_dir, exist_ok=True)
+
+    tasks = report_tasks(analytics, visualization_dir)
+    if max_workers == 1:
+        paths = [_render(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            paths = list(executor.map(_render, tasks))
+
+    for path in paths:
+        logging.info(f"그래프 저장: {path}")
+    return paths
+
+def visualize_papers_by_year():
+    # output 디렉토리의 최신 papers 데이터셋 집계 (데이터셋 버전별 캐시)
+    output_dir = 'output'
+    analytics = load_analytics(output_dir)
+
+    os.makedirs('output/visualization', exist_ok=True)
+    plot_papers_by_year(analytics.year_counts, 'output/visualization/papers_by_year.png')
+
     print("시각화가 완료되었습니다. output/visualization/papers_by_year.png 파일을 확인해주세요.")
 
+def main():
+    # 로깅 설정
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='논문 데이터 시각화 보고서')
+    parser.add_argument('--output-dir', default='output')
+    parser.add_argument('--workers', type=int, default=None, help='그래프를 그릴 프로세스 수')
+    parser.add_argument('--no-cache', action='store_true', help='집계 캐시를 무시하고 다시 계산')
+    args = parser.parse_args()
+
+    paths = visualize_report(args.output_dir, args.workers, use_cache=not args.no_cache)
+    metrics.write(args.output_dir, 'report')
+    print(f"시각화가 완료되었습니다. {os.path.join(args.output_dir, 'visualization')}에서 "
+          f"그래프 {len(paths)}개를 확인해주세요.")
+
 if __name__ == "__main__":
-    visualize_papers_by_year() 
\ No newline at end of file
+    main()